@@ -0,0 +1,146 @@
+"""Baseline schema
+
+Revision ID: 2b7f0c4e91a3
+Revises: 
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.notify import NOTIFY_FUNCTION_NAME, NOTIFY_FUNCTION_SQL, get_trigger_sql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2b7f0c4e91a3"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["user", "token", "userdata", "algorithm", "lobby", "team", "lobbyparticipant"]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("role", sa.Enum("USER", "MODERATOR", "ADMIN", name="userrole"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("username"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_index(op.f("ix_user_id"), "user", ["id"], unique=False)
+
+    op.create_table(
+        "token",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(), nullable=False),
+        sa.Column("token_type", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_token_id"), "token", ["id"], unique=False)
+
+    op.create_table(
+        "userdata",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("first_name", sa.String(length=24), nullable=True),
+        sa.Column("last_name", sa.String(length=64), nullable=True),
+        sa.Column("external_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+        sa.UniqueConstraint("external_id"),
+    )
+    op.create_index(op.f("ix_userdata_id"), "userdata", ["id"], unique=False)
+
+    op.create_table(
+        "algorithm",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("algorithm", sa.String(), nullable=False),
+        sa.Column("teams_count", sa.Integer(), nullable=False),
+        sa.Column("creator_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["creator_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(op.f("ix_algorithm_id"), "algorithm", ["id"], unique=False)
+
+    op.create_table(
+        "lobby",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("host_id", sa.Integer(), nullable=False),
+        sa.Column("algorithm_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Enum("ACTIVE", "ARCHIVED", name="lobbystatus"), nullable=False),
+        sa.ForeignKeyConstraint(["algorithm_id"], ["algorithm.id"]),
+        sa.ForeignKeyConstraint(["host_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_lobby_id"), "lobby", ["id"], unique=False)
+
+    op.create_table(
+        "team",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["lobby_id"], ["lobby.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_team_id"), "team", ["id"], unique=False)
+
+    op.create_table(
+        "lobbyparticipant",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column("role", sa.Enum("PLAYER", "SPECTATOR", name="lobbyparticipantrole"), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["lobby_id"], ["lobby.id"]),
+        sa.ForeignKeyConstraint(["team_id"], ["team.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_lobbyparticipant_id"), "lobbyparticipant", ["id"], unique=False)
+
+    op.execute(NOTIFY_FUNCTION_SQL)
+    for table in TABLES:
+        for statement in get_trigger_sql(table):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_lobbyparticipant_id"), table_name="lobbyparticipant")
+    op.drop_table("lobbyparticipant")
+    op.drop_index(op.f("ix_team_id"), table_name="team")
+    op.drop_table("team")
+    op.drop_index(op.f("ix_lobby_id"), table_name="lobby")
+    op.drop_table("lobby")
+    op.drop_index(op.f("ix_algorithm_id"), table_name="algorithm")
+    op.drop_table("algorithm")
+    op.drop_index(op.f("ix_userdata_id"), table_name="userdata")
+    op.drop_table("userdata")
+    op.drop_index(op.f("ix_token_id"), table_name="token")
+    op.drop_table("token")
+    op.drop_index(op.f("ix_user_id"), table_name="user")
+    op.drop_table("user")
+
+    op.execute(f"DROP FUNCTION IF EXISTS {NOTIFY_FUNCTION_NAME}()")
+    sa.Enum(name="lobbyparticipantrole").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="lobbystatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="userrole").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""Add foreign key and lookup indexes
+
+Revision ID: 5c1e9a7d3b20
+Revises: 8d41e6a2c5f7
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e9a7d3b20"
+down_revision: Union[str, None] = "8d41e6a2c5f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("token", "user_id"),
+    ("user", "role"),
+    ("algorithm", "creator_id"),
+    ("algorithm", "teams_count"),
+    ("lobby", "host_id"),
+    ("lobby", "algorithm_id"),
+    ("team", "lobby_id"),
+    ("lobbyparticipant", "user_id"),
+    ("lobbyparticipant", "lobby_id"),
+    ("lobbyparticipant", "team_id"),
+    ("lobbyparticipant", "role"),
+]
+
+
+def upgrade() -> None:
+    for table, column in INDEXES:
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+
+    op.create_index(
+        "ix_lobby_status_active",
+        "lobby",
+        ["status"],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lobby_status_active", table_name="lobby")
+
+    for table, column in reversed(INDEXES):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
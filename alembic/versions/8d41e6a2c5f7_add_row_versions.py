@@ -0,0 +1,31 @@
+"""Add row version columns for ETags
+
+Revision ID: 8d41e6a2c5f7
+Revises: 2b7f0c4e91a3
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41e6a2c5f7"
+down_revision: Union[str, None] = "2b7f0c4e91a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["user", "algorithm", "lobby", "team"]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_column(table, "version")
@@ -0,0 +1,43 @@
+"""Make lobby participants unique per lobby and user
+
+Revision ID: 9a4d2f6b8c13
+Revises: 5c1e9a7d3b20
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4d2f6b8c13"
+down_revision: Union[str, None] = "5c1e9a7d3b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+REMOVE_DUPLICATES_SQL = """
+DELETE FROM lobbyparticipant
+WHERE id IN (
+    SELECT id FROM (
+        SELECT
+            id,
+            row_number() OVER (PARTITION BY lobby_id, user_id ORDER BY is_active DESC, id) AS position
+        FROM lobbyparticipant
+    ) AS ranked
+    WHERE position > 1
+)
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(REMOVE_DUPLICATES_SQL))
+    op.create_unique_constraint("uq_lobbyparticipant_lobby_id_user_id", "lobbyparticipant", ["lobby_id", "user_id"])
+    op.drop_index(op.f("ix_lobbyparticipant_lobby_id"), table_name="lobbyparticipant")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_lobbyparticipant_lobby_id"), "lobbyparticipant", ["lobby_id"], unique=False)
+    op.drop_constraint("uq_lobbyparticipant_lobby_id_user_id", "lobbyparticipant", type_="unique")
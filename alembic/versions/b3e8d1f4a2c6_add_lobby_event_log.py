@@ -0,0 +1,52 @@
+"""Add append-only lobby event log and snapshots
+
+Revision ID: b3e8d1f4a2c6
+Revises: 9a4d2f6b8c13
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8d1f4a2c6"
+down_revision: Union[str, None] = "9a4d2f6b8c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lobbyeventlog",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=True),
+        sa.Column("type", sa.String(length=32), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_lobbyeventlog_lobby_id_created_at", "lobbyeventlog", ["lobby_id", "created_at"], unique=False)
+    op.execute("CREATE TABLE lobbyeventlog_default PARTITION OF lobbyeventlog DEFAULT")
+
+    op.create_table(
+        "lobbyeventsnapshot",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("data", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_lobbyeventsnapshot_lobby_id_created_at", "lobbyeventsnapshot", ["lobby_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lobbyeventsnapshot_lobby_id_created_at", table_name="lobbyeventsnapshot")
+    op.drop_table("lobbyeventsnapshot")
+    op.drop_index("ix_lobbyeventlog_lobby_id_created_at", table_name="lobbyeventlog")
+    op.drop_table("lobbyeventlog")
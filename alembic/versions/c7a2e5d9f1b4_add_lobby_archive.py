@@ -0,0 +1,93 @@
+"""Add lobby archive tables and lobby closing time
+
+Revision ID: c7a2e5d9f1b4
+Revises: b3e8d1f4a2c6
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a2e5d9f1b4"
+down_revision: Union[str, None] = "b3e8d1f4a2c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    lobby_status = postgresql.ENUM("ACTIVE", "ARCHIVED", name="lobbystatus", create_type=False)
+    participant_role = postgresql.ENUM("PLAYER", "SPECTATOR", name="lobbyparticipantrole", create_type=False)
+
+    op.add_column("lobby", sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE lobby SET closed_at = now() WHERE status = 'ARCHIVED'")
+    op.create_index(
+        "ix_lobby_closed_at_archived", "lobby", ["closed_at"], unique=False,
+        postgresql_where=sa.text("status = 'ARCHIVED'"),
+    )
+
+    op.create_table(
+        "lobbyarchive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("host_id", sa.Integer(), nullable=False),
+        sa.Column("algorithm_id", sa.Integer(), nullable=False),
+        sa.Column("status", lobby_status, nullable=False),
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["algorithm_id"], ["algorithm.id"]),
+        sa.ForeignKeyConstraint(["host_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_lobbyarchive_algorithm_id"), "lobbyarchive", ["algorithm_id"], unique=False)
+    op.create_index(op.f("ix_lobbyarchive_host_id"), "lobbyarchive", ["host_id"], unique=False)
+
+    op.create_table(
+        "teamarchive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.ForeignKeyConstraint(["lobby_id"], ["lobbyarchive.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_teamarchive_lobby_id"), "teamarchive", ["lobby_id"], unique=False)
+
+    op.create_table(
+        "lobbyparticipantarchive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("lobby_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column("role", participant_role, nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["lobby_id"], ["lobbyarchive.id"]),
+        sa.ForeignKeyConstraint(["team_id"], ["teamarchive.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_lobbyparticipantarchive_lobby_id"), "lobbyparticipantarchive", ["lobby_id"], unique=False)
+    op.create_index(op.f("ix_lobbyparticipantarchive_role"), "lobbyparticipantarchive", ["role"], unique=False)
+    op.create_index(op.f("ix_lobbyparticipantarchive_team_id"), "lobbyparticipantarchive", ["team_id"], unique=False)
+    op.create_index(op.f("ix_lobbyparticipantarchive_user_id"), "lobbyparticipantarchive", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_lobbyparticipantarchive_user_id"), table_name="lobbyparticipantarchive")
+    op.drop_index(op.f("ix_lobbyparticipantarchive_team_id"), table_name="lobbyparticipantarchive")
+    op.drop_index(op.f("ix_lobbyparticipantarchive_role"), table_name="lobbyparticipantarchive")
+    op.drop_index(op.f("ix_lobbyparticipantarchive_lobby_id"), table_name="lobbyparticipantarchive")
+    op.drop_table("lobbyparticipantarchive")
+    op.drop_index(op.f("ix_teamarchive_lobby_id"), table_name="teamarchive")
+    op.drop_table("teamarchive")
+    op.drop_index(op.f("ix_lobbyarchive_host_id"), table_name="lobbyarchive")
+    op.drop_index(op.f("ix_lobbyarchive_algorithm_id"), table_name="lobbyarchive")
+    op.drop_table("lobbyarchive")
+    op.drop_index("ix_lobby_closed_at_archived", table_name="lobby", postgresql_where=sa.text("status = 'ARCHIVED'"))
+    op.drop_column("lobby", "closed_at")
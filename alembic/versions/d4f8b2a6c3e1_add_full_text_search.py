@@ -0,0 +1,37 @@
+"""Add full-text search vectors to lobby and algorithm
+
+Revision ID: d4f8b2a6c3e1
+Revises: c7a2e5d9f1b4
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f8b2a6c3e1"
+down_revision: Union[str, None] = "c7a2e5d9f1b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_DOCUMENT = "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+
+def upgrade() -> None:
+    for table in ("lobby", "lobbyarchive", "algorithm"):
+        op.add_column(
+            table,
+            sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_DOCUMENT, persisted=True), nullable=True),
+        )
+        op.create_index(f"ix_{table}_search_vector", table, ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for table in ("algorithm", "lobbyarchive", "lobby"):
+        op.drop_index(f"ix_{table}_search_vector", table_name=table, postgresql_using="gin")
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,26 @@
+"""Add username prefix index for suggestions
+
+Revision ID: e9c3a7b5d2f8
+Revises: d4f8b2a6c3e1
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e9c3a7b5d2f8"
+down_revision: Union[str, None] = "d4f8b2a6c3e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_username_prefix", "user", [sa.text("lower(username) text_pattern_ops")], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_username_prefix", table_name="user")
@@ -0,0 +1,28 @@
+"""Rebuild username prefix index with C collation for ordered suggestions
+
+Revision ID: f2a8c4d6e1b3
+Revises: e9c3a7b5d2f8
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a8c4d6e1b3"
+down_revision: Union[str, None] = "e9c3a7b5d2f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_user_username_prefix", table_name="user")
+    op.create_index("ix_user_username_prefix", "user", [sa.text('lower(username::text COLLATE "C")')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_username_prefix", table_name="user")
+    op.create_index("ix_user_username_prefix", "user", [sa.text("lower(username) text_pattern_ops")], unique=False)
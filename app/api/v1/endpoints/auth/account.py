@@ -12,8 +12,10 @@ from app.modules.auth.user.exceptions import (
     HTTPUserInternalError
 )
 
+from app.core.responses import TrustedRoute
 
-router = APIRouter()
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.get("/", response_model=UserRead)
 async def get_current_user_(
@@ -29,17 +31,13 @@ async def update_current_user_(
     user_service: UserService = Depends(UserService)
 ): 
     current_user = await current_user_service.get()
-    if user_update.email: 
-        user_by_email = await user_service.get_by_email(user_update.email)
-        
-        if user_by_email and user_by_email.id != current_user.id:
-            raise HTTPUserExceptionEmailAlreadyExists()
+    username_exists, email_exists = await user_service.is_exist(user_update, current_user.id)
+
+    if email_exists:
+        raise HTTPUserExceptionEmailAlreadyExists()
     
-    if user_update.username:
-        user_by_username = await user_service.get_by_username(user_update.username) 
-        
-        if user_by_username and user_by_username.id != current_user.id:
-            raise HTTPUserExceptionUsernameAlreadyExists()
+    if username_exists:
+        raise HTTPUserExceptionUsernameAlreadyExists()
 
     access_token, refresh_token = await user_service.update_with_tokens(current_user, user_update)
     return TokenResponse(access_token=access_token.token, refresh_token=refresh_token.token, token_type="bearer")
@@ -22,8 +22,10 @@ from app.modules.auth.user.exceptions import (
     HTTPUserExceptionAlreadyLoggedIn,
 )
 
+from app.core.responses import TrustedRoute
 
-router = APIRouter()
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def register_user_(
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.modules.auth.user.access import AccessControl, RoleChecker
 from app.modules.auth.user.enums import UserRole
@@ -23,10 +23,17 @@ from app.modules.lobby.lobby.exceptions import (
     HTTPLobbyAlgorithmUpdateDataNotProvided,
 )
 
+from app.shared.components.etag import ETag
+from app.shared.components.fields import FieldSet
+from app.shared.components.idempotency import Idempotency
 
-router = APIRouter()
+from app.core.responses import TrustedRoute
+
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.post("/", response_model=AlgorithmRead)
+@Idempotency.endpoint("algorithm.create")
 async def create_algorithm_(
     algorithm_data: AlgorithmCreate,
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
@@ -45,6 +52,7 @@ async def get_count_of_algorithms_(
     name: Optional[str] = Query(default=None),
     algorithm: Optional[str] = Query(default=None),
     teams_count: Optional[int] = Query(default=None),
+    search: Optional[str] = Query(default=None, min_length=1, max_length=256),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     algorithm_service: AlgorithmService = Depends(AlgorithmService)
 ):
@@ -53,7 +61,8 @@ async def get_count_of_algorithms_(
         "id": id,
         "name": name,
         "algorithm": algorithm,
-        "teams_count": teams_count
+        "teams_count": teams_count,
+        "search": search
     }
     
     count = await algorithm_service.get_list(filters, only_count=True)
@@ -62,14 +71,18 @@ async def get_count_of_algorithms_(
 
 @router.get("/list", response_model=list[AlgorithmRead])
 async def get_algorithms_list_(
+    request: Request,
+    response: Response,
     id: Optional[int] = Query(default=None),
     name: Optional[str] = Query(default=None),
     algorithm: Optional[str] = Query(default=None),
     teams_count: Optional[int] = Query(default=None),
+    search: Optional[str] = Query(default=None, min_length=1, max_length=256),
     sort_by: Optional[str] = Query(default="id"),
     sort_order: Optional[str] = Query(default="asc"),
     limit: Optional[int] = Query(default=10, ge=1, le=100),
     offset: Optional[int] = Query(default=0, ge=0),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(AlgorithmRead)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     algorithm_service: AlgorithmService = Depends(AlgorithmService)
 ):
@@ -78,24 +91,47 @@ async def get_algorithms_list_(
         "id": id,
         "name": name,
         "algorithm": algorithm,
-        "teams_count": teams_count
+        "teams_count": teams_count,
+        "search": search
     }
 
-    algorithms = await algorithm_service.get_list(filters, sort_by, sort_order, limit, offset)
+    etag = await algorithm_service.get_list_etag(filters, sort_by, sort_order, limit, offset, fields)
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+
+    algorithms = await algorithm_service.get_list(filters, sort_by, sort_order, limit, offset, fields=fields)
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(algorithms, response)
+
     return algorithms
 
 
 @router.get("/{algorithm_id}", response_model=AlgorithmRead)
 async def get_algorithm_(
     algorithm_id: int, 
+    request: Request,
+    response: Response,
+    fields: Optional[FieldSet] = Depends(FieldSet.query(AlgorithmRead)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     algorithm_service: AlgorithmService = Depends(AlgorithmService)
 ):
     
-    algorithm = await algorithm_service.get_by_id(algorithm_id)
+    etag = await algorithm_service.get_etag(algorithm_id, fields)
+    if not etag:
+        raise HTTPLobbyAlgorithmNotFound()
+    
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+    
+    algorithm = await algorithm_service.get_by_id(algorithm_id, fields)
     if not algorithm:
         raise HTTPLobbyAlgorithmNotFound()
     
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(algorithm, response)
+
     return algorithm
 
 
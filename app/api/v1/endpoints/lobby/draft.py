@@ -0,0 +1,54 @@
+from fastapi import APIRouter, BackgroundTasks, Depends
+
+from app.modules.auth.user.access import RoleChecker
+from app.modules.auth.user.services.current import CurrentUserService
+
+from app.modules.lobby.draft.schemas import DraftActionCreate, DraftRead
+from app.modules.lobby.draft.services.draft import DraftService
+from app.modules.lobby.lobby.access import LobbyHostChecker
+from app.modules.lobby.lobby.schemas import LobbyAccess
+
+from app.core.responses import TrustedRoute
+
+
+router = APIRouter(route_class=TrustedRoute)
+
+
+@router.post("/{lobby_id}/draft", response_model=DraftRead)
+async def start_draft_(
+    lobby_id: int,
+    background_tasks: BackgroundTasks,
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
+    draft_service: DraftService = Depends(DraftService)
+):
+
+    state = await draft_service.start(lobby.id)
+    background_tasks.add_task(draft_service.publish_started, lobby.id, state)
+    return state["draft"]
+
+
+@router.get("/{lobby_id}/draft", response_model=DraftRead)
+async def get_draft_(
+    lobby_id: int,
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    draft_service: DraftService = Depends(DraftService)
+):
+
+    state = await draft_service.get(lobby_id)
+    return state["draft"]
+
+
+@router.post("/{lobby_id}/draft/actions", response_model=DraftRead)
+async def make_draft_action_(
+    lobby_id: int,
+    action_data: DraftActionCreate,
+    background_tasks: BackgroundTasks,
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    draft_service: DraftService = Depends(DraftService)
+):
+
+    current_user = await current_user_service.get()
+    state = await draft_service.act(lobby_id, current_user.id, action_data.choice)
+
+    background_tasks.add_task(draft_service.publish_result, lobby_id, state)
+    return state["draft"]
@@ -1,27 +1,38 @@
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from app.modules.auth.user.access import AccessControl, RoleChecker
-from app.modules.auth.user.enums import UserRole
+from app.modules.auth.user.access import RoleChecker
 from app.modules.auth.user.exceptions import HTTPUserExceptionNotFound
 from app.modules.auth.user.services.current import CurrentUserService
 from app.modules.auth.user.services.user import UserService
 
 from app.modules.lobby.algorithm.services.algorithm import AlgorithmService
+from app.modules.lobby.archive.services.archive import LobbyArchiveService, LobbyParticipantArchiveService
+from app.modules.lobby.events.schemas import LobbySnapshot
+from app.modules.lobby.events.services.history import LobbyHistoryService
+from app.modules.lobby.lobby.access import LobbyHostChecker
 from app.modules.lobby.lobby.enums import LobbyStatus, LobbyParticipantRole
 from app.modules.lobby.lobby.services.lobby import LobbyService
 from app.modules.lobby.participant.services.participant import LobbyParticipantService
 from app.modules.lobby.team.services.team import TeamService
 
+from app.shared.components.etag import ETag
+from app.shared.components.fields import FieldSet
+from app.shared.components.idempotency import Idempotency
+
 from app.modules.lobby.lobby.schemas import (
+    LobbyAccess,
     LobbyCreate, 
     LobbyRead, 
     LobbyUpdate, 
     LobbyResponse,
     LobbyParticipantUpdate,
+    LobbyParticipantBulkUpdate,
     LobbiesListCountResponse,
     LobbyParticipantsCountResponse,
+    LobbyStateRead,
 )
 from app.modules.lobby.participant.schemas import (
     LobbyParticipantRead,
@@ -31,7 +42,6 @@ from app.modules.lobby.participant.schemas import (
 from app.modules.lobby.lobby.exceptions import (
     HTTPLobbyAlgorithmNotFound,
     HTTPLobbyNotFound,
-    HTTPLobbyAccessDenied,
     HTTPLobbyInternalError,
     HTTPLobbyUserAlreadyIn,
     HTTPLobbyParticipantNotFound,
@@ -40,10 +50,13 @@ from app.modules.lobby.lobby.exceptions import (
     HTTPTeamNotFound,
 )
 
+from app.core.responses import FastJSONResponse, TrustedRoute
+
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedRoute)
 
 @router.post("/", response_model=LobbyRead)
+@Idempotency.endpoint("lobby.create")
 async def create_lobby_(
     lobby: LobbyCreate,
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
@@ -65,84 +78,128 @@ async def get_lobbies_count_(
     host_id: Optional[int] = Query(default=None),
     algorithm_id: Optional[int] = Query(default=None),
     status: Optional[LobbyStatus] = Query(default=None),
+    search: Optional[str] = Query(default=None, min_length=1, max_length=256),
     only_active: Optional[bool] = Query(default=True),
+    archived: Optional[bool] = Query(default=False),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    lobby_service: LobbyService = Depends(LobbyService)
+    lobby_service: LobbyService = Depends(LobbyService),
+    archive_service: LobbyArchiveService = Depends(LobbyArchiveService)
 ):
     
+    service = archive_service if archived else lobby_service
     filters = {
         "id": id,
         "name": name,
         "host_id": host_id,
         "algorithm_id": algorithm_id,
         "status": status,
-        "only_active": only_active
+        "only_active": only_active,
+        "search": search
     }
     
-    count = await lobby_service.get_list(filters, only_count=True)
+    count = await service.get_list(filters, only_count=True)
     return LobbiesListCountResponse(total_count=count)
 
 
 @router.get("/list", response_model=list[LobbyRead])
 async def get_lobbies_list_(
+    request: Request,
+    response: Response,
     id: Optional[int] = Query(default=None),
     name: Optional[str] = Query(default=None),
     host_id: Optional[int] = Query(default=None),
     algorithm_id: Optional[int] = Query(default=None),
     status: Optional[LobbyStatus] = Query(default=None),
+    search: Optional[str] = Query(default=None, min_length=1, max_length=256),
     sort_by: Optional[str] = Query(default="id"),
     sort_order: Optional[str] = Query(default="asc"),
     limit: Optional[int] = Query(default=10, ge=1, le=100),
     offset: Optional[int] = Query(default=0, ge=0),
     only_active: Optional[bool] = Query(default=True),
+    archived: Optional[bool] = Query(default=False),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(LobbyRead)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    lobby_service: LobbyService = Depends(LobbyService)
+    lobby_service: LobbyService = Depends(LobbyService),
+    archive_service: LobbyArchiveService = Depends(LobbyArchiveService)
 ):
     
+    service = archive_service if archived else lobby_service
     filters = {
         "id": id,
         "name": name,
         "host_id": host_id,
         "algorithm_id": algorithm_id,
         "status": status,
-        "only_active": only_active
+        "only_active": only_active,
+        "search": search
     }
 
-    lobbies = await lobby_service.get_list(filters, sort_by, sort_order, limit, offset)
+    etag = await service.get_list_etag(filters, sort_by, sort_order, limit, offset, fields)
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+
+    lobbies = await service.get_list(filters, sort_by, sort_order, limit, offset, fields=fields)
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(lobbies, response)
+
     return lobbies
 
 
 @router.get("/{lobby_id}", response_model=LobbyRead)
 async def get_lobby_info_(
     lobby_id: int,
+    request: Request,
+    response: Response,
+    archived: Optional[bool] = Query(default=False),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(LobbyRead)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    lobby_service: LobbyService = Depends(LobbyService)
+    lobby_service: LobbyService = Depends(LobbyService),
+    archive_service: LobbyArchiveService = Depends(LobbyArchiveService)
 ):
     
-    lobby = await lobby_service.get_by_id(lobby_id)
+    service = archive_service if archived else lobby_service
+    etag = await service.get_etag(lobby_id, fields)
+    if not etag:
+        raise HTTPLobbyNotFound()
+    
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+    
+    lobby = await service.get_by_id(lobby_id, fields)
     if not lobby:
         raise HTTPLobbyNotFound()
     
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(lobby, response)
+
     return lobby
 
 
+@router.get("/{lobby_id}/state", response_model=LobbyStateRead)
+async def get_lobby_state_(
+    lobby_id: int,
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby_service: LobbyService = Depends(LobbyService)
+):
+
+    state = await lobby_service.get_state(lobby_id)
+    if not state:
+        raise HTTPLobbyNotFound()
+
+    return state
+
+
 @router.put("/{lobby_id}", response_model=LobbyRead)
 async def update_lobby_(
     lobby_id: int,
     lobby_data: LobbyUpdate,
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     lobby_service: LobbyService = Depends(LobbyService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-    
-    updated_lobby = await lobby_service.update(lobby, lobby_data)
+    updated_lobby = await lobby_service.update_by_id(lobby.id, lobby_data)
     if not updated_lobby:
         raise HTTPLobbyUpdateDataNotProvided()
 
@@ -152,19 +209,11 @@ async def update_lobby_(
 @router.put("/{lobby_id}/close", response_model=LobbyRead)
 async def close_lobby_(
     lobby_id: int,
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     lobby_service: LobbyService = Depends(LobbyService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-
-    closed_lobby = await lobby_service.close(lobby)
+    closed_lobby = await lobby_service.close(lobby.id)
     if not closed_lobby:
         raise HTTPLobbyUpdateDataNotProvided()
 
@@ -174,25 +223,32 @@ async def close_lobby_(
 @router.delete("/{lobby_id}", response_model=LobbyResponse)
 async def delete_lobby_(
     lobby_id: int,
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     lobby_service: LobbyService = Depends(LobbyService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-    
-    result = await lobby_service.delete(lobby)
+    result = await lobby_service.delete_by_id(lobby.id)
     if not result: 
         raise HTTPLobbyInternalError("Delete lobby error")
     
     return LobbyResponse(id=lobby_id, description=f"Lobby '{lobby.name}' successfully removed")
 
 
+@router.get("/{lobby_id}/history", response_model=LobbySnapshot)
+async def get_lobby_history_(
+    lobby_id: int,
+    at: Optional[datetime] = Query(default=None),
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    history_service: LobbyHistoryService = Depends(LobbyHistoryService)
+):
+
+    snapshot = await history_service.replay(lobby_id, at or datetime.now(timezone.utc))
+    if not snapshot:
+        raise HTTPLobbyNotFound()
+
+    return FastJSONResponse(snapshot)
+
+
 @router.get("/{lobby_id}/participants-count", response_model=LobbyParticipantsCountResponse)
 async def get_lobby_participants_count_(
     lobby_id: int,
@@ -202,12 +258,18 @@ async def get_lobby_participants_count_(
     role: Optional[LobbyParticipantRole] = Query(default=None),
     is_active: Optional[bool] = Query(default=True),
     all_db_participants: Optional[bool] = Query(default=False),
+    archived: Optional[bool] = Query(default=False),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     lobby_service: LobbyService = Depends(LobbyService),
-    participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
+    participant_service: LobbyParticipantService = Depends(LobbyParticipantService),
+    lobby_archive_service: LobbyArchiveService = Depends(LobbyArchiveService),
+    participant_archive_service: LobbyParticipantArchiveService = Depends(LobbyParticipantArchiveService)
 ):
     
-    lobby = await lobby_service.get_by_id(lobby_id)
+    lobby_reader = lobby_archive_service if archived else lobby_service
+    participant_reader = participant_archive_service if archived else participant_service
+
+    lobby = await lobby_reader.get_by_id(lobby_id)
     if not lobby:
         raise HTTPLobbyNotFound()
     
@@ -221,7 +283,7 @@ async def get_lobby_participants_count_(
         "all_db_participants": all_db_participants
     }
     
-    participants_count = await participant_service.get_list(filters, only_count=True)
+    participants_count = await participant_reader.get_list(filters, only_count=True)
     return LobbyParticipantsCountResponse(total_count=participants_count)
 
 
@@ -238,12 +300,19 @@ async def get_lobby_participants_(
     sort_order: Optional[str] = Query(default="asc"),
     limit: Optional[int] = Query(default=10, ge=1, le=100),
     offset: Optional[int] = Query(default=0, ge=0),
+    archived: Optional[bool] = Query(default=False),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(LobbyParticipantRead)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     lobby_service: LobbyService = Depends(LobbyService),
-    participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
+    participant_service: LobbyParticipantService = Depends(LobbyParticipantService),
+    lobby_archive_service: LobbyArchiveService = Depends(LobbyArchiveService),
+    participant_archive_service: LobbyParticipantArchiveService = Depends(LobbyParticipantArchiveService)
 ):
     
-    lobby = await lobby_service.get_by_id(lobby_id)
+    lobby_reader = lobby_archive_service if archived else lobby_service
+    participant_reader = participant_archive_service if archived else participant_service
+
+    lobby = await lobby_reader.get_by_id(lobby_id)
     if not lobby:
         raise HTTPLobbyNotFound()
     
@@ -257,31 +326,25 @@ async def get_lobby_participants_(
         "all_db_participants": all_db_participants
     }
     
-    participants = await participant_service.get_list(filters, sort_by, sort_order, limit, offset)
+    participants = await participant_reader.get_list(filters, sort_by, sort_order, limit, offset, fields=fields)
+    if fields:
+        return fields.response(participants)
+
     return participants
 
 
 @router.post("/{lobby_id}/participants", response_model=LobbyParticipantWithLobbyRead)
+@Idempotency.endpoint("lobby.participant.add")
 async def add_participant_(
     lobby_id: int,
     user_id: int,
     team_id: Optional[int] = Query(default=None),
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     user_service: UserService = Depends(UserService),
-    lobby_service: LobbyService = Depends(LobbyService),
     participant_service: LobbyParticipantService = Depends(LobbyParticipantService),
     team_service: TeamService = Depends(TeamService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-
     user = await user_service.get_by_id(user_id)
     if not user:
         raise HTTPUserExceptionNotFound()
@@ -291,15 +354,30 @@ async def add_participant_(
         if not team:
             raise HTTPTeamNotFound()
     
-    if not await participant_service.is_in_lobby(lobby_id, user_id):
-        return await participant_service.add(lobby_id, user_id, team_id)
-
-    participant = await participant_service.get_by_user_id(lobby_id, user_id)
-    if participant and participant.is_active:
+    participant = await participant_service.join(lobby.id, user_id, team_id)
+    if not participant:
         raise HTTPLobbyUserAlreadyIn()
     
-    updated_data = LobbyParticipantUpdate(is_active=True)
-    return await participant_service.update(participant, updated_data)
+    return participant
+
+
+@router.put("/{lobby_id}/participants", response_model=list[LobbyParticipantRead])
+async def edit_participants_(
+    lobby_id: int,
+    update_data: LobbyParticipantBulkUpdate,
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
+    participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
+):
+
+    team_ids = {change.team_id for change in update_data.participants if change.team_id is not None}
+    if not await participant_service.has_teams(lobby.id, team_ids):
+        raise HTTPTeamNotFound()
+
+    participants = await participant_service.update_many(lobby.id, update_data.participants)
+    if participants is None:
+        raise HTTPLobbyParticipantNotFound()
+
+    return participants
 
 
 @router.put("/{lobby_id}/participants/{participant_id}", response_model=LobbyParticipantWithLobbyRead)
@@ -307,21 +385,11 @@ async def edit_participant_(
     lobby_id: int,
     participant_id: int,
     update_data: LobbyParticipantUpdate,
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    lobby_service: LobbyService = Depends(LobbyService),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-    
-    participant = await participant_service.get_by_id(lobby_id, participant_id)
+    participant = await participant_service.get_by_id(lobby.id, participant_id)
     if not participant:
         raise HTTPLobbyParticipantNotFound()
     
@@ -346,19 +414,11 @@ async def connect_to_lobby_(
     if not lobby:
         raise HTTPLobbyNotFound()        
     
-    if not await participant_service.is_in_lobby(lobby_id, current_user.id):
-        return await participant_service.add(lobby_id, current_user.id)
-
-    participant = await participant_service.get_by_user_id(lobby_id, current_user.id)
-    if participant and participant.is_active:
+    participant = await participant_service.join(lobby_id, current_user.id)
+    if not participant:
         raise HTTPLobbyUserAlreadyIn()
     
-    updated_data = LobbyParticipantUpdate(is_active=True)
-    updated_participant = await participant_service.update(participant, updated_data)
-    if not updated_participant:
-        raise HTTPLobbyParticipantUpdateDataNotProvided()
-    
-    return updated_participant
+    return participant
 
 
 @router.delete("/{lobby_id}/leave", response_model=LobbyParticipantWithLobbyRead)
@@ -390,21 +450,11 @@ async def leave_lobby_(
 async def kick_from_lobby_(
     lobby_id: int,
     participant_id: int,
-    current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    lobby_service: LobbyService = Depends(LobbyService),
+    lobby: LobbyAccess = Depends(LobbyHostChecker),
     participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
 ):
     
-    current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(lobby_id)
-
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyAccessDenied)
-    
-    participant = await participant_service.get_by_id(lobby_id, participant_id)
+    participant = await participant_service.get_by_id(lobby.id, participant_id)
     if not (participant and participant.is_active):
         raise HTTPLobbyParticipantNotFound()
     
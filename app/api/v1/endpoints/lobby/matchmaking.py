@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends
+
+from app.modules.auth.user.access import RoleChecker
+from app.modules.auth.user.services.current import CurrentUserService
+
+from app.modules.lobby.algorithm.services.algorithm import AlgorithmService
+from app.modules.lobby.lobby.exceptions import HTTPLobbyAlgorithmNotFound
+from app.modules.lobby.matchmaking.schemas import MatchmakingCreate, MatchmakingRead, MatchmakingResponse
+from app.modules.lobby.matchmaking.services.matchmaking import MatchmakingService
+
+from app.core.responses import TrustedRoute
+
+
+router = APIRouter(route_class=TrustedRoute)
+
+
+@router.post("/", response_model=MatchmakingRead)
+async def enqueue_(
+    matchmaking_data: MatchmakingCreate,
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    algorithm_service: AlgorithmService = Depends(AlgorithmService),
+    matchmaking_service: MatchmakingService = Depends(MatchmakingService)
+):
+
+    algorithm = await algorithm_service.get_by_id(matchmaking_data.algorithm_id)
+    if not algorithm:
+        raise HTTPLobbyAlgorithmNotFound()
+
+    current_user = await current_user_service.get()
+    return await matchmaking_service.enqueue(current_user.id, algorithm.id)
+
+
+@router.get("/", response_model=MatchmakingRead)
+async def get_matchmaking_status_(
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    matchmaking_service: MatchmakingService = Depends(MatchmakingService)
+):
+
+    current_user = await current_user_service.get()
+    return await matchmaking_service.get(current_user.id)
+
+
+@router.delete("/", response_model=MatchmakingResponse)
+async def leave_matchmaking_(
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    matchmaking_service: MatchmakingService = Depends(MatchmakingService)
+):
+
+    current_user = await current_user_service.get()
+    return await matchmaking_service.leave(current_user.id)
@@ -1,16 +1,21 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.modules.auth.user.access import AccessControl, RoleChecker
 from app.modules.auth.user.enums import UserRole
 from app.modules.auth.user.services.current import CurrentUserService
 
+from app.modules.lobby.lobby.access import LobbyAccessControl
 from app.modules.lobby.lobby.schemas import LobbyResponse
+from app.modules.lobby.archive.services.archive import LobbyArchiveService, TeamArchiveService
 from app.modules.lobby.lobby.services.lobby import LobbyService
+from app.modules.lobby.participant.services.participant import LobbyParticipantService
 
 from app.modules.lobby.team.services.team import TeamService
 from app.modules.lobby.team.schemas import (
+    TeamBalanceCreate,
+    TeamBalanceRead,
     TeamCreate, 
     TeamUpdate, 
     TeamReadWithLobby, 
@@ -26,10 +31,17 @@ from app.modules.lobby.lobby.exceptions import (
     HTTPTeamUpdateDataNotProvided,
 )
 
+from app.shared.components.etag import ETag
+from app.shared.components.fields import FieldSet
+from app.shared.components.idempotency import Idempotency
 
-router = APIRouter()
+from app.core.responses import TrustedRoute
+
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.post("/", response_model=TeamReadWithLobby)
+@Idempotency.endpoint("team.create")
 async def create_team_(
     team_data: TeamCreate,
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
@@ -38,13 +50,7 @@ async def create_team_(
 ):
     
     current_user = await current_user_service.get()
-    lobby = await lobby_service.get_by_id(team_data.lobby_id)
-
-    if not lobby:
-        raise HTTPLobbyNotFound()
-    
-    condition = (lobby.host_id == current_user.id)
-    AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, HTTPLobbyTeamAccessDenied)
+    await LobbyAccessControl.authorize_host(lobby_service, current_user, team_data.lobby_id, HTTPLobbyTeamAccessDenied)
     
     team = await team_service.create(team_data)
     if not team:
@@ -53,19 +59,44 @@ async def create_team_(
     return team
 
 
+@router.post("/balance", response_model=TeamBalanceRead)
+async def balance_teams_(
+    balance_data: TeamBalanceCreate,
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    lobby_service: LobbyService = Depends(LobbyService),
+    team_service: TeamService = Depends(TeamService),
+    participant_service: LobbyParticipantService = Depends(LobbyParticipantService)
+):
+
+    current_user = await current_user_service.get()
+    await LobbyAccessControl.authorize_host(lobby_service, current_user, balance_data.lobby_id, HTTPLobbyTeamAccessDenied)
+
+    balance, changes = await team_service.balance(balance_data)
+    if changes and await participant_service.update_many(balance_data.lobby_id, changes) is None:
+        raise HTTPLobbyInternalError("Balance teams error")
+
+    return balance
+
+
 @router.get("/list-count", response_model=TeamListCountResponse)
 async def get_count_of_teams_(
     id: Optional[int] = Query(default=None),
     name: Optional[str] = Query(default=None),
     lobby_id: Optional[int] = Query(default=None),
+    archived: Optional[bool] = Query(default=False),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     lobby_service: LobbyService = Depends(LobbyService),
-    team_service: TeamService = Depends(TeamService)
+    team_service: TeamService = Depends(TeamService),
+    lobby_archive_service: LobbyArchiveService = Depends(LobbyArchiveService),
+    team_archive_service: TeamArchiveService = Depends(TeamArchiveService)
 ):
     
+    lobby_reader = lobby_archive_service if archived else lobby_service
+    team_reader = team_archive_service if archived else team_service
+
     lobby = None
     if lobby_id:
-        lobby = await lobby_service.get_by_id(lobby_id)
+        lobby = await lobby_reader.get_by_id(lobby_id)
 
         if not lobby:
             raise HTTPLobbyNotFound()
@@ -76,12 +107,14 @@ async def get_count_of_teams_(
         "name": name
     }
 
-    teams_count = await team_service.get_list(filters, only_count=True)
+    teams_count = await team_reader.get_list(filters, only_count=True)
     return TeamListCountResponse(total_count=teams_count)
 
 
 @router.get("/list", response_model=list[TeamReadWithLobby])
 async def get_list_of_teams_(
+    request: Request,
+    response: Response,
     id: Optional[int] = Query(default=None),
     name: Optional[str] = Query(default=None),
     lobby_id: Optional[int] = Query(default=None),
@@ -89,14 +122,21 @@ async def get_list_of_teams_(
     sort_order: Optional[str] = Query(default="asc"),
     limit: Optional[int] = Query(default=10, ge=1, le=100),
     offset: Optional[int] = Query(default=0, ge=0),
+    archived: Optional[bool] = Query(default=False),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(TeamReadWithLobby)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     lobby_service: LobbyService = Depends(LobbyService),
-    team_service: TeamService = Depends(TeamService)
+    team_service: TeamService = Depends(TeamService),
+    lobby_archive_service: LobbyArchiveService = Depends(LobbyArchiveService),
+    team_archive_service: TeamArchiveService = Depends(TeamArchiveService)
 ):
     
+    lobby_reader = lobby_archive_service if archived else lobby_service
+    team_reader = team_archive_service if archived else team_service
+
     lobby = None
     if lobby_id:
-        lobby = await lobby_service.get_by_id(lobby_id)
+        lobby = await lobby_reader.get_by_id(lobby_id)
 
         if not lobby:
             raise HTTPLobbyNotFound()
@@ -107,21 +147,46 @@ async def get_list_of_teams_(
         "name": name
     }
     
-    teams = await team_service.get_list(filters, sort_by, sort_order, limit, offset)
+    etag = await team_reader.get_list_etag(filters, sort_by, sort_order, limit, offset, fields)
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+
+    teams = await team_reader.get_list(filters, sort_by, sort_order, limit, offset, fields=fields)
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(teams, response)
+
     return teams
 
 
 @router.get("/{team_id}", response_model=TeamReadWithLobby)
 async def get_team_info_(
     team_id: int,
+    request: Request,
+    response: Response,
+    archived: Optional[bool] = Query(default=False),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(TeamReadWithLobby)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
-    team_service: TeamService = Depends(TeamService)
+    team_service: TeamService = Depends(TeamService),
+    archive_service: TeamArchiveService = Depends(TeamArchiveService)
 ):
     
-    team = await team_service.get_by_id(team_id)
+    service = archive_service if archived else team_service
+    etag = await service.get_etag(team_id, fields)
+    if not etag:
+        raise HTTPTeamNotFound()
+    
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+    
+    team = await service.get_by_id(team_id, fields)
     if not team:
         raise HTTPTeamNotFound()
     
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(team, response)
+
     return team
 
 
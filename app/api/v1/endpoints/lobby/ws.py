@@ -0,0 +1,132 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.database import get_async_session
+
+from app.modules.auth.user.services.current import CurrentWebSocketUserService
+
+from app.modules.lobby.events.services.events import LobbyEventService
+from app.modules.lobby.lobby.services.lobby import LobbyService
+from app.modules.lobby.participant.services.participant import LobbyParticipantService
+from app.modules.lobby.team.services.team import TeamService
+
+from app.core.broadcast import Frame, Subscription, broadcaster
+
+
+router = APIRouter()
+
+
+async def send_frame(websocket: WebSocket, frame: Frame, binary: bool = False) -> None:
+    if binary:
+        await websocket.send_bytes(frame.data)
+    else:
+        await websocket.send_text(frame.text)
+
+
+async def send_events(
+    websocket: WebSocket,
+    subscription: Subscription,
+    binary: bool = False,
+    after: int = 0,
+    sent: Optional[set[int]] = None
+) -> None:
+    sent = sent or set()
+
+    try:
+        async for frame in subscription:
+            if frame.seq is not None and (frame.seq <= after or frame.seq in sent):
+                continue
+
+            await send_frame(websocket, frame, binary)
+    except WebSocketDisconnect:
+        pass
+
+
+async def receive_until_disconnect(websocket: WebSocket) -> None:
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+async def load_missed_frames(
+    lobby_id: int,
+    since: int,
+    event_service: LobbyEventService,
+    lobby_service: LobbyService,
+    participant_service: LobbyParticipantService,
+    team_service: TeamService
+) -> tuple[list[Frame], int]:
+
+    frames = await event_service.replay(lobby_id, since)
+    if frames is not None:
+        return frames, since
+
+    seq = await event_service.get_sequence(lobby_id)
+    lobby = await lobby_service.get_by_id(lobby_id)
+    participants = await participant_service.get_list(
+        {"lobby_id": lobby_id, "all_db_participants": False}, limit=None
+    )
+    teams = await team_service.get_list({"lobby_id": lobby_id}, limit=None)
+
+    return [event_service.snapshot(seq, lobby, participants, teams)], seq
+
+
+@router.websocket("/lobby/{lobby_id}")
+async def lobby_events_(
+    websocket: WebSocket,
+    lobby_id: int,
+    binary: bool = False,
+    since: Optional[int] = Query(default=None, ge=0),
+    db: AsyncSession = Depends(get_async_session),
+    current_user_service: CurrentWebSocketUserService = Depends(CurrentWebSocketUserService),
+    lobby_service: LobbyService = Depends(LobbyService),
+    participant_service: LobbyParticipantService = Depends(LobbyParticipantService),
+    team_service: TeamService = Depends(TeamService)
+):
+
+    try:
+        await current_user_service.get()
+    except HTTPException as error:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=error.detail)
+        return
+
+    lobby = await lobby_service.get_access(lobby_id)
+    if not lobby:
+        await db.commit()
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Lobby not found")
+        return
+
+    async with broadcaster.subscription(LobbyEventService.get_channel(lobby_id)) as subscription:
+        frames, after = [], 0
+        if since is not None:
+            frames, after = await load_missed_frames(
+                lobby_id, since, LobbyEventService(), lobby_service, participant_service, team_service
+            )
+
+        await db.commit()
+        await websocket.accept()
+
+        try:
+            for frame in frames:
+                await send_frame(websocket, frame, binary)
+        except WebSocketDisconnect:
+            return
+
+        sent = {frame.seq for frame in frames if frame.seq is not None}
+        tasks = [
+            asyncio.create_task(send_events(websocket, subscription, binary, after, sent)),
+            asyncio.create_task(receive_until_disconnect(websocket)),
+        ]
+
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()
@@ -5,8 +5,11 @@ from app.modules.auth.token.services.token import TokenService
 from app.modules.auth.user.access import RoleChecker
 from app.modules.auth.user.services.current import CurrentUserService
 
+from app.core.metrics import MetricsSnapshot, metrics
+from app.core.responses import TrustedRoute
 
-router = APIRouter()
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.delete("/clear-tokens", response_model=TokenCleanResponse)
 async def clear_inactive_tokens_(
@@ -15,3 +18,10 @@ async def clear_inactive_tokens_(
 ):
     count = await token_service.drop_all_inactive_tokens()
     return TokenCleanResponse(detail=f"Removed {count} inactive tokens from base")
+
+
+@router.get("/metrics", response_model=dict[str, MetricsSnapshot])
+async def get_metrics_(
+    current_user_service: CurrentUserService = Depends(RoleChecker.admin)
+):
+    return metrics.snapshot()
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.modules.auth.token.services.user import UserTokenService
 from app.modules.auth.user.access import RoleChecker
@@ -9,6 +9,7 @@ from app.modules.auth.user.validators import UserValidator
 from app.modules.auth.user.services.user import UserService
 from app.modules.auth.user.services.current import CurrentUserService
 from app.modules.auth.user.schemas import (
+    UserSuggestRead,
     UserReadRegular,
     UserRead,
     UserUpdate, 
@@ -22,8 +23,14 @@ from app.modules.auth.user.exceptions import (
     HTTPUserExceptionNoDataProvided
 )
 
+from app.shared.components.etag import ETag
+from app.shared.components.fields import FieldSet
 
-router = APIRouter()
+from app.core.config import settings
+from app.core.responses import TrustedRoute
+
+
+router = APIRouter(route_class=TrustedRoute)
 
 @router.get("/list-count", response_model=UserListCountResponse)
 async def get_users_count_on_conditions_(
@@ -48,6 +55,8 @@ async def get_users_count_on_conditions_(
 
 @router.get("/list", response_model=list[UserReadRegular])
 async def get_list_of_users_on_conditions_(
+    request: Request,
+    response: Response,
     id: Optional[int] = Query(default=None),
     role: Optional[UserRole] = Query(default=None),
     username: Optional[str] = Query(default=None),
@@ -56,6 +65,7 @@ async def get_list_of_users_on_conditions_(
     sort_order: Optional[str] = Query(default="asc"),
     limit: Optional[int] = Query(default=10, ge=1, le=100),
     offset: Optional[int] = Query(default=0, ge=0),
+    fields: Optional[FieldSet] = Depends(FieldSet.query(UserReadRegular)),
     current_user_service: CurrentUserService = Depends(RoleChecker.user),
     user_service: UserService = Depends(UserService)
 ):
@@ -67,12 +77,32 @@ async def get_list_of_users_on_conditions_(
         "email": email
     }
 
-    users = await user_service.get_list(filters, sort_by, sort_order, limit, offset)
+    etag = await user_service.get_list_etag(filters, sort_by, sort_order, limit, offset, fields)
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+
+    users = await user_service.get_list(filters, sort_by, sort_order, limit, offset, fields=fields)
+    ETag.set_header(response, etag)
+    if fields:
+        return fields.response(users, response)
+
     return users
 
 
+@router.get("/suggest", response_model=list[UserSuggestRead])
+async def suggest_users_(
+    prefix: str = Query(min_length=1, max_length=64),
+    limit: int = Query(default=settings.USER_SUGGEST_LIMIT, ge=1, le=settings.USER_SUGGEST_LIMIT),
+    current_user_service: CurrentUserService = Depends(RoleChecker.user),
+    user_service: UserService = Depends(UserService)
+):
+    return await user_service.suggest(prefix, limit)
+
+
 @router.get("/", response_model=UserReadRegular)
 async def get_user_by_data_(
+    request: Request,
+    response: Response,
     get_user_id: Optional[int] = Query(default=None),
     get_username: Optional[str] = Query(default=None),
     get_email: Optional[str] = Query(default=None),
@@ -84,10 +114,18 @@ async def get_user_by_data_(
     except ValueError as e:
         raise HTTPUserExceptionNoDataProvided(detail=str(e))
     
+    etag = await user_service.get_etag_by_params(get_user_id, get_username, get_email)
+    if not etag:
+        raise HTTPUserExceptionNotFound()
+    
+    if ETag.is_not_modified(request, etag):
+        return ETag.not_modified(etag)
+    
     user = await user_service.get_by_params(get_user_id, get_username, get_email)
     if not user:
         raise HTTPUserExceptionNotFound()
 
+    ETag.set_header(response, etag)
     return user
 
 
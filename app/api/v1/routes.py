@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from app.api.v1.endpoints.auth import auth, account
-from app.api.v1.endpoints.lobby import algorithm, lobby, team
+from app.api.v1.endpoints.lobby import algorithm, draft, lobby, matchmaking, team, ws
 from app.api.v1.endpoints.users import users, admin
 
 
@@ -11,7 +11,10 @@ api_router.include_router(account.router, prefix="/account", tags=["account"])
 
 api_router.include_router(algorithm.router, prefix="/algorithm", tags=["algorithm"])
 api_router.include_router(lobby.router, prefix="/lobby", tags=["lobby"])
+api_router.include_router(draft.router, prefix="/lobby", tags=["draft"])
 api_router.include_router(team.router, prefix="/teams", tags=["teams"])
+api_router.include_router(matchmaking.router, prefix="/matchmaking", tags=["matchmaking"])
+api_router.include_router(ws.router, prefix="/ws", tags=["ws"])
 
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
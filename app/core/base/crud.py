@@ -3,13 +3,17 @@ from typing import Type, TypeVar, Generic, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import update, delete, func, asc, desc
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, aliased
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
 from sqlalchemy.sql.expression import and_
 
 from pydantic import BaseModel
 
 from app.shared.db.base import Base
+from app.shared.components.fields import FieldSet
 from app.shared.components.filters import FilterField
+from app.shared.components.search import FullTextSearch
 
 
 T = TypeVar("T", bound=Base)
@@ -18,6 +22,8 @@ class BaseCRUD(Generic[T]):
 
     default_filters: dict[str, FilterField] = {}
     relations: list[str] = []
+    version_relations: list[str] = []
+    search_column: Optional[str] = None
 
 
     def __init__(self, db: AsyncSession, model: Type[T]):
@@ -32,17 +38,17 @@ class BaseCRUD(Generic[T]):
         return obj
 
 
-    async def get_by_key_value(self, key: str, value: Any) -> Optional[T]:
-        result = await self.db.execute(
-            select(self.model)
-            .filter(getattr(self.model, key) == value)
-        )
+    async def get_by_key_value(self, key: str, value: Any, fields: Optional[FieldSet] = None) -> Optional[T]:
+        query = select(self.model).filter(getattr(self.model, key) == value)
+        if fields:
+            query = query.options(*fields.load_options(self.model))
 
+        result = await self.db.execute(query)
         return result.scalars().first()
 
 
-    async def get_by_id(self, value: int) -> Optional[T]:
-        return await self.get_by_key_value("id", value)
+    async def get_by_id(self, value: int, fields: Optional[FieldSet] = None) -> Optional[T]:
+        return await self.get_by_key_value("id", value, fields)
 
 
     async def update(self, obj: T, update_data: BaseModel, exclude: Optional[set] = None) -> Optional[T]:
@@ -57,7 +63,49 @@ class BaseCRUD(Generic[T]):
         await self.db.execute(
             update(self.model)
             .where(self.model.id == obj.id)
-            .values(**update_dict)
+            .values(**self.get_update_values(update_dict))
+        )
+
+        await self.db.commit()
+        await self.db.refresh(obj)
+
+        return obj
+
+
+    async def update_by_id(self, obj_id: int, update_data: BaseModel, exclude: Optional[set] = None) -> Optional[T]:
+        
+        if not exclude:
+            exclude = set()
+
+        update_dict = update_data.model_dump(exclude_unset=True, exclude=exclude)
+        if not update_dict:
+            return None
+
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**self.get_update_values(update_dict))
+        )
+
+        await self.db.commit()
+
+        result = await self.db.execute(
+            select(self.model)
+            .filter(self.model.id == obj_id)
+            .execution_options(populate_existing=True)
+        )
+
+        return result.scalars().first()
+
+
+    async def touch(self, obj: T) -> T:
+        if not self.is_versioned():
+            return obj
+
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == obj.id)
+            .values(version=self.model.version + 1)
         )
 
         await self.db.commit()
@@ -67,7 +115,11 @@ class BaseCRUD(Generic[T]):
 
 
     async def delete(self, obj: T) -> bool:
-        await self.db.execute(delete(self.model).where(self.model.id == obj.id))
+        return await self.delete_by_id(obj.id)
+
+
+    async def delete_by_id(self, obj_id: int) -> bool:
+        await self.db.execute(delete(self.model).where(self.model.id == obj_id))
         await self.db.commit()
         return True
 
@@ -79,14 +131,86 @@ class BaseCRUD(Generic[T]):
         limit: Optional[int] = 10,
         offset: Optional[int] = 0,
         only_count: Optional[bool] = False,
+        fields: Optional[FieldSet] = None,
     ) -> list[Optional[T]] | int:
         
         query = select(self.model)
 
-        if self.relations:
+        if fields:
+            query = query.options(*fields.load_options(self.model))
+        elif self.relations:
             for relation in self.relations:
                 query = query.options(selectinload(getattr(self.model, relation)))
 
+        query = self.apply_filters(query, filters)
+
+        if only_count:
+            count_query = select(func.count()).select_from(query.subquery())
+            result = await self.db.execute(count_query)
+            return result.scalar()
+
+        query = self.apply_pagination(query, sort_by, sort_order, limit, offset)
+
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+
+    async def get_version(self, obj_id: int) -> Optional[Row]:
+        return await self.get_version_by_key_value("id", obj_id)
+
+
+    async def get_version_by_key_value(self, key: str, value: Any) -> Optional[Row]:
+        result = await self.db.execute(
+            self.get_version_query()
+            .filter(getattr(self.model, key) == value)
+        )
+
+        return result.first()
+
+
+    async def get_list_versions(self,
+        filters: Optional[dict[str, Any]] = None,
+        sort_by: Optional[str] = "id",
+        sort_order: Optional[str] = "asc",
+        limit: Optional[int] = 10,
+        offset: Optional[int] = 0,
+    ) -> list[Row]:
+        
+        query = self.apply_filters(self.get_version_query(), filters)
+        query = self.apply_pagination(query, sort_by, sort_order, limit, offset)
+
+        result = await self.db.execute(query)
+        return result.all()
+
+
+    def get_version_query(self) -> Select:
+        query = select(self.model.id, self.model.version)
+        aliases = {"": self.model}
+
+        for path in self.version_relations:
+            parent_path, _, name = path.rpartition(".")
+            relation = getattr(aliases[parent_path], name)
+            target = aliased(relation.property.mapper.class_)
+
+            query = query.outerjoin(relation.of_type(target)).add_columns(target.id, target.version)
+            aliases[path] = target
+
+        return query
+
+
+    def is_versioned(self) -> bool:
+        return hasattr(self.model, "version")
+
+
+    def get_update_values(self, update_dict: dict[str, Any]) -> dict[str, Any]:
+        if self.is_versioned():
+            update_dict["version"] = self.model.version + 1
+
+        return update_dict
+
+
+    def apply_filters(self, query: Select, filters: Optional[dict[str, Any]] = None) -> Select:
+
         if filters is None:
             filters = {}
 
@@ -116,22 +240,31 @@ class BaseCRUD(Generic[T]):
                 conditions.append(condition)
 
         conditions.extend(self.custom_filters(custom_conditions))
+
+        if self.search_column and filters.get("search"):
+            condition, rank = FullTextSearch.match(getattr(self.model, self.search_column), filters["search"])
+            conditions.append(condition)
+            query = query.order_by(rank.desc())
+
         if conditions:
             query = query.where(and_(*conditions))
 
-        if only_count:
-            count_query = select(func.count()).select_from(query.subquery())
-            result = await self.db.execute(count_query)
-            return result.scalar()
+        return query
+
 
+    def apply_pagination(self,
+        query: Select,
+        sort_by: Optional[str] = "id",
+        sort_order: Optional[str] = "asc",
+        limit: Optional[int] = 10,
+        offset: Optional[int] = 0,
+    ) -> Select:
+        
         sort_field = getattr(self.model, sort_by, None)
         if sort_field:
             query = query.order_by(asc(sort_field) if sort_order == "asc" else desc(sort_field))
 
-        query = query.offset(offset).limit(limit)
-
-        result = await self.db.execute(query)
-        return result.scalars().all()
+        return query.offset(offset).limit(limit)
     
 
     def custom_filters(self, filters: dict[str, Any]) -> list[Any]:
@@ -1,9 +1,12 @@
 from typing import Self, Any
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import DeclarativeBase
 
 from pydantic import BaseModel
 
+from app.core.notify import register_change_triggers
+
 
 class Base(DeclarativeBase):
 
@@ -14,7 +17,12 @@ class Base(DeclarativeBase):
 
     
     def to_dict(self) -> dict[str, Any]:
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        # Deferred columns that were never loaded are skipped instead of triggering a lazy load
+        state = inspect(self)
+        return {
+            c.name: getattr(self, c.name) for c in self.__table__.columns
+            if not (c.name in state.unloaded and state.mapper.column_attrs[c.name].deferred)
+        }
     
 
     @classmethod
@@ -25,3 +33,6 @@ class Base(DeclarativeBase):
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({self.to_dict()})>"
+
+
+register_change_triggers(Base.metadata)
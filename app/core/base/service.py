@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from app.dependencies.database import get_async_session
 from app.core.base.crud import BaseCRUD
 from app.shared.db.base import Base
+from app.shared.components.etag import ETag
+from app.shared.components.fields import FieldSet
 
 
 T = TypeVar("T", bound=Base)
@@ -20,8 +22,8 @@ class BaseService(Generic[T, C]):
         self.crud = crud_class(db)
 
 
-    async def get_by_id(self, obj_id: int) -> Optional[T]:
-        return await self.crud.get_by_id(obj_id)
+    async def get_by_id(self, obj_id: int, fields: Optional[FieldSet] = None) -> Optional[T]:
+        return await self.crud.get_by_id(obj_id, fields)
     
 
     async def create(self, obj: BaseModel) -> T:
@@ -33,9 +35,17 @@ class BaseService(Generic[T, C]):
         return await self.crud.update(obj, update_data)
 
 
+    async def update_by_id(self, obj_id: int, update_data: BaseModel) -> Optional[T]:
+        return await self.crud.update_by_id(obj_id, update_data)
+
+
     async def delete(self, obj: T) -> bool:
         return await self.crud.delete(obj)
 
+
+    async def delete_by_id(self, obj_id: int) -> bool:
+        return await self.crud.delete_by_id(obj_id)
+
     async def get_list(
         self,
         filters: Optional[dict[str, Any]] = None,
@@ -43,7 +53,30 @@ class BaseService(Generic[T, C]):
         sort_order: Optional[str] = "asc",
         limit: Optional[int] = 10,
         offset: Optional[int] = 0,
-        only_count: Optional[bool] = False
+        only_count: Optional[bool] = False,
+        fields: Optional[FieldSet] = None
     ) -> list[Optional[T]] | int:
         
-        return await self.crud.get_list(filters, sort_by, sort_order, limit, offset, only_count)
+        return await self.crud.get_list(filters, sort_by, sort_order, limit, offset, only_count, fields)
+
+
+    async def get_etag(self, obj_id: int, fields: Optional[FieldSet] = None) -> Optional[str]:
+        version = await self.crud.get_version(obj_id)
+        if version is None:
+            return None
+
+        return ETag.build(f"{self.model.__tablename__}:{fields or ''}", [version])
+
+
+    async def get_list_etag(
+        self,
+        filters: Optional[dict[str, Any]] = None,
+        sort_by: Optional[str] = "id",
+        sort_order: Optional[str] = "asc",
+        limit: Optional[int] = 10,
+        offset: Optional[int] = 0,
+        fields: Optional[FieldSet] = None
+    ) -> str:
+        
+        versions = await self.crud.get_list_versions(filters, sort_by, sort_order, limit, offset)
+        return ETag.build(f"{self.model.__tablename__}:list:{fields or ''}", versions)
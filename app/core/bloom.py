@@ -0,0 +1,32 @@
+import hashlib
+from typing import Optional
+
+
+class BloomFilter:
+
+    def __init__(self, size: int, hashes: int, data: Optional[bytes] = None):
+        self.size = size
+        self.hashes = hashes
+        self.data = bytearray(data) if data is not None else bytearray((size + 7) // 8)
+
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.data[position >> 3] & (0x80 >> (position & 7)) for position in self.get_positions(value))
+
+
+    @staticmethod
+    def hash(value: str, size: int, hashes: int) -> list[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+
+        return [(first + index * second) % size for index in range(hashes)]
+
+
+    def get_positions(self, value: str) -> list[int]:
+        return self.hash(value, self.size, self.hashes)
+
+
+    def add(self, value: str) -> None:
+        for position in self.get_positions(value):
+            self.data[position >> 3] |= 0x80 >> (position & 7)
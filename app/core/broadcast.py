@@ -0,0 +1,376 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from operator import attrgetter
+from typing import AsyncIterator, Optional
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from app.core.config import settings
+from app.core.redis import RedisBytesClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class SendPolicy(StrEnum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    COALESCE = "coalesce"
+
+
+class Frame:
+    __slots__ = ("data", "key", "seq", "_text")
+
+    def __init__(self, data: bytes, key: Optional[str] = None, seq: Optional[int] = None):
+        self.data = data
+        self.key = key
+        self.seq = seq
+        self._text: Optional[str] = None
+
+
+    @staticmethod
+    def encode(data: bytes, key: Optional[str] = None, seq: Optional[int] = None) -> bytes:
+        header = f"{'' if seq is None else seq} {key or ''}"
+        return header.encode("utf-8") + b"\n" + data
+
+
+    @classmethod
+    def decode(cls, message: bytes | str) -> "Frame":
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+
+        header, separator, data = message.partition(b"\n")
+        if not separator:
+            return cls(header)
+
+        seq, _, key = header.partition(b" ")
+        return cls(data, key.decode("utf-8") or None, int(seq) if seq else None)
+
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.data.decode("utf-8")
+
+        return self._text
+
+
+class Subscription:
+    __slots__ = ("channel", "max_size", "policy", "dropped", "coalesced", "index", "_frames", "_pending", "_ready")
+
+    def __init__(self, channel: str, max_size: int = 100, policy: SendPolicy = SendPolicy.DROP_OLDEST):
+        self.channel = channel
+        self.max_size = max_size
+        self.policy = policy
+        self.dropped = 0
+        self.coalesced = 0
+        self.index = -1
+
+        self._frames: deque[Frame | str] = deque()
+        self._pending: dict[str, Frame] = {}
+        self._ready = asyncio.Event()
+
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+    def put(self, frame: Frame) -> None:
+        coalesce = self.policy is SendPolicy.COALESCE and frame.key is not None
+        if coalesce and frame.key in self._pending:
+            self._pending[frame.key] = frame
+            self.coalesced += 1
+            return
+
+        if len(self._frames) >= self.max_size:
+            self.dropped += 1
+            if self.policy is SendPolicy.DROP_NEWEST:
+                return
+
+            self.get_nowait()
+
+        if coalesce:
+            self._pending[frame.key] = frame
+            self._frames.append(frame.key)
+        else:
+            self._frames.append(frame)
+
+        self._ready.set()
+
+
+    def get_nowait(self) -> Frame:
+        if not self._frames:
+            raise asyncio.QueueEmpty
+
+        item = self._frames.popleft()
+        if isinstance(item, str):
+            item = self._pending.pop(item)
+
+        return item
+
+
+    async def get(self) -> Frame:
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+
+        return self.get_nowait()
+
+
+    def __aiter__(self) -> AsyncIterator[Frame]:
+        return self
+
+
+    async def __anext__(self) -> Frame:
+        return await self.get()
+
+
+class SubscriberGroup:
+    __slots__ = ("members", "history")
+
+    def __init__(self, history_size: int = 0):
+        self.members: list[Subscription] = []
+        self.history: deque[Frame] = deque(maxlen=history_size)
+
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+    def add(self, subscription: Subscription) -> None:
+        subscription.index = len(self.members)
+        self.members.append(subscription)
+
+
+    def remove(self, subscription: Subscription) -> bool:
+        index = subscription.index
+        if index < 0 or index >= len(self.members) or self.members[index] is not subscription:
+            return False
+
+        last = self.members.pop()
+        if last is not subscription:
+            self.members[index] = last
+            last.index = index
+
+        subscription.index = -1
+        return True
+
+
+    def dispatch(self, frame: Frame) -> None:
+        if frame.seq is not None and self.history.maxlen:
+            self.history.append(frame)
+
+        for subscription in self.members:
+            subscription.put(frame)
+
+
+    def replay(self, since: int) -> Optional[list[Frame]]:
+        if not self.history:
+            return None
+
+        frames = sorted(self.history, key=attrgetter("seq"))
+        if frames[0].seq > since + 1 or frames[-1].seq < since:
+            return None
+
+        missed = [frame for frame in frames if frame.seq > since]
+        if any(frame.seq != since + index for index, frame in enumerate(missed, 1)):
+            return None
+
+        return missed
+
+
+class Broadcaster:
+
+    def __init__(self,
+            redis: Redis,
+            prefix: str,
+            queue_size: int = 100,
+            policy: SendPolicy = SendPolicy.DROP_OLDEST,
+            history_size: int = 0,
+            reconnect_delay: float = 1.0,
+            reconnect_max_delay: float = 30.0
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.queue_size = queue_size
+        self.policy = policy
+        self.history_size = history_size
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_max_delay = reconnect_max_delay
+
+        self._groups: dict[str, SubscriberGroup] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._pubsub: Optional[PubSub] = None
+        self._wakeup = asyncio.Event()
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    def get_channel(self, channel: str) -> str:
+        return f"{self.prefix}:{channel}"
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        await self._close()
+
+
+    async def publish(self, channel: str, data: bytes, key: Optional[str] = None) -> None:
+        await self.redis.publish(self.get_channel(channel), Frame.encode(data, key))
+
+
+    def dispatch(self, channel: str, message: bytes | str) -> None:
+        group = self._groups.get(channel)
+        if group is not None:
+            group.dispatch(Frame.decode(message))
+
+
+    def replay(self, channel: str, since: int) -> Optional[list[Frame]]:
+        group = self._groups.get(channel)
+        if group is None:
+            return None
+
+        return group.replay(since)
+
+
+    def attach(self, channel: str) -> Subscription:
+        subscription = Subscription(channel, self.queue_size, self.policy)
+        group = self._groups.get(channel)
+        if group is None:
+            group = self._groups[channel] = SubscriberGroup(self.history_size)
+
+        group.add(subscription)
+        return subscription
+
+
+    def detach(self, subscription: Subscription) -> bool:
+        group = self._groups.get(subscription.channel)
+        if group is None or not group.remove(subscription) or group:
+            return False
+
+        del self._groups[subscription.channel]
+        return True
+
+
+    async def subscribe(self, channel: str) -> Subscription:
+        subscription = self.attach(channel)
+
+        if len(self._groups[channel]) == 1 and self._pubsub is not None:
+            await self._pubsub.subscribe(self.get_channel(channel))
+
+        self._wakeup.set()
+        await self.start()
+        return subscription
+
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        if not self.detach(subscription) or self._pubsub is None:
+            return
+
+        try:
+            await self._pubsub.unsubscribe(self.get_channel(subscription.channel))
+        except Exception as error:
+            logger.warning("Failed to unsubscribe from '%s': %s", subscription.channel, error)
+
+
+    @asynccontextmanager
+    async def subscription(self, channel: str) -> AsyncIterator[Subscription]:
+        subscription = await self.subscribe(channel)
+        try:
+            yield subscription
+        finally:
+            await self.unsubscribe(subscription)
+
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+
+        while True:
+            try:
+                await self._listen()
+                delay = self.reconnect_delay
+                await self._read()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                logger.warning("Broadcast connection lost: %s", error)
+
+            await self._close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+
+    async def _listen(self) -> None:
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        for group in self._groups.values():
+            group.history.clear()
+
+        if self._groups:
+            await self._pubsub.subscribe(*(self.get_channel(channel) for channel in self._groups))
+
+
+    async def _read(self) -> None:
+        offset = len(self.prefix) + 1
+
+        while True:
+            if not self._pubsub.subscribed:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            message = await self._pubsub.get_message(timeout=1.0)
+            if message is None or message["type"] != "message":
+                continue
+
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode("utf-8")
+
+            self.dispatch(channel[offset:], message["data"])
+
+
+    async def _close(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is None:
+            return
+
+        try:
+            await pubsub.aclose()
+        except Exception as error:
+            logger.warning("Failed to close broadcast connection: %s", error)
+
+
+broadcaster = Broadcaster(
+    RedisBytesClient,
+    settings.BROADCAST_CHANNEL_PREFIX,
+    settings.BROADCAST_QUEUE_SIZE,
+    SendPolicy(settings.BROADCAST_SEND_POLICY),
+    settings.BROADCAST_HISTORY_SIZE,
+    settings.BROADCAST_RECONNECT_DELAY,
+    settings.BROADCAST_RECONNECT_MAX_DELAY,
+)
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+from app.core.config import settings
+
+
+type CacheTag = tuple[str, Optional[int]]
+
+
+class LocalCache:
+
+    def __init__(self, max_size: int = 10000, enabled: bool = True):
+        self.max_size = max_size
+        self.enabled = enabled
+
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._key_tags: dict[Hashable, tuple[CacheTag, ...]] = {}
+        self._tag_keys: dict[CacheTag, set[Hashable]] = {}
+
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+
+        self._data.move_to_end(key)
+        return self._data[key]
+
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[CacheTag] = ()) -> None:
+        if not self.enabled:
+            return
+
+        if key in self._data:
+            self.delete(key)
+
+        tags = tuple(tags)
+        self._data[key] = value
+        self._key_tags[key] = tags
+        for tag in tags:
+            self._tag_keys.setdefault(tag, set()).add(key)
+
+        while len(self._data) > self.max_size:
+            oldest_key = next(iter(self._data))
+            self.delete(oldest_key)
+
+
+    def delete(self, key: Hashable) -> bool:
+        if key not in self._data:
+            return False
+
+        del self._data[key]
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is None:
+                continue
+
+            keys.discard(key)
+            if not keys:
+                del self._tag_keys[tag]
+
+        return True
+
+
+    def invalidate(self, table: str, obj_id: Optional[int] = None) -> int:
+        if obj_id is None:
+            tags = [tag for tag in self._tag_keys if tag[0] == table]
+        else:
+            tags = [(table, None), (table, obj_id)]
+
+        keys = set()
+        for tag in tags:
+            keys.update(self._tag_keys.get(tag, ()))
+
+        for key in keys:
+            self.delete(key)
+
+        return len(keys)
+
+
+    def flush(self) -> None:
+        self._data.clear()
+        self._key_tags.clear()
+        self._tag_keys.clear()
+
+
+cache = LocalCache(settings.CACHE_MAX_SIZE, bool(settings.CACHE_ENABLED))
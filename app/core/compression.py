@@ -0,0 +1,259 @@
+import gzip
+import hashlib
+import time
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import LocalCache
+from app.core.metrics import MetricsSnapshot, metrics
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def get_encoders(level: int) -> dict[str, Callable[[bytes], bytes]]:
+    encoders = {}
+
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=min(level, 19))
+        encoders["zstd"] = compressor.compress
+
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=min(level, 11))
+
+    encoders["gzip"] = lambda data: gzip.compress(data, compresslevel=min(level, 9), mtime=0)
+    return encoders
+
+
+def parse_accept_encoding(header: Optional[str]) -> dict[str, float]:
+    accepted = {}
+    for item in (header or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        accepted[name.strip().lower()] = quality
+
+    return accepted
+
+
+class CPUBudget:
+
+    def __init__(self, limit: float, window: float = 1.0):
+        self.limit = limit
+        self.window = window
+
+        self._window_start = time.monotonic()
+        self._spent = 0.0
+
+
+    def _roll(self) -> None:
+        now = time.monotonic()
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._spent = 0.0
+
+
+    def available(self) -> bool:
+        self._roll()
+        return self._spent < self.limit
+
+
+    def spend(self, cpu_time: float) -> None:
+        self._roll()
+        self._spent += cpu_time
+
+
+class CompressionMetrics:
+
+    def __init__(self):
+        self.reset()
+
+
+    def reset(self) -> None:
+        self.responses = 0
+        self.compressed = 0
+        self.cache_hits = 0
+        self.skipped_size = 0
+        self.skipped_budget = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_time = 0.0
+
+
+    @property
+    def ratio(self) -> float:
+        if not self.bytes_out:
+            return 1.0
+
+        return self.bytes_in / self.bytes_out
+
+
+    def snapshot(self) -> MetricsSnapshot:
+        return {
+            "responses": self.responses,
+            "compressed": self.compressed,
+            "cache_hits": self.cache_hits,
+            "skipped_size": self.skipped_size,
+            "skipped_budget": self.skipped_budget,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.ratio, 3),
+            "cpu_time": round(self.cpu_time, 6),
+        }
+
+
+class CompressionMiddleware:
+
+    def __init__(self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        level: int = 6,
+        cpu_budget: float = 0.25,
+        cpu_window: float = 1.0,
+        cache_size: int = 1000,
+        compression_metrics: Optional[CompressionMetrics] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = get_encoders(level)
+        self.budget = CPUBudget(cpu_budget, cpu_window)
+        self.cache = LocalCache(cache_size, cache_size > 0)
+        self.metrics = compression_metrics or compression_stats
+
+
+    def select_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+
+        best, best_quality = None, 0.0
+        for name in self.encoders:
+            quality = accepted.get(name, wildcard)
+            if quality > best_quality:
+                best, best_quality = name, quality
+
+        return best
+
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.select_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        streaming = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, streaming
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or streaming:
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                streaming = True
+                await send(start_message)
+                await send(message)
+                return
+
+            await self.send_response(scope, start_message, message.get("body", b""), encoding, send)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+    def is_compressible(self, start_message: Message, body: bytes) -> bool:
+        headers = Headers(raw=start_message["headers"])
+        if start_message["status"] < 200 or start_message["status"] in (204, 304):
+            return False
+
+        if "content-encoding" in headers or not body:
+            return False
+
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+
+    def compress(self, scope: Scope, start_message: Message, body: bytes, encoding: str) -> Optional[bytes]:
+        etag = Headers(raw=start_message["headers"]).get("etag")
+        if etag:
+            key = (scope["path"], etag, encoding)
+        else:
+            key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+
+        compressed = self.cache.get(key)
+        if compressed is not None:
+            self.metrics.cache_hits += 1
+            return compressed
+
+        if not self.budget.available():
+            self.metrics.skipped_budget += 1
+            return None
+
+        started = time.thread_time()
+        compressed = self.encoders[encoding](body)
+        cpu_time = time.thread_time() - started
+
+        self.budget.spend(cpu_time)
+        self.metrics.cpu_time += cpu_time
+        self.cache.set(key, compressed)
+        return compressed
+
+
+    async def send_response(self, scope: Scope, start_message: Message, body: bytes, encoding: str, send: Send) -> None:
+        compressed = None
+        if self.is_compressible(start_message, body):
+            self.metrics.responses += 1
+            if len(body) < self.minimum_size:
+                self.metrics.skipped_size += 1
+            else:
+                compressed = self.compress(scope, start_message, body, encoding)
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+        if compressed is not None:
+            self.metrics.compressed += 1
+            self.metrics.bytes_in += len(body)
+            self.metrics.bytes_out += len(compressed)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if headers.get("etag", "W/").startswith('"'):
+                headers["ETag"] = f"W/{headers['etag']}"
+
+            body = compressed
+
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+compression_stats = CompressionMetrics()
+metrics.register("compression", compression_stats.snapshot)
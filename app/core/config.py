@@ -11,6 +11,7 @@ class Settings(BaseSettings):
     
     MIN_TEAMS_COUNT: int = 2
     MAX_TEAMS_COUNT: int = 16
+    ALGORITHM_CACHE_SIZE: int = 1024
 
     AVALIABLE_TO_RELOGIN: int = 0
 
@@ -27,9 +28,94 @@ class Settings(BaseSettings):
     REDIS_PORT: int
     REDIS_DB: int
 
+    TRUSTED_SERIALIZATION: int = 1
+
+    CACHE_ENABLED: int = 1
+    CACHE_MAX_SIZE: int = 10000
+    CACHE_NOTIFY_CHANNEL: str = "row_change"
+    CACHE_NOTIFY_RECONNECT_DELAY: float = 1.0
+    CACHE_NOTIFY_RECONNECT_MAX_DELAY: float = 30.0
+    CACHE_NOTIFY_HEARTBEAT_INTERVAL: float = 15.0
+
+    COMPRESSION_ENABLED: int = 1
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_LEVEL: int = 6
+    COMPRESSION_CPU_BUDGET: float = 0.25
+    COMPRESSION_CPU_WINDOW: float = 1.0
+    COMPRESSION_CACHE_SIZE: int = 1000
+
+    BROADCAST_ENABLED: int = 1
+    BROADCAST_CHANNEL_PREFIX: str = "broadcast"
+    BROADCAST_QUEUE_SIZE: int = 100
+    BROADCAST_SEND_POLICY: str = "coalesce"
+    BROADCAST_HISTORY_SIZE: int = 256
+    BROADCAST_HISTORY_TTL: int = 86400
+    BROADCAST_RECONNECT_DELAY: float = 1.0
+    BROADCAST_RECONNECT_MAX_DELAY: float = 30.0
+
+    DRAFT_KEY_PREFIX: str = "draft"
+    DRAFT_TTL: int = 86400
+    DRAFT_FLUSH_INTERVAL: float = 0.05
+
+    OWNERSHIP_PREFIX: str = "ownership"
+    OWNERSHIP_LEASE_TTL: float = 10.0
+    OWNERSHIP_COMMAND_TIMEOUT: float = 5.0
+    OWNERSHIP_IDLE_TIMEOUT: float = 300.0
+    OWNERSHIP_BLOCK_TIMEOUT: float = 1.0
+    OWNERSHIP_STREAM_SIZE: int = 1000
+    OWNERSHIP_STREAM_TTL: int = 60
+    OWNERSHIP_CONCURRENCY: int = 100
+
+    SCHEDULER_ENABLED: int = 1
+    SCHEDULER_KEY: str = "scheduler:timers"
+    SCHEDULER_TICK: float = 1.0
+    SCHEDULER_WHEEL_SIZE: int = 512
+    SCHEDULER_BATCH_SIZE: int = 500
+    SCHEDULER_RECOVERY_INTERVAL: float = 30.0
+
+    LOBBY_IDLE_TIMEOUT: int = 3600
+    LOBBY_PARTICIPANTS_BULK_LIMIT: int = 100
+
+    LOBBY_EVENT_LOG_ENABLED: int = 1
+    LOBBY_EVENT_LOG_FLUSH_INTERVAL: float = 1.0
+    LOBBY_EVENT_LOG_BATCH_SIZE: int = 500
+    LOBBY_EVENT_LOG_BUFFER_SIZE: int = 10000
+    LOBBY_EVENT_LOG_SNAPSHOT_INTERVAL: int = 100
+
+    LOBBY_ARCHIVE_ENABLED: int = 1
+    LOBBY_ARCHIVE_AFTER_DAYS: int = 30
+    LOBBY_ARCHIVE_INTERVAL: float = 3600.0
+    LOBBY_ARCHIVE_BATCH_SIZE: int = 500
+
+    MATCHMAKING_ENABLED: int = 1
+    MATCHMAKING_PREFIX: str = "matchmaking"
+    MATCHMAKING_TEAM_SIZE: int = 5
+    MATCHMAKING_BATCH_SIZE: int = 1000
+    MATCHMAKING_INTERVAL: float = 0.5
+    MATCHMAKING_LOCK_TTL: float = 10.0
+    MATCHMAKING_RESULT_TTL: int = 300
+
+    USER_SUGGEST_LIMIT: int = 10
+
+    USER_AVAILABILITY_ENABLED: int = 1
+    USER_AVAILABILITY_KEY: str = "user:availability"
+    USER_AVAILABILITY_SIZE: int = 16777216
+    USER_AVAILABILITY_HASHES: int = 7
+    USER_AVAILABILITY_INTERVAL: float = 3600.0
+    USER_AVAILABILITY_BATCH_SIZE: int = 10000
+
+    IDEMPOTENCY_ENABLED: int = 1
+    IDEMPOTENCY_PREFIX: str = "idempotency"
+    IDEMPOTENCY_TTL: int = 86400
+    IDEMPOTENCY_LOCK_TTL: float = 10.0
+
     def __get_database_url__(self, dbname: str, engine: str) -> str:
         return  f"postgresql+{engine}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{dbname}"
 
+    @property
+    def DATABASE_DSN(self) -> str:
+        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
     @property
     def DATABASE_URL_SYNC(self) -> str:
         return self.__get_database_url__(self.DB_NAME, "psycopg2")
@@ -0,0 +1,25 @@
+from typing import Callable
+
+
+type MetricsSnapshot = dict[str, float | int]
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._sources: dict[str, Callable[[], MetricsSnapshot]] = {}
+
+
+    def register(self, name: str, source: Callable[[], MetricsSnapshot]) -> None:
+        self._sources[name] = source
+
+
+    def unregister(self, name: str) -> None:
+        self._sources.pop(name, None)
+
+
+    def snapshot(self) -> dict[str, MetricsSnapshot]:
+        return {name: source() for name, source in self._sources.items()}
+
+
+metrics = MetricsRegistry()
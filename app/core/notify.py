@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+import asyncpg
+
+from sqlalchemy import DDL, MetaData, event
+
+from app.core.cache import LocalCache, cache
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+NOTIFY_FUNCTION_NAME = "notify_row_change"
+
+NOTIFY_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION {NOTIFY_FUNCTION_NAME}() RETURNS trigger AS $$
+DECLARE
+    row_id integer;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_id := OLD.id;
+    ELSE
+        row_id := NEW.id;
+    END IF;
+
+    PERFORM pg_notify(
+        TG_ARGV[0],
+        json_build_object('table', TG_TABLE_NAME, 'id', row_id, 'op', TG_OP)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def get_trigger_sql(table_name: str, channel: str = settings.CACHE_NOTIFY_CHANNEL) -> list[str]:
+    return [
+        f'DROP TRIGGER IF EXISTS "{table_name}_notify_change" ON "{table_name}"',
+        f'CREATE TRIGGER "{table_name}_notify_change" '
+        f'AFTER INSERT OR UPDATE OR DELETE ON "{table_name}" '
+        f"FOR EACH ROW EXECUTE FUNCTION {NOTIFY_FUNCTION_NAME}('{channel}')",
+    ]
+
+
+def register_change_triggers(metadata: MetaData) -> None:
+    event.listen(metadata, "before_create", DDL(NOTIFY_FUNCTION_SQL).execute_if(dialect="postgresql"))
+
+    @event.listens_for(metadata, "after_create")
+    def create_triggers(target: MetaData, connection, **kwargs):
+        if connection.dialect.name != "postgresql":
+            return
+
+        for table in kwargs.get("tables") or target.sorted_tables:
+            if "id" not in table.columns or not table.info.get("notify", True):
+                continue
+
+            for statement in get_trigger_sql(table.name):
+                connection.exec_driver_sql(statement)
+
+
+class ChangeListener:
+
+    def __init__(self,
+            local_cache: LocalCache,
+            dsn: str,
+            channel: str,
+            reconnect_delay: float = 1.0,
+            reconnect_max_delay: float = 30.0,
+            heartbeat_interval: float = 15.0
+    ):
+        self.cache = local_cache
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.heartbeat_interval = heartbeat_interval
+
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[asyncpg.Connection] = None
+        self._lost: Optional[asyncio.Event] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        await self._close()
+
+
+    def handle_payload(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            table = change["table"]
+            obj_id = change.get("id")
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Malformed change notification, flushing cache: %r", payload)
+            self.cache.flush()
+            return
+
+        self.cache.invalidate(table, obj_id)
+
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.handle_payload(payload)
+
+
+    def _on_termination(self, connection: Any) -> None:
+        if self._lost is not None:
+            self._lost.set()
+
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        is_first_connect = True
+
+        while True:
+            try:
+                await self._listen()
+
+                # Notifications sent while the connection was down are lost,
+                # so everything cached before reconnecting may be stale.
+                if not is_first_connect:
+                    self.cache.flush()
+
+                is_first_connect = False
+                delay = self.reconnect_delay
+                await self._watch()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                logger.warning("Change listener connection lost: %s", error)
+
+            await self._close()
+            self.cache.flush()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_delay)
+
+
+    async def _listen(self) -> None:
+        self._lost = asyncio.Event()
+        self._connection = await asyncpg.connect(self.dsn)
+        self._connection.add_termination_listener(self._on_termination)
+        await self._connection.add_listener(self.channel, self._on_notification)
+
+
+    async def _watch(self) -> None:
+        while not self._lost.is_set():
+            try:
+                await asyncio.wait_for(self._lost.wait(), timeout=self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                await self._connection.fetchval("SELECT 1")
+
+        raise ConnectionError("Listener connection terminated")
+
+
+    async def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None or connection.is_closed():
+            return
+
+        try:
+            await connection.close(timeout=5)
+        except Exception:
+            connection.terminate()
+
+
+change_listener = ChangeListener(
+    cache,
+    settings.DATABASE_DSN,
+    settings.CACHE_NOTIFY_CHANNEL,
+    settings.CACHE_NOTIFY_RECONNECT_DELAY,
+    settings.CACHE_NOTIFY_RECONNECT_MAX_DELAY,
+    settings.CACHE_NOTIFY_HEARTBEAT_INTERVAL,
+)
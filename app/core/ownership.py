@@ -0,0 +1,339 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Optional
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+
+logger = logging.getLogger(__name__)
+
+
+type CommandHandler = Callable[[str, str, dict[str, Any]], Awaitable[dict[str, Any]]]
+type EvictHandler = Callable[[str], None]
+
+
+CLAIM_SCRIPT = """
+local owner = redis.call('GET', KEYS[1])
+if not owner then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return ARGV[1]
+end
+if owner == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return owner
+"""
+
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class OwnershipCoordinator:
+
+    def __init__(self,
+            redis: Redis,
+            prefix: str,
+            lease_ttl: float = 10.0,
+            command_timeout: float = 5.0,
+            idle_timeout: float = 300.0,
+            block_timeout: float = 1.0,
+            stream_size: int = 1000,
+            stream_ttl: int = 60,
+            concurrency: int = 100,
+            worker_id: Optional[str] = None
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.lease_ttl = lease_ttl
+        self.command_timeout = command_timeout
+        self.idle_timeout = idle_timeout
+        self.block_timeout = block_timeout
+        self.stream_size = stream_size
+        self.stream_ttl = stream_ttl
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+        self._handlers: dict[str, tuple[CommandHandler, Optional[EvictHandler]]] = {}
+        self._leases: dict[str, float] = {}
+        self._last_used: dict[str, float] = {}
+        self._replies: dict[str, asyncio.Future] = {}
+        self._slots = asyncio.Semaphore(concurrency)
+        self._commands: set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._renew_task: Optional[asyncio.Task] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    @property
+    def lease_ms(self) -> int:
+        return int(self.lease_ttl * 1000)
+
+
+    def get_lease_key(self, resource: str) -> str:
+        return f"{self.prefix}:lease:{resource}"
+
+
+    def get_command_stream(self, worker_id: str) -> str:
+        return f"{self.prefix}:commands:{worker_id}"
+
+
+    def get_reply_stream(self, worker_id: str) -> str:
+        return f"{self.prefix}:replies:{worker_id}"
+
+
+    def register(self, namespace: str, handler: CommandHandler, evict: Optional[EvictHandler] = None) -> None:
+        self._handlers[namespace] = (handler, evict)
+
+
+    def owns(self, namespace: str, resource_id: Any) -> bool:
+        expires_at = self._leases.get(f"{namespace}:{resource_id}")
+        return expires_at is not None and expires_at > time.monotonic()
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+        self._renew_task = asyncio.create_task(self._renew())
+
+
+    async def stop(self) -> None:
+        for task in (self._task, self._renew_task):
+            if task is None:
+                continue
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = self._renew_task = None
+
+        for task in list(self._commands):
+            task.cancel()
+        await asyncio.gather(*self._commands, return_exceptions=True)
+
+        for future in self._replies.values():
+            future.cancel()
+        self._replies.clear()
+
+        for resource in list(self._leases):
+            await self.release(resource)
+
+        try:
+            await self.redis.delete(self.get_command_stream(self.worker_id), self.get_reply_stream(self.worker_id))
+        except Exception as error:
+            logger.warning("Failed to remove ownership streams: %s", error)
+
+
+    async def claim(self, resource: str) -> str:
+        if self._leases.get(resource, 0) > time.monotonic() + self.lease_ttl / 2:
+            return self.worker_id
+
+        owner = await self.redis.eval(CLAIM_SCRIPT, 1, self.get_lease_key(resource), self.worker_id, self.lease_ms)
+        if owner == self.worker_id:
+            if resource not in self._leases:
+                self._evict(resource)
+
+            self._leases[resource] = time.monotonic() + self.lease_ttl
+            self._last_used[resource] = time.monotonic()
+        elif resource in self._leases:
+            self._lose(resource)
+
+        return owner
+
+
+    async def release(self, resource: str) -> None:
+        self._lose(resource)
+        try:
+            await self.redis.eval(RELEASE_SCRIPT, 1, self.get_lease_key(resource), self.worker_id)
+        except Exception as error:
+            logger.warning("Failed to release lease for '%s': %s", resource, error)
+
+
+    async def execute(self, namespace: str, resource_id: Any, command: str, payload: dict[str, Any]) -> dict[str, Any]:
+        await self.start()
+
+        resource = f"{namespace}:{resource_id}"
+        owner = await self.claim(resource)
+        if owner == self.worker_id:
+            self._last_used[resource] = time.monotonic()
+            handler, _ = self._handlers[namespace]
+            return await handler(str(resource_id), command, payload)
+
+        return await self._forward(owner, resource, command, payload)
+
+
+    async def _forward(self, owner: str, resource: str, command: str, payload: dict[str, Any]) -> dict[str, Any]:
+        request_id = uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._replies[request_id] = future
+
+        try:
+            await self._send(self.get_command_stream(owner), {
+                "id": request_id,
+                "reply_to": self.worker_id,
+                "resource": resource,
+                "command": command,
+                "payload": json.dumps(payload),
+            })
+            reply = await asyncio.wait_for(future, self.command_timeout)
+        finally:
+            self._replies.pop(request_id, None)
+
+        if "error" in reply:
+            raise HTTPException(status_code=reply["error"]["status_code"], detail=reply["error"]["detail"])
+
+        return reply["result"]
+
+
+    async def _send(self, stream: str, fields: dict[str, str]) -> None:
+        # Streams of a worker that died without stop() expire instead of lingering forever
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.xadd(stream, fields, maxlen=self.stream_size, approximate=True)
+            pipeline.expire(stream, self.stream_ttl)
+            await pipeline.execute()
+
+
+    async def _dispatch(self, fields: dict[str, str]) -> None:
+        try:
+            await self._handle_command(fields)
+        except Exception as error:
+            logger.warning("Failed to reply to command '%s': %s", fields.get("id"), error)
+        finally:
+            self._slots.release()
+
+
+    async def _handle_command(self, fields: dict[str, str]) -> None:
+        resource = fields["resource"]
+        namespace, _, resource_id = resource.partition(":")
+
+        try:
+            owner = await self.claim(resource)
+            if owner != self.worker_id:
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Ownership moved, retry")
+
+            self._last_used[resource] = time.monotonic()
+            handler, _ = self._handlers[namespace]
+            reply = {"result": await handler(resource_id, fields["command"], json.loads(fields["payload"]))}
+
+        except HTTPException as error:
+            reply = {"error": {"status_code": error.status_code, "detail": error.detail}}
+
+        except Exception as error:
+            logger.exception("Command '%s' for '%s' failed", fields.get("command"), resource)
+            reply = {"error": {"status_code": status.HTTP_500_INTERNAL_SERVER_ERROR, "detail": str(error)}}
+
+        await self._send(self.get_reply_stream(fields["reply_to"]), {"id": fields["id"], "reply": json.dumps(reply)})
+
+
+    def _handle_reply(self, fields: dict[str, str]) -> None:
+        future = self._replies.get(fields["id"])
+        if future is not None and not future.done():
+            future.set_result(json.loads(fields["reply"]))
+
+
+    async def _run(self) -> None:
+        commands = self.get_command_stream(self.worker_id)
+        replies = self.get_reply_stream(self.worker_id)
+        streams = {commands: "0-0", replies: "0-0"}
+
+        while True:
+            try:
+                response = await self.redis.xread(streams, count=100, block=int(self.block_timeout * 1000))
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("Ownership stream read failed: %s", error)
+                await asyncio.sleep(self.block_timeout)
+                continue
+
+            for stream, messages in response or ():
+                for message_id, fields in messages:
+                    streams[stream] = message_id
+                    if stream == replies:
+                        self._handle_reply(fields)
+                        continue
+
+                    # Each command runs on its own so a slow handler does not stall the stream, the semaphore bounds them
+                    await self._slots.acquire()
+                    task = asyncio.create_task(self._dispatch(fields))
+                    self._commands.add(task)
+                    task.add_done_callback(self._commands.discard)
+
+                try:
+                    await self.redis.xtrim(stream, minid=streams[stream], approximate=False)
+                except Exception as error:
+                    logger.warning("Failed to trim ownership stream '%s': %s", stream, error)
+
+
+    async def _renew(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+
+            for resource in list(self._leases):
+                if time.monotonic() - self._last_used.get(resource, 0) > self.idle_timeout:
+                    await self.release(resource)
+                    continue
+
+                try:
+                    renewed = await self.redis.eval(RENEW_SCRIPT, 1, self.get_lease_key(resource), self.worker_id, self.lease_ms)
+                except Exception as error:
+                    logger.warning("Failed to renew lease for '%s': %s", resource, error)
+                    continue
+
+                if renewed:
+                    self._leases[resource] = time.monotonic() + self.lease_ttl
+                else:
+                    self._lose(resource)
+
+
+    def _lose(self, resource: str) -> None:
+        self._last_used.pop(resource, None)
+        if self._leases.pop(resource, None) is not None:
+            self._evict(resource)
+
+
+    def _evict(self, resource: str) -> None:
+        namespace, _, resource_id = resource.partition(":")
+        _, evict = self._handlers.get(namespace, (None, None))
+        if evict is not None:
+            evict(resource_id)
+
+
+ownership = OwnershipCoordinator(
+    RedisClient,
+    settings.OWNERSHIP_PREFIX,
+    settings.OWNERSHIP_LEASE_TTL,
+    settings.OWNERSHIP_COMMAND_TIMEOUT,
+    settings.OWNERSHIP_IDLE_TIMEOUT,
+    settings.OWNERSHIP_BLOCK_TIMEOUT,
+    settings.OWNERSHIP_STREAM_SIZE,
+    settings.OWNERSHIP_STREAM_TTL,
+    settings.OWNERSHIP_CONCURRENCY,
+)
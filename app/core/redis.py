@@ -8,3 +8,10 @@ RedisClient = Redis(
     db=settings.REDIS_DB,
     decode_responses=True
 )
+
+RedisBytesClient = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    decode_responses=False
+)
@@ -0,0 +1,112 @@
+import json
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Request, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.shared.components.idempotency import idempotency
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONSerializer:
+
+    _adapters: dict[Any, TypeAdapter] = {}
+
+
+    @staticmethod
+    def dumps(content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+    @classmethod
+    def get_adapter(cls, annotation: Any) -> TypeAdapter:
+        adapter = cls._adapters.get(annotation)
+        if adapter is None:
+            adapter = TypeAdapter(annotation)
+            cls._adapters[annotation] = adapter
+
+        return adapter
+
+
+    @classmethod
+    def dump_model(cls, annotation: Any, content: Any) -> bytes:
+        adapter = cls.get_adapter(annotation)
+        value = adapter.validate_python(content, from_attributes=True)
+        return adapter.dump_json(value)
+
+
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        return JSONSerializer.dumps(content)
+
+
+def trusted_endpoint(endpoint: Callable, response_model: Any, status_code: Optional[int] = None) -> Callable:
+    if getattr(endpoint, "__trusted__", False) or not iscoroutinefunction(endpoint):
+        return endpoint
+
+    JSONSerializer.get_adapter(response_model)
+
+    @wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        content = await endpoint(*args, **kwargs)
+        if isinstance(content, Response):
+            return content
+
+        response = Response(
+            content=JSONSerializer.dump_model(response_model, content),
+            status_code=status_code or 200,
+            media_type="application/json",
+        )
+
+        for value in kwargs.values():
+            if not isinstance(value, Response):
+                continue
+
+            response.headers.raw.extend(value.headers.raw)
+            if value.status_code:
+                response.status_code = value.status_code
+
+        return response
+
+    wrapper.__trusted__ = True
+    return wrapper
+
+
+class TrustedRoute(APIRoute):
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        self.idempotency_scope = getattr(endpoint, "__idempotent__", None)
+
+        response_model = kwargs.get("response_model")
+        if settings.TRUSTED_SERIALIZATION and response_model is not None and not isinstance(response_model, DefaultPlaceholder):
+            endpoint = trusted_endpoint(endpoint, response_model, kwargs.get("status_code"))
+
+        super().__init__(path, endpoint, **kwargs)
+
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        if self.idempotency_scope is None:
+            return handler
+
+        return idempotency.wrap(self.idempotency_scope, handler)
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+
+logger = logging.getLogger(__name__)
+
+
+type TimerHandler = Callable[[list[str]], Awaitable[None]]
+
+
+CLAIM_SCRIPT = """
+local claimed = {}
+for index = 2, #ARGV do
+    local score = redis.call('ZSCORE', KEYS[1], ARGV[index])
+    if score and tonumber(score) <= tonumber(ARGV[1]) then
+        redis.call('ZREM', KEYS[1], ARGV[index])
+        table.insert(claimed, ARGV[index])
+    end
+end
+return claimed
+"""
+
+
+class Timer:
+
+    __slots__ = ("kind", "key", "deadline", "persist", "tick")
+
+    def __init__(self, kind: str, key: str, deadline: float, persist: bool = True):
+        self.kind = kind
+        self.key = key
+        self.deadline = deadline
+        self.persist = persist
+        self.tick = 0
+
+
+    @property
+    def member(self) -> str:
+        return f"{self.kind}:{self.key}"
+
+
+class TimerWheel:
+
+    def __init__(self, tick: float = 1.0, size: int = 512, now: Optional[float] = None):
+        self.tick = tick
+        self.size = size
+        self.slots: list[dict[str, Timer]] = [{} for _ in range(size)]
+        self.timers: dict[str, Timer] = {}
+        self.cursor = int((time.time() if now is None else now) // tick)
+
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+
+    def __contains__(self, member: str) -> bool:
+        return member in self.timers
+
+
+    def get(self, member: str) -> Optional[Timer]:
+        return self.timers.get(member)
+
+
+    def add(self, timer: Timer) -> None:
+        self.remove(timer.member)
+
+        timer.tick = max(math.ceil(timer.deadline / self.tick), self.cursor + 1)
+        self.slots[timer.tick % self.size][timer.member] = timer
+        self.timers[timer.member] = timer
+
+
+    def remove(self, member: str) -> Optional[Timer]:
+        timer = self.timers.pop(member, None)
+        if timer is not None:
+            del self.slots[timer.tick % self.size][member]
+
+        return timer
+
+
+    def advance(self, now: float) -> list[Timer]:
+        target = int(now // self.tick)
+        due = []
+
+        for tick in range(self.cursor + 1, min(target, self.cursor + self.size) + 1):
+            slot = self.slots[tick % self.size]
+            expired = [timer for timer in slot.values() if timer.tick <= target]
+            for timer in expired:
+                del slot[timer.member]
+                del self.timers[timer.member]
+
+            due.extend(expired)
+
+        self.cursor = max(self.cursor, target)
+        return due
+
+
+class Scheduler:
+
+    def __init__(self,
+            redis: Redis,
+            key: str,
+            tick: float = 1.0,
+            wheel_size: int = 512,
+            batch_size: int = 500,
+            recovery_interval: float = 30.0
+    ):
+        self.redis = redis
+        self.key = key
+        self.tick = tick
+        self.batch_size = batch_size
+        self.recovery_interval = recovery_interval
+        self.wheel = TimerWheel(tick, wheel_size)
+
+        self._handlers: dict[str, TimerHandler] = {}
+        self._pending: dict[str, Optional[float]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    def register(self, kind: str, handler: TimerHandler) -> None:
+        self._handlers[kind] = handler
+
+
+    def schedule(self, kind: str, key: Any, delay: float, persist: bool = True) -> Timer:
+        timer = Timer(kind, str(key), time.time() + delay, persist)
+        self.wheel.add(timer)
+        if persist:
+            self._pending[timer.member] = timer.deadline
+
+        return timer
+
+
+    def cancel(self, kind: str, key: Any) -> bool:
+        member = f"{kind}:{key}"
+        self._pending[member] = None
+        return self.wheel.remove(member) is not None
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception as error:
+            logger.warning("Failed to persist %s pending timers: %s", len(self._pending), error)
+
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        scheduled = {member: deadline for member, deadline in pending.items() if deadline is not None}
+        cancelled = [member for member, deadline in pending.items() if deadline is None]
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                if scheduled:
+                    pipeline.zadd(self.key, scheduled)
+                if cancelled:
+                    pipeline.zrem(self.key, *cancelled)
+                await pipeline.execute()
+        except Exception:
+            for member, deadline in pending.items():
+                self._pending.setdefault(member, deadline)
+            raise
+
+
+    async def fire(self, timers: list[Timer], now: float) -> int:
+        members = [timer.member for timer in timers if not timer.persist]
+        persisted = [timer.member for timer in timers if timer.persist]
+        if persisted:
+            members.extend(await self._claim(persisted, now))
+
+        await self._dispatch(members)
+        return len(members)
+
+
+    async def recover(self, now: float) -> int:
+        members = await self.redis.zrangebyscore(self.key, "-inf", now, start=0, num=self.batch_size)
+        if not members:
+            return 0
+
+        claimed = await self._claim(members, now)
+        for member in claimed:
+            self.wheel.remove(member)
+
+        await self._dispatch(claimed)
+        return len(claimed)
+
+
+    async def _claim(self, members: list[str], now: float) -> list[str]:
+        claimed = []
+        for index in range(0, len(members), self.batch_size):
+            chunk = members[index:index + self.batch_size]
+            claimed.extend(await self.redis.eval(CLAIM_SCRIPT, 1, self.key, now, *chunk))
+
+        return claimed
+
+
+    async def _dispatch(self, members: list[str]) -> None:
+        batches: dict[str, list[str]] = {}
+        for member in members:
+            kind, _, key = member.partition(":")
+            batches.setdefault(kind, []).append(key)
+
+        for kind, keys in batches.items():
+            handler = self._handlers.get(kind)
+            if handler is None:
+                logger.warning("No handler for %s '%s' timers", len(keys), kind)
+                continue
+
+            for index in range(0, len(keys), self.batch_size):
+                try:
+                    await handler(keys[index:index + self.batch_size])
+                except Exception:
+                    logger.exception("Timer handler '%s' failed", kind)
+
+
+    async def _run(self) -> None:
+        next_recovery = 0.0
+
+        while True:
+            now = time.time()
+
+            try:
+                await self.flush()
+
+                due = self.wheel.advance(now)
+                if due:
+                    await self.fire(due, now)
+
+                if now >= next_recovery:
+                    await self.recover(now)
+                    next_recovery = now + self.recovery_interval
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("Scheduler tick failed: %s", error)
+
+            await asyncio.sleep(max(self.tick - (time.time() - now), 0))
+
+
+scheduler = Scheduler(
+    RedisClient,
+    settings.SCHEDULER_KEY,
+    settings.SCHEDULER_TICK,
+    settings.SCHEDULER_WHEEL_SIZE,
+    settings.SCHEDULER_BATCH_SIZE,
+    settings.SCHEDULER_RECOVERY_INTERVAL,
+)
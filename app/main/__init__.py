@@ -1,8 +1,67 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api.v1.routes import api_router
+from app.core.broadcast import broadcaster
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.notify import change_listener
+from app.core.ownership import ownership
+from app.core.responses import FastJSONResponse
+from app.core.scheduler import scheduler
+from app.modules.auth.user.availability import availability_filter
+from app.modules.lobby.archive.archiver import archiver
+from app.modules.lobby.draft.engine import draft_engine
+from app.modules.lobby.events.writer import event_writer
+from app.modules.lobby.lobby.enums import LobbyTimer
+from app.modules.lobby.lobby.services.expiry import close_idle_lobbies
+from app.modules.lobby.matchmaking.matcher import matchmaker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.CACHE_ENABLED:
+        await change_listener.start()
+
+    if settings.SCHEDULER_ENABLED:
+        scheduler.register(LobbyTimer.IDLE, close_idle_lobbies)
+        await scheduler.start()
+
+    if settings.LOBBY_EVENT_LOG_ENABLED:
+        await event_writer.start()
+
+    if settings.LOBBY_ARCHIVE_ENABLED:
+        await archiver.start()
 
+    if settings.MATCHMAKING_ENABLED:
+        await matchmaker.start()
 
-app = FastAPI(title=settings.PROJECT_NAME)
+    if settings.USER_AVAILABILITY_ENABLED:
+        await availability_filter.start()
+
+    yield
+
+    await availability_filter.stop()
+    await matchmaker.stop()
+    await archiver.stop()
+    await scheduler.stop()
+    await event_writer.stop()
+    await draft_engine.stop()
+    await ownership.stop()
+    await broadcaster.stop()
+    await change_listener.stop()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan, default_response_class=FastJSONResponse)
 app.include_router(api_router, prefix="/api/v1")
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        level=settings.COMPRESSION_LEVEL,
+        cpu_budget=settings.COMPRESSION_CPU_BUDGET,
+        cpu_window=settings.COMPRESSION_CPU_WINDOW,
+        cache_size=settings.COMPRESSION_CACHE_SIZE,
+    )
@@ -7,7 +7,7 @@ from app.core.base.model import Base
 class Token(Base):
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
     token = Column(String, nullable=False)
     token_type = Column(String, nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,225 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.metrics import MetricsSnapshot, metrics
+from app.core.redis import RedisBytesClient
+from app.core.session import SessionLocal
+
+from app.modules.auth.user.crud import UserCRUD
+
+
+logger = logging.getLogger(__name__)
+
+
+CHECK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local hashes = tonumber(ARGV[1])
+for index = 2, #ARGV, hashes do
+    local found = 1
+    for offset = 0, hashes - 1 do
+        if redis.call('GETBIT', KEYS[1], ARGV[index + offset]) == 0 then
+            found = 0
+            break
+        end
+    end
+    if found == 1 then
+        return 1
+    end
+end
+return 0
+"""
+
+ADD_SCRIPT = """
+local exists = redis.call('EXISTS', KEYS[1]) == 1
+for index = 1, #ARGV do
+    if exists then
+        redis.call('SETBIT', KEYS[1], ARGV[index], 1)
+    end
+    redis.call('SETBIT', KEYS[2], ARGV[index], 1)
+end
+return #ARGV
+"""
+
+SWAP_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('BITOP', 'OR', KEYS[1], KEYS[1], KEYS[2])
+end
+redis.call('RENAME', KEYS[1], KEYS[3])
+return 1
+"""
+
+
+class UserAvailabilityFilter:
+
+    def __init__(self,
+            redis: Redis,
+            session_factory: Callable[[], AsyncSession],
+            key: str,
+            size: int = 16777216,
+            hashes: int = 7,
+            interval: float = 3600.0,
+            batch_size: int = 10000,
+            enabled: bool = True
+    ):
+        self.redis = redis
+        self.session_factory = session_factory
+        self.key = key
+        self.size = size
+        self.hashes = hashes
+        self.interval = interval
+        self.batch_size = batch_size
+        self.enabled = enabled
+
+        self.checks = 0
+        self.available = 0
+        self.rebuilds = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    @property
+    def journal_key(self) -> str:
+        return f"{self.key}:journal"
+
+
+    @property
+    def build_key(self) -> str:
+        return f"{self.key}:build"
+
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.key}:lock"
+
+
+    @staticmethod
+    def get_members(username: Optional[str], email: Optional[str]) -> list[str]:
+        members = []
+        if username:
+            members.append(f"username:{username}")
+        if email:
+            members.append(f"email:{email}")
+
+        return members
+
+
+    def get_positions(self, members: list[str]) -> list[int]:
+        return [position for member in members for position in BloomFilter.hash(member, self.size, self.hashes)]
+
+
+    async def is_available(self, username: Optional[str], email: Optional[str]) -> bool:
+        members = self.get_members(username, email)
+        if not self.enabled or not members:
+            return False
+
+        self.checks += 1
+        try:
+            found = await self.redis.eval(CHECK_SCRIPT, 1, self.key, self.hashes, *self.get_positions(members))
+        except Exception as error:
+            logger.warning("User availability check failed: %s", error)
+            return False
+
+        if found == 0:
+            self.available += 1
+            return True
+
+        return False
+
+
+    async def add(self, username: Optional[str], email: Optional[str]) -> None:
+        members = self.get_members(username, email)
+        if not self.enabled or not members:
+            return
+
+        try:
+            await self.redis.eval(ADD_SCRIPT, 2, self.key, self.journal_key, *self.get_positions(members))
+        except Exception as error:
+            logger.warning("Failed to add user to availability filter, dropping it: %s", error)
+            try:
+                await self.redis.delete(self.key)
+            except Exception:
+                pass
+
+
+    async def rebuild(self) -> bool:
+        if not await self.redis.set(self.lock_key, 1, nx=True, px=int(self.interval * 1000)):
+            return False
+
+        await self.redis.delete(self.journal_key)
+
+        bloom = BloomFilter(self.size, self.hashes)
+        count = 0
+        async with self.session_factory() as db:
+            async for username, email in UserCRUD(db).stream_identities(self.batch_size):
+                for member in self.get_members(username, email):
+                    bloom.add(member)
+                count += 1
+
+        await self.redis.set(self.build_key, bytes(bloom.data))
+        await self.redis.eval(SWAP_SCRIPT, 3, self.build_key, self.journal_key, self.key)
+
+        self.rebuilds += 1
+        logger.info("Rebuilt user availability filter from %s users", count)
+        return True
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+    def snapshot(self) -> MetricsSnapshot:
+        return {"checks": self.checks, "available": self.available, "rebuilds": self.rebuilds}
+
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("User availability filter rebuild failed: %s", error)
+
+            await asyncio.sleep(self.interval)
+
+
+availability_filter = UserAvailabilityFilter(
+    RedisBytesClient,
+    SessionLocal,
+    settings.USER_AVAILABILITY_KEY,
+    settings.USER_AVAILABILITY_SIZE,
+    settings.USER_AVAILABILITY_HASHES,
+    settings.USER_AVAILABILITY_INTERVAL,
+    settings.USER_AVAILABILITY_BATCH_SIZE,
+    bool(settings.USER_AVAILABILITY_ENABLED),
+)
+
+metrics.register("user_availability", availability_filter.snapshot)
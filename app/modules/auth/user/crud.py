@@ -1,4 +1,8 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import Column, Row, collate, exists, false, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import ColumnElement
 
 from app.modules.auth.user.models import User
 from app.modules.auth.user.enums import UserRole
@@ -9,7 +13,6 @@ from app.shared.components.filters import FilterField
 
 
 type UserExistType = tuple[bool, bool]
-type UserTupleType = tuple[User, User]
 type UserModelOrScheme = User | UserCreate | UserUpdateSecure | UserUpdate
 
 
@@ -27,12 +30,47 @@ class UserCRUD(BaseCRUD[User]):
         super().__init__(db, User)
 
 
-    async def get_by_username_email(self, user: UserModelOrScheme) -> UserTupleType:
-        user_by_username = await self.get_by_key_value("username", user.username)
-        user_by_email = await self.get_by_key_value("email", user.email)
-        return user_by_username, user_by_email
+    async def suggest(self, prefix: str, limit: int) -> list[Row]:
+        username = func.lower(collate(User.username, "C"))
+        pattern = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+        result = await self.db.execute(
+            select(User.id, User.username)
+            .where(username.like(pattern, escape="\\"))
+            .order_by(username)
+            .limit(limit)
+        )
+        return result.all()
+
+
+    @staticmethod
+    def is_taken(column: Column, value: Optional[str], exclude_id: Optional[int] = None) -> ColumnElement[bool]:
+        if value is None:
+            return false()
+
+        conditions = [column == value]
+        if exclude_id is not None:
+            conditions.append(User.id != exclude_id)
+
+        return exists().where(*conditions)
+
+
+    async def is_exist(self, user: UserModelOrScheme, exclude_id: Optional[int] = None) -> UserExistType:
+        result = await self.db.execute(
+            select(
+                self.is_taken(User.username, user.username, exclude_id),
+                self.is_taken(User.email, user.email, exclude_id),
+            )
+        )
+
+        username_exists, email_exists = result.one()
+        return username_exists, email_exists
+
 
+    async def stream_identities(self, batch_size: int) -> AsyncIterator[tuple[str, str]]:
+        result = await self.db.stream(
+            select(User.username, User.email).execution_options(yield_per=batch_size)
+        )
 
-    async def is_exist(self, user: UserModelOrScheme) -> UserExistType:
-        user_by_username, user_by_email = await self.get_by_username_email(user)
-        return user_by_username is not None, user_by_email is not None
+        async for username, email in result:
+            yield username, email
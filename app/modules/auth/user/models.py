@@ -1,6 +1,6 @@
 from typing import Self
 
-from sqlalchemy import Column, Integer, String, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Index, Integer, String, Enum as SQLAlchemyEnum, text
 from sqlalchemy.orm import relationship
 
 from app.core.base.model import Base
@@ -21,7 +21,8 @@ class User(Base):
     email = Column(String, nullable=False, unique=True)
     password = Column(String, nullable=False)
     
-    role = Column(SQLAlchemyEnum(UserRole), nullable=False, default=UserRole.USER)
+    role = Column(SQLAlchemyEnum(UserRole), nullable=False, default=UserRole.USER, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     tokens = relationship("Token", back_populates="user", cascade="all, delete-orphan")
     data = relationship("UserData", back_populates="user", cascade="all, delete-orphan", lazy="selectin", uselist=False, passive_deletes=True)
@@ -30,6 +31,11 @@ class User(Base):
     lobbies = relationship("Lobby", back_populates="host", cascade="all, delete-orphan")
     algorithms = relationship("Algorithm", back_populates="creator", cascade="all, delete-orphan")
 
+    # "C" collation lets one btree serve both the prefix match and the ordering of suggestions
+    __table_args__ = (
+        Index("ix_user_username_prefix", text('lower(username::text COLLATE "C")')),
+    )
+
     @classmethod
     def from_create(cls, user_create: UserScheme) -> Self:
         dump = user_create.model_dump(exclude={"data"})
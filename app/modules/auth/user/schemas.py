@@ -8,6 +8,11 @@ from app.modules.auth.user.validators import UserValidator
 from app.modules.user.data.schemas import UserDataRead, UserDataCreate, UserDataUpdateSecure, UserDataUpdate
 
 
+class UserSuggestRead(BaseModel):
+    id: int
+    username: str
+
+
 class UserReadRegularNoData(BaseModel):
     id: int
     username: str
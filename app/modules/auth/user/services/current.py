@@ -2,7 +2,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.database import get_async_session
-from app.dependencies.oauth import get_oauth2_scheme
+from app.dependencies.oauth import get_oauth2_scheme, get_websocket_token
 
 from app.modules.auth.token.crud import TokenCRUD
 from app.modules.auth.token.exceptions import HTTPTokenExceptionInvalid, HTTPTokenExceptionExpired
@@ -24,9 +24,19 @@ class CurrentUserService(BaseService[User, TokenCRUD]):
         super().__init__(User, TokenCRUD, db)
         self.user_service = user_service
         self.token_str = token_str
+        self._users: dict[str, User] = {}
 
 
     async def get_by_token_type(self, token_type: str = "access") -> User:
+        user = self._users.get(token_type)
+        if user is None:
+            user = await self._load_by_token_type(token_type)
+            self._users[token_type] = user
+
+        return user
+
+
+    async def _load_by_token_type(self, token_type: str) -> User:
             
         try:
             username = TokenManager.get_username_from_token(self.token_str, token_type)
@@ -57,3 +67,12 @@ class CurrentUserService(BaseService[User, TokenCRUD]):
 
     async def get_refresh(self) -> User:
         return await self.get_by_token_type("refresh")
+
+
+class CurrentWebSocketUserService(CurrentUserService):
+    def __init__(self,
+            db: AsyncSession = Depends(get_async_session),
+            user_service: UserService = Depends(UserService),
+            token_str: str = Depends(get_websocket_token)
+    ):
+        super().__init__(db, user_service, token_str)
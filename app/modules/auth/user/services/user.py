@@ -2,24 +2,37 @@ from typing import Optional
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.database import get_async_session
 
 from app.modules.auth.token.services.user import UserTokenService, UserTokens
+from app.modules.auth.user.availability import UserAvailabilityFilter, availability_filter
 from app.modules.auth.user.crud import UserCRUD, UserExistType
-from app.modules.auth.user.exceptions import HTTPUserExceptionNoDataProvided, HTTPUserExceptionIncorrectFormData, HTTPUserExceptionUserDataMissing
+from app.modules.auth.user.exceptions import (
+    HTTPUserExceptionNoDataProvided,
+    HTTPUserExceptionIncorrectFormData,
+    HTTPUserExceptionUserDataMissing,
+    HTTPUserExceptionUsernameAlreadyExists,
+    HTTPUserExceptionEmailAlreadyExists,
+)
 from app.modules.auth.user.models import User
 from app.modules.auth.user.validators import UserValidator
-from app.modules.auth.user.schemas import UserCreate, UserUpdateSecure, UserUpdate
+from app.modules.auth.user.schemas import UserCreate, UserSuggestRead, UserUpdateSecure, UserUpdate
 
 from app.modules.user.data.services.data import UserDataService
 
 from app.core.base.service import BaseService
+from app.core.cache import LocalCache, cache
+from app.shared.components.etag import ETag
 
 
 class UserService(BaseService[User, UserCRUD]):
 
+    suggest_cache: LocalCache = cache
+    availability: UserAvailabilityFilter = availability_filter
+
     def __init__(self, 
             db: AsyncSession = Depends(get_async_session),
             user_token_service: UserTokenService = Depends(UserTokenService),
@@ -69,13 +82,62 @@ class UserService(BaseService[User, UserCRUD]):
         return None
 
 
-    async def is_exist(self, user: User) -> UserExistType:
-        return await self.crud.is_exist(user)
+    async def suggest(self, prefix: str, limit: int) -> list[UserSuggestRead]:
+        key = ("user_suggest", prefix.lower(), limit)
+        users = self.suggest_cache.get(key)
+        if users is not None:
+            return users
+
+        rows = await self.crud.suggest(prefix, limit)
+        users = [UserSuggestRead.model_validate(row, from_attributes=True) for row in rows]
+
+        self.suggest_cache.set(key, users, [(self.model.__tablename__, None)])
+        return users
+
+
+    async def get_etag_by_params(self,
+        user_id: Optional[int] = None,
+        username: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> Optional[str]:
+        params = [("id", user_id), ("username", username), ("email", email)]
+        for key, value in params:
+            if not value:
+                continue
+
+            version = await self.crud.get_version_by_key_value(key, value)
+            if version:
+                return ETag.build(self.model.__tablename__, [version])
+
+        return None
+
+
+    async def is_exist(self, user: User | UserCreate | UserUpdateSecure, exclude_id: Optional[int] = None) -> UserExistType:
+        if await self.availability.is_available(user.username, user.email):
+            return False, False
+
+        return await self.crud.is_exist(user, exclude_id)
+
+
+    async def raise_on_conflict(self, user: UserCreate | UserUpdateSecure | UserUpdate, exclude_id: Optional[int] = None) -> None:
+        await self.crud.db.rollback()
+
+        username_exists, email_exists = await self.crud.is_exist(user, exclude_id)
+        if username_exists:
+            raise HTTPUserExceptionUsernameAlreadyExists()
+        if email_exists:
+            raise HTTPUserExceptionEmailAlreadyExists()
 
 
     async def create(self, user: UserCreate) -> User:
-        new_user = User.from_create(user)
-        return await self.crud.create(new_user)
+        try:
+            new_user = await self.crud.create(User.from_create(user))
+        except IntegrityError:
+            await self.raise_on_conflict(user)
+            raise
+
+        await self.availability.add(user.username, user.email)
+        return new_user
 
 
     async def update(self,
@@ -83,14 +145,24 @@ class UserService(BaseService[User, UserCRUD]):
         update_data: UserUpdateSecure | UserUpdate,
     ) -> User:
         
+        user_id = user.id
         update_data = User.update_password(update_data)
-        updated_user = await self.crud.update(user, update_data, exclude={"data"})
+        try:
+            updated_user = await self.crud.update(user, update_data, exclude={"data"})
+        except IntegrityError:
+            await self.raise_on_conflict(update_data, user_id)
+            raise
+
+        if updated_user:
+            await self.availability.add(update_data.username, update_data.email)
         if not updated_user and not update_data.data:
             raise HTTPUserExceptionNoDataProvided("No update data provided")
         
         if update_data.data:
             if user.data:
                 await self.user_data_service.update(user.data, update_data.data)
+                if not updated_user:
+                    await self.crud.touch(user)
             else:
                 raise HTTPUserExceptionUserDataMissing("User has no available data for update")
 
@@ -0,0 +1,97 @@
+from typing import NamedTuple, Optional
+
+from app.core.cache import LocalCache
+from app.core.config import settings
+
+from app.modules.lobby.algorithm.enums import AlgorithmAction
+
+
+class AlgorithmStep(NamedTuple):
+    team_index: Optional[int]
+    action: AlgorithmAction
+
+
+class AlgorithmTeamCount(NamedTuple):
+    bans: int
+    picks: int
+
+
+class CompiledAlgorithm:
+    __slots__ = ("steps", "team_counts", "total_steps", "has_tiebreak")
+
+    def __init__(self, steps: tuple[AlgorithmStep, ...], team_counts: tuple[AlgorithmTeamCount, ...], has_tiebreak: bool):
+        self.steps = steps
+        self.team_counts = team_counts
+        self.total_steps = len(steps)
+        self.has_tiebreak = has_tiebreak
+
+
+class AlgorithmCompiler:
+
+    actions = frozenset(AlgorithmAction)
+    cache = LocalCache(settings.ALGORITHM_CACHE_SIZE)
+
+    _steps: dict[tuple[Optional[int], str], AlgorithmStep] = {}
+
+
+    @classmethod
+    def step(cls, team_index: Optional[int], action: str) -> AlgorithmStep:
+        key = (team_index, action)
+        step = cls._steps.get(key)
+        if step is None:
+            step = cls._steps[key] = AlgorithmStep(team_index, AlgorithmAction(action))
+
+        return step
+
+
+    @classmethod
+    def compile(cls, algorithm: str, teams_count: int) -> CompiledAlgorithm:
+        groups = algorithm.split()
+        last_index = len(groups) - 1
+        steps = []
+        bans = [0] * teams_count
+        picks = [0] * teams_count
+
+        for index, group in enumerate(groups):
+            if not cls.actions.issuperset(group):
+                raise ValueError(f"Step '{group}' containings incorrect symbols. Available only these: {', '.join(cls.actions)}.")
+
+            if group != AlgorithmAction.TIEBREAK and len(group) != teams_count:
+                raise ValueError(f"Size of the step '{group}' must be equal to teams count ({teams_count=}).")
+
+            if group == AlgorithmAction.TIEBREAK:
+                if index != last_index:
+                    raise ValueError("Step 'T' (tiebreak) can be only at the last step of algorithm.")
+
+                steps.append(cls.step(None, AlgorithmAction.TIEBREAK))
+                continue
+
+            if AlgorithmAction.TIEBREAK in group:
+                raise ValueError(f"Step 'T' must be separated from algorithm (step='{group}')")
+
+            for team_index, action in enumerate(group):
+                steps.append(cls.step(team_index, action))
+                if action == AlgorithmAction.BAN:
+                    bans[team_index] += 1
+                else:
+                    picks[team_index] += 1
+
+        return CompiledAlgorithm(
+            tuple(steps),
+            tuple(AlgorithmTeamCount(*counts) for counts in zip(bans, picks)),
+            bool(groups) and groups[-1] == AlgorithmAction.TIEBREAK,
+        )
+
+
+    @classmethod
+    def get(cls, algorithm_id: Optional[int], version: Optional[int], algorithm: str, teams_count: int) -> CompiledAlgorithm:
+        if algorithm_id is None or version is None:
+            return cls.compile(algorithm, teams_count)
+
+        key = (algorithm_id, version)
+        compiled = cls.cache.get(key)
+        if compiled is None:
+            compiled = cls.compile(algorithm, teams_count)
+            cls.cache.set(key, compiled)
+
+        return compiled
@@ -15,6 +15,10 @@ class AlgorithmCRUD(BaseCRUD[Algorithm]):
         "teams_count": FilterField(int)
     }
 
+    version_relations = ["creator"]
+
+    search_column = "search_vector"
+
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Algorithm)
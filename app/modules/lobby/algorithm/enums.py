@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class AlgorithmAction(StrEnum):
+    BAN         = "B"
+    PICK        = "P"
+    TIEBREAK    = "T"
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Index, Integer, String, ForeignKey
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.base.model import Base
+from app.modules.lobby.algorithm.compiler import AlgorithmCompiler, CompiledAlgorithm
+from app.shared.components.search import FullTextSearch
 
 class Algorithm(Base):
 
@@ -9,8 +12,21 @@ class Algorithm(Base):
     name = Column(String, nullable=False, unique=True)
     description = Column(String, nullable=True)
     algorithm = Column(String, nullable=False)
-    teams_count = Column(Integer, nullable=False, default=2)
-    creator_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    teams_count = Column(Integer, nullable=False, default=2, index=True)
+    creator_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    search_vector = deferred(Column(TSVECTOR, FullTextSearch.document("name", "description")))
 
     lobbies = relationship("Lobby", back_populates="algorithm")
     creator = relationship("User", back_populates="algorithms", lazy="selectin")
+
+    __table_args__ = (
+        Index("ix_algorithm_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    __field_columns__ = {"compiled": ("id", "version", "algorithm", "teams_count")}
+
+
+    @property
+    def compiled(self) -> CompiledAlgorithm:
+        return AlgorithmCompiler.get(self.id, self.version, self.algorithm, self.teams_count)
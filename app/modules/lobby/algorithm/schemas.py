@@ -3,6 +3,7 @@ from typing import Optional, Self
 from pydantic import BaseModel, model_validator, field_validator
 
 from app.modules.auth.user.schemas import UserReadRegular
+from app.modules.lobby.algorithm.enums import AlgorithmAction
 from app.modules.lobby.lobby.validators import LobbyValidator
 
 
@@ -40,12 +41,25 @@ class AlgorithmCreate(AlgorithmBase):
     pass
 
 
+class AlgorithmTeamCountRead(BaseModel):
+    bans: int
+    picks: int
+
+
+class AlgorithmCompiledRead(BaseModel):
+    steps: tuple[tuple[Optional[int], AlgorithmAction], ...]
+    team_counts: list[AlgorithmTeamCountRead]
+    total_steps: int
+    has_tiebreak: bool
+
+
 class AlgorithmReadSimple(BaseModel):
     id: int
     name: str
     description: Optional[str] = None
     algorithm: str
     teams_count: int
+    compiled: AlgorithmCompiledRead
 
 
 class AlgorithmRead(AlgorithmReadSimple):
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.session import SessionLocal
+
+from app.modules.lobby.archive.crud import LobbyArchiveCRUD
+
+
+logger = logging.getLogger(__name__)
+
+
+class LobbyArchiver:
+
+    def __init__(self,
+            session_factory: Callable[[], AsyncSession],
+            retention_days: int = 30,
+            interval: float = 3600.0,
+            batch_size: int = 500
+    ):
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._task: Optional[asyncio.Task] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+    async def archive(self, now: Optional[datetime] = None) -> int:
+        closed_before = (now or datetime.now(timezone.utc)) - timedelta(days=self.retention_days)
+        archived = 0
+
+        async with self.session_factory() as db:
+            crud = LobbyArchiveCRUD(db)
+            while True:
+                lobby_ids = await crud.archive_closed(closed_before, self.batch_size)
+                archived += len(lobby_ids)
+                if len(lobby_ids) < self.batch_size:
+                    break
+
+        if archived:
+            logger.info("Moved %s closed lobbies to the archive", archived)
+
+        return archived
+
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.archive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("Lobby archival failed: %s", error)
+
+            await asyncio.sleep(self.interval)
+
+
+archiver = LobbyArchiver(
+    SessionLocal,
+    settings.LOBBY_ARCHIVE_AFTER_DAYS,
+    settings.LOBBY_ARCHIVE_INTERVAL,
+    settings.LOBBY_ARCHIVE_BATCH_SIZE,
+)
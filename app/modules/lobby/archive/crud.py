@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import Insert
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.modules.lobby.archive.models import LobbyArchive, LobbyParticipantArchive, TeamArchive
+from app.modules.lobby.lobby.crud import LobbyCRUD
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.crud import LobbyParticipantCRUD
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.crud import TeamCRUD
+from app.modules.lobby.team.models import Team
+
+from app.core.base.crud import BaseCRUD
+from app.shared.db.base import Base
+
+
+class LobbyArchiveCRUD(BaseCRUD[LobbyArchive]):
+
+    default_filters = {key: value for key, value in LobbyCRUD.default_filters.items() if key not in ("status", "only_active")}
+
+    version_relations = LobbyCRUD.version_relations
+
+    search_column = LobbyCRUD.search_column
+
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, LobbyArchive)
+
+
+    async def archive_closed(self, closed_before: datetime, limit: int) -> list[int]:
+        result = await self.db.execute(
+            select(Lobby.id)
+            .filter(Lobby.status == LobbyStatus.ARCHIVED, Lobby.closed_at < closed_before)
+            .order_by(Lobby.closed_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        lobby_ids = list(result.scalars().all())
+        if not lobby_ids:
+            await self.db.rollback()
+            return []
+
+        try:
+            await self.db.execute(self.copy(Lobby, LobbyArchive, Lobby.id.in_(lobby_ids)))
+            await self.db.execute(self.copy(Team, TeamArchive, Team.lobby_id.in_(lobby_ids)))
+            await self.db.execute(self.copy(LobbyParticipant, LobbyParticipantArchive, LobbyParticipant.lobby_id.in_(lobby_ids)))
+
+            await self.db.execute(delete(LobbyParticipant).where(LobbyParticipant.lobby_id.in_(lobby_ids)))
+            await self.db.execute(delete(Team).where(Team.lobby_id.in_(lobby_ids)))
+            await self.db.execute(delete(Lobby).where(Lobby.id.in_(lobby_ids)))
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        await self.db.commit()
+        return lobby_ids
+
+
+    @staticmethod
+    def copy(source: type[Base], target: type[Base], condition: ColumnElement) -> Insert:
+        columns = [
+            column.name for column in source.__table__.columns
+            if column.name in target.__table__.columns and column.computed is None
+        ]
+
+        return (
+            insert(target)
+            .from_select(columns, select(*(source.__table__.c[name] for name in columns)).where(condition))
+        )
+
+
+class LobbyParticipantArchiveCRUD(BaseCRUD[LobbyParticipantArchive]):
+
+    default_filters = LobbyParticipantCRUD.default_filters
+
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, LobbyParticipantArchive)
+
+
+    def custom_filters(self, filters: dict[str, Any]) -> list[Any]:
+        conditions = []
+
+        if filters.get("all_db_participants") is False and "lobby_id" in filters:
+            conditions.append(LobbyParticipantArchive.lobby_id == filters["lobby_id"])
+
+        return conditions
+
+
+class TeamArchiveCRUD(BaseCRUD[TeamArchive]):
+
+    default_filters = TeamCRUD.default_filters
+
+    version_relations = TeamCRUD.version_relations
+
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, TeamArchive)
@@ -0,0 +1,60 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Enum as SQLAlchemyEnum, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+
+from app.core.base.model import Base
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
+from app.shared.components.search import FullTextSearch
+
+
+class LobbyArchive(Base):
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String, nullable=False)
+    description = Column(String, nullable=True)
+    host_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    algorithm_id = Column(Integer, ForeignKey("algorithm.id"), nullable=False, index=True)
+    status = Column(SQLAlchemyEnum(LobbyStatus), nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    closed_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    search_vector = deferred(Column(TSVECTOR, FullTextSearch.document("name", "description")))
+
+    host = relationship("User", lazy="selectin")
+    algorithm = relationship("Algorithm", lazy="selectin")
+    participants = relationship("LobbyParticipantArchive", back_populates="lobby")
+    teams = relationship("TeamArchive", back_populates="lobby")
+
+    __table_args__ = (
+        Index("ix_lobbyarchive_search_vector", "search_vector", postgresql_using="gin"),
+        {"info": {"notify": False}},
+    )
+
+
+class TeamArchive(Base):
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String, nullable=False)
+    lobby_id = Column(Integer, ForeignKey("lobbyarchive.id"), nullable=False, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    lobby = relationship("LobbyArchive", back_populates="teams", lazy="selectin")
+    participants = relationship("LobbyParticipantArchive", back_populates="team")
+
+    __table_args__ = {"info": {"notify": False}}
+
+
+class LobbyParticipantArchive(Base):
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    lobby_id = Column(Integer, ForeignKey("lobbyarchive.id"), nullable=False, index=True)
+    team_id = Column(Integer, ForeignKey("teamarchive.id"), nullable=True, index=True)
+    role = Column(SQLAlchemyEnum(LobbyParticipantRole), nullable=False, index=True)
+    is_active = Column(Boolean, nullable=False)
+
+    user = relationship("User", lazy="selectin")
+    lobby = relationship("LobbyArchive", back_populates="participants", lazy="selectin")
+    team = relationship("TeamArchive", back_populates="participants", lazy="selectin")
+
+    __table_args__ = {"info": {"notify": False}}
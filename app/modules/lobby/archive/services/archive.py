@@ -0,0 +1,27 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.database import get_async_session
+
+from app.modules.lobby.archive.crud import LobbyArchiveCRUD, LobbyParticipantArchiveCRUD, TeamArchiveCRUD
+from app.modules.lobby.archive.models import LobbyArchive, LobbyParticipantArchive, TeamArchive
+
+from app.core.base.service import BaseService
+
+
+class LobbyArchiveService(BaseService[LobbyArchive, LobbyArchiveCRUD]):
+
+    def __init__(self, db: AsyncSession = Depends(get_async_session)):
+        super().__init__(LobbyArchive, LobbyArchiveCRUD, db)
+
+
+class LobbyParticipantArchiveService(BaseService[LobbyParticipantArchive, LobbyParticipantArchiveCRUD]):
+
+    def __init__(self, db: AsyncSession = Depends(get_async_session)):
+        super().__init__(LobbyParticipantArchive, LobbyParticipantArchiveCRUD, db)
+
+
+class TeamArchiveService(BaseService[TeamArchive, TeamArchiveCRUD]):
+
+    def __init__(self, db: AsyncSession = Depends(get_async_session)):
+        super().__init__(TeamArchive, TeamArchiveCRUD, db)
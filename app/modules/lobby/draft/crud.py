@@ -0,0 +1,64 @@
+from typing import Optional
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.modules.lobby.algorithm.models import Algorithm
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
+
+
+class DraftCRUD:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+
+    async def get_lobby(self, lobby_id: int) -> Optional[Row]:
+        result = await self.db.execute(
+            select(
+                Lobby.id,
+                Lobby.host_id,
+                Lobby.status,
+                Lobby.algorithm_id,
+                Algorithm.version.label("algorithm_version"),
+                Algorithm.algorithm,
+                Algorithm.teams_count,
+            )
+            .join(Algorithm, Algorithm.id == Lobby.algorithm_id)
+            .filter(Lobby.id == lobby_id)
+        )
+
+        return result.first()
+
+
+    async def get_lobby_status(self, lobby_id: int) -> Optional[LobbyStatus]:
+        result = await self.db.execute(select(Lobby.status).filter(Lobby.id == lobby_id))
+        return result.scalar_one_or_none()
+
+
+    async def get_team_ids(self, lobby_id: int) -> list[int]:
+        result = await self.db.execute(
+            select(Team.id)
+            .filter(Team.lobby_id == lobby_id)
+            .order_by(Team.id)
+        )
+
+        return list(result.scalars().all())
+
+
+    async def get_players(self, lobby_id: int) -> dict[int, int]:
+        result = await self.db.execute(
+            select(LobbyParticipant.user_id, LobbyParticipant.team_id)
+            .filter(
+                LobbyParticipant.lobby_id == lobby_id,
+                LobbyParticipant.is_active.is_(True),
+                LobbyParticipant.role == LobbyParticipantRole.PLAYER,
+                LobbyParticipant.team_id.is_not(None),
+            )
+        )
+
+        return {user_id: team_id for user_id, team_id in result.all()}
@@ -0,0 +1,292 @@
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.ownership import ownership
+from app.core.redis import RedisClient
+from app.core.responses import JSONSerializer
+
+from app.modules.lobby.algorithm.compiler import AlgorithmCompiler, AlgorithmStep
+from app.modules.lobby.draft.exceptions import (
+    HTTPDraftAlreadyStarted,
+    HTTPDraftChoiceTaken,
+    HTTPDraftFinished,
+    HTTPDraftNotFound,
+    HTTPDraftNotYourTurn,
+)
+from app.modules.lobby.draft.schemas import DraftRead, DraftResult, DraftTurn
+
+
+logger = logging.getLogger(__name__)
+
+
+class DraftSession:
+    __slots__ = (
+        "lobby_id", "host_id", "algorithm", "algorithm_id", "algorithm_version",
+        "steps", "teams", "players", "results", "choices",
+    )
+
+    def __init__(self,
+            lobby_id: int,
+            host_id: int,
+            algorithm: str,
+            teams: list[int],
+            players: dict[int, int],
+            results: Optional[list[DraftResult]] = None,
+            algorithm_id: Optional[int] = None,
+            algorithm_version: Optional[int] = None
+    ):
+        self.lobby_id = lobby_id
+        self.host_id = host_id
+        self.algorithm = algorithm
+        self.algorithm_id = algorithm_id
+        self.algorithm_version = algorithm_version
+        self.steps = AlgorithmCompiler.get(algorithm_id, algorithm_version, algorithm, len(teams)).steps
+        self.teams = teams
+        self.players = {user_id: teams.index(team_id) for user_id, team_id in players.items() if team_id in teams}
+        self.results = results or []
+        self.choices = {result.choice.casefold() for result in self.results}
+
+
+    @property
+    def step(self) -> int:
+        return len(self.results)
+
+
+    @property
+    def current(self) -> Optional[AlgorithmStep]:
+        if self.step >= len(self.steps):
+            return None
+
+        return self.steps[self.step]
+
+
+    @property
+    def is_finished(self) -> bool:
+        return self.step >= len(self.steps)
+
+
+    def get_team_id(self, step: AlgorithmStep) -> Optional[int]:
+        if step.team_index is None:
+            return None
+
+        return self.teams[step.team_index]
+
+
+    def can_act(self, user_id: int) -> bool:
+        step = self.current
+        if step is None:
+            return False
+
+        if step.team_index is None:
+            return user_id == self.host_id
+
+        return self.players.get(user_id) == step.team_index
+
+
+    def act(self, user_id: int, choice: str) -> DraftResult:
+        step = self.current
+        if step is None:
+            raise HTTPDraftFinished()
+
+        if not self.can_act(user_id):
+            raise HTTPDraftNotYourTurn()
+
+        key = choice.casefold()
+        if key in self.choices:
+            raise HTTPDraftChoiceTaken(choice)
+
+        result = DraftResult.model_construct(
+            step=self.step,
+            team_id=self.get_team_id(step),
+            action=step.action,
+            choice=choice,
+            user_id=user_id,
+        )
+        self.results.append(result)
+        self.choices.add(key)
+        return result
+
+
+    def read(self) -> DraftRead:
+        step = self.current
+        current = None
+        if step is not None:
+            current = DraftTurn.model_construct(step=self.step, team_id=self.get_team_id(step), action=step.action)
+
+        return DraftRead.model_construct(
+            lobby_id=self.lobby_id,
+            algorithm=self.algorithm,
+            teams=self.teams,
+            total_steps=len(self.steps),
+            current=current,
+            is_finished=self.is_finished,
+            results=self.results,
+        )
+
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "lobby_id": self.lobby_id,
+            "host_id": self.host_id,
+            "algorithm": self.algorithm,
+            "algorithm_id": self.algorithm_id,
+            "algorithm_version": self.algorithm_version,
+            "teams": self.teams,
+            "players": {user_id: self.teams[index] for user_id, index in self.players.items()},
+            "results": [result.model_dump(mode="json") for result in self.results],
+        }
+
+
+    @classmethod
+    def load(cls, data: dict[str, Any]) -> "DraftSession":
+        return cls(
+            data["lobby_id"],
+            data["host_id"],
+            data["algorithm"],
+            data["teams"],
+            {int(user_id): team_id for user_id, team_id in data["players"].items()},
+            [DraftResult.model_validate(result) for result in data.get("results", ())],
+            data.get("algorithm_id"),
+            data.get("algorithm_version"),
+        )
+
+
+class DraftEngine:
+
+    def __init__(self, redis: Redis, prefix: str, ttl: int = 86400, flush_interval: float = 0.05):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+
+        self.sessions: dict[int, DraftSession] = {}
+        self._dirty: set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+
+
+    def get_key(self, lobby_id: int) -> str:
+        return f"{self.prefix}:{lobby_id}"
+
+
+    async def get(self, lobby_id: int) -> Optional[DraftSession]:
+        session = self.sessions.get(lobby_id)
+        if session is not None:
+            return session
+
+        data = await self.redis.get(self.get_key(lobby_id))
+        if data is None:
+            return None
+
+        return self.sessions.setdefault(lobby_id, DraftSession.load(json.loads(data)))
+
+
+    def put(self, session: DraftSession) -> None:
+        self.sessions[session.lobby_id] = session
+        self.mark_dirty(session.lobby_id)
+
+
+    def act(self, session: DraftSession, user_id: int, choice: str) -> DraftResult:
+        result = session.act(user_id, choice)
+        self.mark_dirty(session.lobby_id)
+        return result
+
+
+    def discard(self, lobby_id: int) -> None:
+        self.sessions.pop(lobby_id, None)
+        self.mark_dirty(lobby_id)
+
+
+    def evict(self, resource_id: str) -> None:
+        lobby_id = int(resource_id)
+        self.sessions.pop(lobby_id, None)
+        self._dirty.discard(lobby_id)
+
+
+    async def handle(self, resource_id: str, command: str, payload: dict[str, Any]) -> dict[str, Any]:
+        lobby_id = int(resource_id)
+        session = await self.get(lobby_id)
+
+        if command == "start":
+            if session is not None and not session.is_finished:
+                raise HTTPDraftAlreadyStarted()
+
+            session = DraftSession.load({**payload, "lobby_id": lobby_id})
+            self.put(session)
+            return {"draft": session.read().model_dump(mode="json")}
+
+        if session is None:
+            raise HTTPDraftNotFound()
+
+        if command == "act":
+            result = self.act(session, payload["user_id"], payload["choice"])
+            return {"draft": session.read().model_dump(mode="json"), "result": result.model_dump(mode="json")}
+
+        if command == "get":
+            return {"draft": session.read().model_dump(mode="json")}
+
+        raise ValueError(f"Unknown draft command '{command}'")
+
+
+    def mark_dirty(self, lobby_id: int) -> None:
+        self._dirty.add(lobby_id)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_later())
+
+
+    async def flush(self) -> bool:
+        dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return True
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                for lobby_id in dirty:
+                    session = self.sessions.get(lobby_id)
+                    if session is None:
+                        pipeline.delete(self.get_key(lobby_id))
+                    else:
+                        pipeline.set(self.get_key(lobby_id), JSONSerializer.dumps(session.dump()), ex=self.ttl)
+
+                await pipeline.execute()
+
+        except Exception as error:
+            logger.warning("Failed to persist %s draft sessions: %s", len(dirty), error)
+            self._dirty |= dirty
+            return False
+
+        return True
+
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        await self.flush()
+
+
+    async def _flush_later(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(self.flush_interval)
+            if not await self.flush():
+                return
+
+
+draft_engine = DraftEngine(
+    RedisClient,
+    settings.DRAFT_KEY_PREFIX,
+    settings.DRAFT_TTL,
+    settings.DRAFT_FLUSH_INTERVAL,
+)
+
+ownership.register("draft", draft_engine.handle, draft_engine.evict)
@@ -0,0 +1,77 @@
+from fastapi import HTTPException, status
+
+
+class HTTPDraftException(HTTPException):
+    pass
+
+
+class HTTPDraftNotFound(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Draft not found",
+        )
+
+
+class HTTPDraftAlreadyStarted(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Draft already in progress",
+        )
+
+
+class HTTPDraftFinished(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Draft already finished",
+        )
+
+
+class HTTPDraftNotYourTurn(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not your turn",
+        )
+
+
+class HTTPDraftChoiceTaken(HTTPDraftException):
+    def __init__(self, choice: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Choice '{choice}' already banned or picked",
+        )
+
+
+class HTTPDraftTeamsMismatch(HTTPDraftException):
+    def __init__(self, teams_count: int, expected: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Lobby has {teams_count} teams, algorithm requires {expected}",
+        )
+
+
+class HTTPDraftTeamsWithoutPlayers(HTTPDraftException):
+    def __init__(self, teams_count: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{teams_count} teams have no players",
+        )
+
+
+class HTTPDraftLobbyNotActive(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Lobby is not active",
+        )
+
+
+class HTTPDraftUnavailable(HTTPDraftException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Draft owner is unavailable, retry later",
+        )
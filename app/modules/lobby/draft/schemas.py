@@ -0,0 +1,42 @@
+from typing import Optional
+
+from pydantic import BaseModel, field_validator
+
+from app.modules.lobby.algorithm.enums import AlgorithmAction
+
+
+class DraftActionCreate(BaseModel):
+    choice: str
+
+
+    @field_validator("choice")
+    def validate_choice(cls, choice: str) -> str:
+        choice = choice.strip()
+        if not choice:
+            raise ValueError("Choice cannot be empty")
+
+        return choice
+
+
+class DraftResult(BaseModel):
+    step: int
+    team_id: Optional[int] = None
+    action: AlgorithmAction
+    choice: str
+    user_id: int
+
+
+class DraftTurn(BaseModel):
+    step: int
+    team_id: Optional[int] = None
+    action: AlgorithmAction
+
+
+class DraftRead(BaseModel):
+    lobby_id: int
+    algorithm: str
+    teams: list[int]
+    total_steps: int
+    current: Optional[DraftTurn] = None
+    is_finished: bool
+    results: list[DraftResult]
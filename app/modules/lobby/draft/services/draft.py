@@ -0,0 +1,93 @@
+from typing import Any
+
+from fastapi import Depends
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.database import get_async_session
+
+from app.modules.lobby.draft.crud import DraftCRUD
+from app.modules.lobby.draft.exceptions import (
+    HTTPDraftLobbyNotActive,
+    HTTPDraftTeamsMismatch,
+    HTTPDraftTeamsWithoutPlayers,
+    HTTPDraftUnavailable,
+)
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.exceptions import HTTPLobbyNotFound
+
+from app.core.ownership import OwnershipCoordinator, ownership
+
+
+class DraftService:
+
+    def __init__(self, db: AsyncSession = Depends(get_async_session)):
+        self.crud = DraftCRUD(db)
+        self.db = db
+        self.ownership: OwnershipCoordinator = ownership
+        self.events = LobbyEventService()
+
+
+    async def execute(self, lobby_id: int, command: str, payload: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return await self.ownership.execute("draft", lobby_id, command, payload)
+        except (TimeoutError, RedisError):
+            raise HTTPDraftUnavailable()
+
+
+    async def get(self, lobby_id: int) -> dict[str, Any]:
+        return await self.execute(lobby_id, "get", {})
+
+
+    async def start(self, lobby_id: int) -> dict[str, Any]:
+        lobby = await self.crud.get_lobby(lobby_id)
+        if lobby is None:
+            raise HTTPLobbyNotFound()
+
+        if lobby.status != LobbyStatus.ACTIVE:
+            raise HTTPDraftLobbyNotActive()
+
+        teams = await self.crud.get_team_ids(lobby_id)
+        if len(teams) != lobby.teams_count:
+            raise HTTPDraftTeamsMismatch(len(teams), lobby.teams_count)
+
+        # Only players of the current team may act on its steps, so an empty team would stall the draft
+        players = await self.crud.get_players(lobby_id)
+        empty = len(set(teams) - set(players.values()))
+        if empty:
+            raise HTTPDraftTeamsWithoutPlayers(empty)
+
+        await self.db.commit()
+
+        return await self.execute(lobby_id, "start", {
+            "host_id": lobby.host_id,
+            "algorithm": lobby.algorithm,
+            "algorithm_id": lobby.algorithm_id,
+            "algorithm_version": lobby.algorithm_version,
+            "teams": teams,
+            "players": players,
+        })
+
+
+    async def act(self, lobby_id: int, user_id: int, choice: str) -> dict[str, Any]:
+        status = await self.crud.get_lobby_status(lobby_id)
+        if status is None:
+            raise HTTPLobbyNotFound()
+
+        if status != LobbyStatus.ACTIVE:
+            raise HTTPDraftLobbyNotActive()
+
+        await self.db.commit()
+        return await self.execute(lobby_id, "act", {"user_id": user_id, "choice": choice})
+
+
+    async def publish_started(self, lobby_id: int, state: dict[str, Any]) -> None:
+        await self.events.publish(LobbyEventType.DRAFT_STARTED, lobby_id, state["draft"])
+
+
+    async def publish_result(self, lobby_id: int, state: dict[str, Any]) -> None:
+        await self.events.publish(LobbyEventType.DRAFT_ACTION, lobby_id, state["result"])
+        if state["draft"]["is_finished"]:
+            await self.events.publish(LobbyEventType.DRAFT_FINISHED, lobby_id, state["draft"])
@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.modules.lobby.events.models import LobbyEventLog, LobbyEventSnapshot, get_partition_name
+
+from app.core.base.crud import BaseCRUD
+
+
+class LobbyEventCRUD(BaseCRUD[LobbyEventLog]):
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, LobbyEventLog)
+
+
+    async def create_many(self, rows: list[dict[str, Any]]) -> None:
+        await self.db.execute(insert(LobbyEventLog), rows)
+        await self.db.commit()
+
+
+    async def create_snapshot(self, lobby_id: int, created_at: datetime, data: dict[str, Any]) -> None:
+        await self.db.execute(
+            insert(LobbyEventSnapshot)
+            .values(lobby_id=lobby_id, created_at=created_at, data=data)
+        )
+        await self.db.commit()
+
+
+    async def create_partition(self, start: datetime, end: datetime) -> None:
+        await self.db.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{get_partition_name(start)}" PARTITION OF lobbyeventlog '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        await self.db.commit()
+
+
+    async def get_snapshot(self, lobby_id: int, until: datetime) -> Optional[LobbyEventSnapshot]:
+        result = await self.db.execute(
+            select(LobbyEventSnapshot)
+            .filter(LobbyEventSnapshot.lobby_id == lobby_id, LobbyEventSnapshot.created_at <= until)
+            .order_by(LobbyEventSnapshot.created_at.desc())
+            .limit(1)
+        )
+
+        return result.scalars().first()
+
+
+    async def get_events(self, lobby_id: int, until: datetime, after: Optional[datetime] = None) -> Sequence[Row]:
+        query = (
+            select(LobbyEventLog.type, LobbyEventLog.data)
+            .filter(LobbyEventLog.lobby_id == lobby_id, LobbyEventLog.created_at <= until)
+            .order_by(LobbyEventLog.created_at, LobbyEventLog.id)
+        )
+        if after is not None:
+            query = query.filter(LobbyEventLog.created_at > after)
+
+        result = await self.db.execute(query)
+        return result.all()
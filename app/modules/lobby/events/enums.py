@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class LobbyEventType(StrEnum):
+    PARTICIPANT_JOINED      = "participant.joined"
+    PARTICIPANT_UPDATED     = "participant.updated"
+    PARTICIPANT_LEFT        = "participant.left"
+    TEAM_CREATED            = "team.created"
+    TEAM_UPDATED            = "team.updated"
+    TEAM_DELETED            = "team.deleted"
+    LOBBY_UPDATED           = "lobby.updated"
+    LOBBY_CLOSED            = "lobby.closed"
+    LOBBY_DELETED           = "lobby.deleted"
+    LOBBY_SNAPSHOT          = "lobby.snapshot"
+    DRAFT_STARTED           = "draft.started"
+    DRAFT_ACTION            = "draft.action"
+    DRAFT_FINISHED          = "draft.finished"
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Column, DDL, DateTime, Index, Integer, String, event
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.base.model import Base
+
+
+def get_partition_name(start: datetime) -> str:
+    return f"lobbyeventlog_{start:%Y_%m}"
+
+
+def get_partition_bounds(moment: datetime) -> tuple[datetime, datetime]:
+    start = datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+
+    return start, start.replace(month=start.month + 1)
+
+
+class LobbyEventLog(Base):
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime(timezone=True), primary_key=True)
+    lobby_id = Column(Integer, nullable=False)
+    seq = Column(Integer, nullable=True)
+    type = Column(String(32), nullable=False)
+    data = Column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ix_lobbyeventlog_lobby_id_created_at", "lobby_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)", "info": {"notify": False}},
+    )
+
+
+class LobbyEventSnapshot(Base):
+
+    id = Column(Integer, primary_key=True)
+    lobby_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    data = Column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ix_lobbyeventsnapshot_lobby_id_created_at", "lobby_id", "created_at"),
+        {"info": {"notify": False}},
+    )
+
+
+event.listen(
+    LobbyEventLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS lobbyeventlog_default PARTITION OF lobbyeventlog DEFAULT").execute_if(dialect="postgresql"),
+)
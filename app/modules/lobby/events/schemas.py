@@ -0,0 +1,21 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.lobby.schemas import LobbyRead
+from app.modules.lobby.participant.schemas import LobbyParticipantRead
+from app.modules.lobby.team.schemas import TeamRead
+
+
+class LobbyEvent(BaseModel):
+    type: LobbyEventType
+    lobby_id: int
+    seq: Optional[int] = None
+    data: dict[str, Any]
+
+
+class LobbySnapshot(BaseModel):
+    lobby: LobbyRead
+    participants: list[LobbyParticipantRead]
+    teams: list[TeamRead]
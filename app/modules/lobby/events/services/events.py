@@ -0,0 +1,206 @@
+import logging
+from typing import Any, Optional, Sequence
+
+from app.core.broadcast import Broadcaster, Frame, broadcaster
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.responses import JSONSerializer
+from app.core.scheduler import Scheduler, scheduler
+
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.schemas import LobbyEvent, LobbySnapshot
+from app.modules.lobby.events.writer import LobbyEventWriter, event_writer
+from app.modules.lobby.lobby.enums import LobbyTimer
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.lobby.schemas import LobbyRead
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.participant.schemas import LobbyParticipantRead
+from app.modules.lobby.team.models import Team
+from app.modules.lobby.team.schemas import TeamRead
+
+
+logger = logging.getLogger(__name__)
+
+
+BROADCAST_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local message = seq .. ' ' .. ARGV[3] .. '\\n' .. ARGV[1] .. seq .. ARGV[2]
+redis.call('ZADD', KEYS[2], seq, message)
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -tonumber(ARGV[4]) - 1)
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+redis.call('PUBLISH', ARGV[6], message)
+return seq
+"""
+
+
+class LobbyEventService:
+
+    def __init__(self,
+            lobby_broadcaster: Broadcaster = broadcaster,
+            history_size: int = settings.BROADCAST_HISTORY_SIZE,
+            history_ttl: int = settings.BROADCAST_HISTORY_TTL,
+            lobby_scheduler: Scheduler = scheduler,
+            idle_timeout: int = settings.LOBBY_IDLE_TIMEOUT,
+            lobby_event_writer: LobbyEventWriter = event_writer
+    ):
+        self.broadcaster = lobby_broadcaster
+        self.redis = lobby_broadcaster.redis
+        self.history_size = history_size
+        self.history_ttl = history_ttl
+        self.scheduler = lobby_scheduler
+        self.idle_timeout = idle_timeout
+        self.event_writer = lobby_event_writer
+
+
+    @staticmethod
+    def get_channel(lobby_id: int) -> str:
+        return f"lobby:{lobby_id}"
+
+
+    def get_sequence_key(self, lobby_id: int) -> str:
+        return self.broadcaster.get_channel(f"{self.get_channel(lobby_id)}:seq")
+
+
+    def get_history_key(self, lobby_id: int) -> str:
+        return self.broadcaster.get_channel(f"{self.get_channel(lobby_id)}:history")
+
+
+    async def publish(self,
+            event_type: LobbyEventType,
+            lobby_id: int,
+            data: dict[str, Any],
+            key: Optional[str] = None
+    ) -> None:
+        await self.publish_many(lobby_id, [(event_type, data, key)])
+
+
+    async def publish_many(self,
+            lobby_id: int,
+            events: Sequence[tuple[LobbyEventType, dict[str, Any], Optional[str]]]
+    ) -> None:
+        if not events:
+            return
+
+        self.track_activity(lobby_id, events[-1][0] not in (LobbyEventType.LOBBY_CLOSED, LobbyEventType.LOBBY_DELETED))
+        cache.invalidate("lobby_state", lobby_id)
+
+        lobby_events = [(LobbyEvent(type=event_type, lobby_id=lobby_id, data=data), key) for event_type, data, key in events]
+        if settings.BROADCAST_ENABLED:
+            await self.broadcast(lobby_events)
+
+        if settings.LOBBY_EVENT_LOG_ENABLED:
+            for event, _ in lobby_events:
+                self.event_writer.append(event)
+
+
+    async def broadcast(self, events: Sequence[tuple[LobbyEvent, Optional[str]]]) -> None:
+        # Every event is a script call, so a batch costs one round trip instead of one per event
+        pipeline = self.redis.pipeline(transaction=False)
+        for event, key in events:
+            # The sequence is assigned by the script, so the envelope is split around its unset value
+            head, _, tail = JSONSerializer.dumps(event.model_dump(mode="json")).partition(b'"seq":null')
+            pipeline.eval(
+                BROADCAST_SCRIPT,
+                2,
+                self.get_sequence_key(event.lobby_id),
+                self.get_history_key(event.lobby_id),
+                head + b'"seq":',
+                tail,
+                key or "",
+                self.history_size,
+                self.history_ttl,
+                self.broadcaster.get_channel(self.get_channel(event.lobby_id)),
+            )
+
+        try:
+            results = await pipeline.execute(raise_on_error=False)
+        except Exception as error:
+            results = [error] * len(events)
+
+        for (event, _), result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to publish '%s' for lobby %s: %s", event.type, event.lobby_id, result)
+            else:
+                event.seq = int(result)
+
+
+    def track_activity(self, lobby_id: int, active: bool = True) -> None:
+        if not self.idle_timeout or not self.scheduler.is_running:
+            return
+
+        if active:
+            self.scheduler.schedule(LobbyTimer.IDLE, lobby_id, self.idle_timeout)
+        else:
+            self.scheduler.cancel(LobbyTimer.IDLE, lobby_id)
+
+
+    async def get_sequence(self, lobby_id: int) -> int:
+        return int(await self.redis.get(self.get_sequence_key(lobby_id)) or 0)
+
+
+    async def replay(self, lobby_id: int, since: int) -> Optional[list[Frame]]:
+        frames = self.broadcaster.replay(self.get_channel(lobby_id), since)
+        if frames is not None:
+            return frames
+
+        try:
+            current = await self.get_sequence(lobby_id)
+            if since >= current:
+                return [] if since == current else None
+
+            messages = await self.redis.zrangebyscore(self.get_history_key(lobby_id), since + 1, "+inf")
+        except Exception as error:
+            logger.warning("Failed to replay lobby %s since %s: %s", lobby_id, since, error)
+            return None
+
+        frames = [Frame.decode(message) for message in messages]
+        if not frames or frames[0].seq != since + 1:
+            return None
+
+        return frames
+
+
+    def snapshot(self,
+            seq: int,
+            lobby: Lobby,
+            participants: Sequence[LobbyParticipant],
+            teams: Sequence[Team]
+    ) -> Frame:
+        snapshot = LobbySnapshot.model_validate(
+            {"lobby": lobby, "participants": participants, "teams": teams},
+            from_attributes=True
+        )
+        event = LobbyEvent(
+            type=LobbyEventType.LOBBY_SNAPSHOT,
+            lobby_id=lobby.id,
+            seq=seq,
+            data=snapshot.model_dump(mode="json")
+        )
+
+        return Frame(JSONSerializer.dumps(event.model_dump(mode="json")), seq=seq)
+
+
+    async def participant(self, event_type: LobbyEventType, participant: LobbyParticipant) -> None:
+        data = LobbyParticipantRead.model_validate(participant, from_attributes=True).model_dump(mode="json")
+        await self.publish(event_type, participant.lobby_id, data, f"participant:{participant.id}")
+
+
+    async def participants(self, lobby_id: int, events: Sequence[tuple[LobbyEventType, LobbyParticipant]]) -> None:
+        await self.publish_many(lobby_id, [
+            (
+                event_type,
+                LobbyParticipantRead.model_validate(participant, from_attributes=True).model_dump(mode="json"),
+                f"participant:{participant.id}",
+            )
+            for event_type, participant in events
+        ])
+
+
+    async def team(self, event_type: LobbyEventType, team: Team) -> None:
+        data = TeamRead.model_validate(team, from_attributes=True).model_dump(mode="json")
+        await self.publish(event_type, team.lobby_id, data, f"team:{team.id}")
+
+
+    async def lobby(self, event_type: LobbyEventType, lobby: Lobby) -> None:
+        data = LobbyRead.model_validate(lobby, from_attributes=True).model_dump(mode="json")
+        await self.publish(event_type, lobby.id, data, "lobby")
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies.database import get_async_session
+
+from app.modules.lobby.events.crud import LobbyEventCRUD
+from app.modules.lobby.events.enums import LobbyEventType
+
+
+class LobbyState:
+
+    def __init__(self, data: Optional[dict[str, Any]] = None):
+        data = data or {}
+        self.lobby: Optional[dict[str, Any]] = data.get("lobby")
+        self.participants = {participant["id"]: participant for participant in data.get("participants", ())}
+        self.teams = {team["id"]: team for team in data.get("teams", ())}
+
+
+    def apply(self, event_type: str, data: dict[str, Any]) -> None:
+        if event_type in (LobbyEventType.PARTICIPANT_JOINED, LobbyEventType.PARTICIPANT_UPDATED, LobbyEventType.PARTICIPANT_LEFT):
+            self.participants[data["id"]] = data
+
+        elif event_type in (LobbyEventType.TEAM_CREATED, LobbyEventType.TEAM_UPDATED):
+            self.teams[data["id"]] = data
+
+        elif event_type == LobbyEventType.TEAM_DELETED:
+            self.teams.pop(data["id"], None)
+
+        elif event_type in (LobbyEventType.LOBBY_UPDATED, LobbyEventType.LOBBY_CLOSED):
+            self.lobby = data
+
+        elif event_type == LobbyEventType.LOBBY_DELETED:
+            self.lobby = None
+            self.participants.clear()
+            self.teams.clear()
+
+
+    def read(self) -> Optional[dict[str, Any]]:
+        if self.lobby is None:
+            return None
+
+        # Payloads were serialized by the read schemas when stored, so they are returned as-is
+        return {
+            "lobby": self.lobby,
+            "participants": [self.participants[key] for key in sorted(self.participants)],
+            "teams": [self.teams[key] for key in sorted(self.teams)],
+        }
+
+
+class LobbyHistoryService:
+
+    def __init__(self, db: AsyncSession = Depends(get_async_session)):
+        self.crud = LobbyEventCRUD(db)
+
+
+    async def replay(self, lobby_id: int, at: datetime) -> Optional[dict[str, Any]]:
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+
+        snapshot = await self.crud.get_snapshot(lobby_id, at)
+        state = LobbyState(snapshot.data if snapshot else None)
+
+        for event in await self.crud.get_events(lobby_id, at, snapshot.created_at if snapshot else None):
+            state.apply(event.type, event.data)
+
+        return state.read()
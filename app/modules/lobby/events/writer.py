@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.session import SessionLocal
+
+from app.modules.lobby.events.crud import LobbyEventCRUD
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.models import get_partition_bounds
+from app.modules.lobby.events.schemas import LobbyEvent, LobbySnapshot
+from app.modules.lobby.lobby.crud import LobbyCRUD
+from app.modules.lobby.participant.crud import LobbyParticipantCRUD
+from app.modules.lobby.team.crud import TeamCRUD
+
+
+logger = logging.getLogger(__name__)
+
+
+class LobbyEventWriter:
+
+    def __init__(self,
+            session_factory: Callable[[], AsyncSession],
+            flush_interval: float = 1.0,
+            batch_size: int = 500,
+            max_size: int = 10000,
+            snapshot_interval: int = 100
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.snapshot_interval = snapshot_interval
+        self.dropped = 0
+
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max_size)
+        self._counts: dict[int, int] = {}
+        self._partitions: set[datetime] = set()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    def append(self, event: LobbyEvent) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+
+        self._buffer.append({
+            "lobby_id": event.lobby_id,
+            "seq": event.seq,
+            "type": event.type.value,
+            "data": event.data,
+            "created_at": datetime.now(timezone.utc),
+        })
+
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+
+    def take_snapshots(self, batch: list[dict[str, Any]]) -> list[int]:
+        due = []
+        for row in batch:
+            lobby_id = row["lobby_id"]
+            if row["type"] in (LobbyEventType.LOBBY_CLOSED, LobbyEventType.LOBBY_DELETED):
+                self._counts.pop(lobby_id, None)
+                continue
+
+            count = self._counts.get(lobby_id)
+            if count is None or count + 1 >= self.snapshot_interval:
+                due.append(lobby_id)
+                self._counts[lobby_id] = 0
+            else:
+                self._counts[lobby_id] = count + 1
+
+        return list(dict.fromkeys(due))
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+    async def flush(self) -> bool:
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+
+            try:
+                async with self.session_factory() as db:
+                    crud = LobbyEventCRUD(db)
+                    await self.create_partitions(crud, batch)
+                    await crud.create_many(batch)
+            except Exception as error:
+                logger.warning("Failed to write %s lobby events: %s", len(batch), error)
+                self.restore(batch)
+                return False
+
+            for lobby_id in self.take_snapshots(batch):
+                try:
+                    await self.snapshot(lobby_id)
+                except Exception as error:
+                    logger.warning("Failed to snapshot lobby %s: %s", lobby_id, error)
+                    self._counts.pop(lobby_id, None)
+
+        self._full.clear()
+        return True
+
+
+    def restore(self, batch: list[dict[str, Any]]) -> None:
+        # Events appended while the write was in flight keep their place, the oldest of the batch give way
+        overflow = max(len(batch) - (self._buffer.maxlen - len(self._buffer)), 0)
+        self.dropped += overflow
+        self._buffer.extendleft(reversed(batch[overflow:]))
+
+
+    async def create_partitions(self, crud: LobbyEventCRUD, batch: list[dict[str, Any]]) -> None:
+        months = {get_partition_bounds(row["created_at"]) for row in batch}
+        months |= {get_partition_bounds(end + timedelta(days=1)) for _, end in months}
+
+        for start, end in sorted(months):
+            if start in self._partitions:
+                continue
+
+            try:
+                await crud.create_partition(start, end)
+            except Exception as error:
+                await crud.db.rollback()
+                logger.warning("Failed to create lobby event partition for %s: %s", start.date(), error)
+            else:
+                self._partitions.add(start)
+
+
+    async def snapshot(self, lobby_id: int) -> None:
+        created_at = datetime.now(timezone.utc)
+
+        async with self.session_factory() as db:
+            # One snapshot of the database for all reads, so lobby, participants and teams agree with each other
+            await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+            lobby = await LobbyCRUD(db).get_by_id(lobby_id)
+            if lobby is None:
+                return
+
+            participants = await LobbyParticipantCRUD(db).get_list(
+                {"lobby_id": lobby_id, "all_db_participants": False}, limit=None
+            )
+            teams = await TeamCRUD(db).get_list({"lobby_id": lobby_id}, limit=None)
+            snapshot = LobbySnapshot.model_validate(
+                {"lobby": lobby, "participants": participants, "teams": teams},
+                from_attributes=True
+            )
+
+            await LobbyEventCRUD(db).create_snapshot(lobby_id, created_at, snapshot.model_dump(mode="json"))
+
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            await self.flush()
+            if self._buffer:
+                await asyncio.sleep(self.flush_interval)
+
+
+event_writer = LobbyEventWriter(
+    SessionLocal,
+    settings.LOBBY_EVENT_LOG_FLUSH_INTERVAL,
+    settings.LOBBY_EVENT_LOG_BATCH_SIZE,
+    settings.LOBBY_EVENT_LOG_BUFFER_SIZE,
+    settings.LOBBY_EVENT_LOG_SNAPSHOT_INTERVAL,
+)
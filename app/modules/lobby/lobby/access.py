@@ -0,0 +1,46 @@
+from typing import Callable
+
+from fastapi import Depends
+
+from app.modules.auth.user.access import AccessControl, RoleChecker
+from app.modules.auth.user.enums import UserRole
+from app.modules.auth.user.models import User
+from app.modules.auth.user.services.current import CurrentUserService
+
+from app.modules.lobby.lobby.exceptions import HTTPLobbyAccessDenied, HTTPLobbyNotFound
+from app.modules.lobby.lobby.schemas import LobbyAccess
+from app.modules.lobby.lobby.services.lobby import LobbyService
+
+
+class LobbyAccessControl:
+
+    @staticmethod
+    async def authorize_host(
+            lobby_service: LobbyService,
+            current_user: User,
+            lobby_id: int,
+            exception: Exception = HTTPLobbyAccessDenied
+    ) -> LobbyAccess:
+        lobby = await lobby_service.get_access(lobby_id)
+        if not lobby:
+            raise HTTPLobbyNotFound()
+
+        condition = (lobby.host_id == current_user.id)
+        AccessControl.has_access_or(current_user, UserRole.MODERATOR, condition, exception)
+        return lobby
+
+
+    @classmethod
+    def check_host(cls, exception: Exception = HTTPLobbyAccessDenied) -> Callable:
+        async def host_checker(
+                lobby_id: int,
+                current_user_service: CurrentUserService = Depends(RoleChecker.user),
+                lobby_service: LobbyService = Depends(LobbyService)
+        ) -> LobbyAccess:
+            current_user = await current_user_service.get()
+            return await cls.authorize_host(lobby_service, current_user, lobby_id, exception)
+
+        return host_checker
+
+
+LobbyHostChecker: Callable = LobbyAccessControl.check_host()
@@ -1,9 +1,22 @@
-from typing import Any
+from enum import Enum
+from typing import Any, Optional
 
+from sqlalchemy import JSON, String, case, cast, func, literal_column, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.auth.user.enums import UserRole
+from app.modules.auth.user.models import User
+from app.modules.lobby.algorithm.models import Algorithm
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
 from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
+from app.modules.user.data.models import UserData
 
 from app.core.base.crud import BaseCRUD
 from app.shared.components.filters import FilterField
@@ -20,11 +33,153 @@ class LobbyCRUD(BaseCRUD[Lobby]):
         "only_active": FilterField(bool, True, ignore=True)
     }
 
+    version_relations = ["host", "algorithm"]
+
+    search_column = "search_vector"
+
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Lobby)
 
 
+    async def get_access(self, lobby_id: int) -> Optional[Row]:
+        result = await self.db.execute(
+            select(Lobby.id, Lobby.host_id, Lobby.status, Lobby.name)
+            .filter(Lobby.id == lobby_id)
+        )
+
+        return result.first()
+
+
+    @staticmethod
+    def get_closed_at(status: LobbyStatus) -> Optional[ColumnElement]:
+        if status != LobbyStatus.ARCHIVED:
+            return None
+
+        # Closing an already closed lobby keeps its original stamp, so retention is not restarted
+        return case((Lobby.status == LobbyStatus.ARCHIVED, Lobby.closed_at), else_=func.now())
+
+
+    def get_update_values(self, update_dict: dict[str, Any]) -> dict[str, Any]:
+        if "status" in update_dict:
+            update_dict["closed_at"] = self.get_closed_at(update_dict["status"])
+
+        return super().get_update_values(update_dict)
+
+
+    async def close(self, lobby_id: int) -> Optional[Lobby]:
+        await self.db.execute(
+            update(Lobby)
+            .where(Lobby.id == lobby_id)
+            .values(status=LobbyStatus.ARCHIVED, closed_at=self.get_closed_at(LobbyStatus.ARCHIVED), version=Lobby.version + 1)
+        )
+
+        await self.db.commit()
+
+        result = await self.db.execute(
+            select(Lobby)
+            .filter(Lobby.id == lobby_id)
+            .execution_options(populate_existing=True)
+        )
+
+        return result.scalars().first()
+
+
+    async def get_state(self, lobby_id: int) -> Optional[dict[str, Any]]:
+        host, host_data = aliased(User), aliased(UserData)
+        state = func.json_build_object(
+            "lobby", func.json_build_object(
+                "id", Lobby.id,
+                "name", Lobby.name,
+                "description", Lobby.description,
+                "status", self.enum_value(Lobby.status, LobbyStatus),
+                "host", self.user_json(host, host_data),
+                "algorithm", func.json_build_object(
+                    "id", Algorithm.id,
+                    "name", Algorithm.name,
+                    "description", Algorithm.description,
+                    "algorithm", Algorithm.algorithm,
+                    "teams_count", Algorithm.teams_count,
+                    "version", Algorithm.version,
+                ),
+            ),
+            "teams", self.teams_json(),
+            "spectators", self.members_json(lambda participant: (
+                participant.lobby_id == Lobby.id,
+                participant.team_id.is_(None),
+            )),
+            type_=JSON,
+        )
+
+        result = await self.db.execute(
+            select(state)
+            .select_from(Lobby)
+            .join(host, host.id == Lobby.host_id)
+            .outerjoin(host_data, host_data.user_id == host.id)
+            .join(Algorithm, Algorithm.id == Lobby.algorithm_id)
+            .filter(Lobby.id == lobby_id)
+        )
+
+        return result.scalar()
+
+
+    @staticmethod
+    def enum_value(column: ColumnElement, enum: type[Enum]) -> ColumnElement:
+        return case({member.name: member.value for member in enum}, value=cast(column, String))
+
+
+    @classmethod
+    def user_json(cls, user: type[User], user_data: type[UserData]) -> ColumnElement:
+        return func.json_build_object(
+            "id", user.id,
+            "username", user.username,
+            "role", cls.enum_value(user.role, UserRole),
+            "data", func.json_build_object(
+                "first_name", user_data.first_name,
+                "last_name", user_data.last_name,
+                "external_id", user_data.external_id,
+                "created_at", user_data.created_at,
+            ),
+        )
+
+
+    @classmethod
+    def members_json(cls, condition) -> ColumnElement:
+        participant, user, user_data = aliased(LobbyParticipant), aliased(User), aliased(UserData)
+        member = func.json_build_object(
+            "id", participant.id,
+            "user", cls.user_json(user, user_data),
+            "role", cls.enum_value(participant.role, LobbyParticipantRole),
+            "is_active", participant.is_active,
+        )
+
+        return (
+            select(func.coalesce(func.json_agg(aggregate_order_by(member, participant.id)), literal_column("'[]'::json")))
+            .select_from(participant)
+            .join(user, user.id == participant.user_id)
+            .outerjoin(user_data, user_data.user_id == user.id)
+            .filter(participant.is_active, *condition(participant))
+            .scalar_subquery()
+        )
+
+
+    @classmethod
+    def teams_json(cls) -> ColumnElement:
+        team = aliased(Team)
+        team_json = func.json_build_object(
+            "id", team.id,
+            "name", team.name,
+            "members", cls.members_json(lambda participant: (participant.team_id == team.id,)),
+        )
+
+        return (
+            select(func.coalesce(func.json_agg(aggregate_order_by(team_json, team.id)), literal_column("'[]'::json")))
+            .select_from(team)
+            .filter(team.lobby_id == Lobby.id)
+            .scalar_subquery()
+        )
+
+
     def custom_filters(self, filters: dict[str, Any]) -> list[Any]:
         conditions = []
 
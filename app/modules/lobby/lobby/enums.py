@@ -9,3 +9,7 @@ class LobbyParticipantRole(StrEnum):
 class LobbyStatus(StrEnum):
     ACTIVE      = "active"
     ARCHIVED    = "archived"
+
+
+class LobbyTimer(StrEnum):
+    IDLE        = "lobby.idle"
@@ -77,6 +77,22 @@ class HTTPTeamNotFound(HTTPLobbyException):
         )
 
 
+class HTTPTeamsCountMismatch(HTTPLobbyException):
+    def __init__(self, teams_count: int, expected: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Lobby has {teams_count} teams, algorithm requires {expected}",
+        )
+
+
+class HTTPTeamBalanceTooLarge(HTTPLobbyException):
+    def __init__(self, changes_count: int, limit: int):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Balance moves {changes_count} participants, at most {limit} are allowed",
+        )
+
+
 class HTTPTeamUpdateDataNotProvided(HTTPLobbyException):
     def __init__(self):
         super().__init__(
@@ -109,6 +125,14 @@ class HTTPLobbyUserAlreadyIn(HTTPLobbyException):
         )
 
 
+class HTTPLobbyNotActive(HTTPLobbyException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Lobby is not active"
+        )
+
+
 class HTTPLobbyParticipantNotFound(HTTPLobbyException):
     def __init__(self):
         super().__init__(
@@ -1,19 +1,30 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SQLAlchemyEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Index, Integer, String, ForeignKey, Enum as SQLAlchemyEnum, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.base.model import Base
 from app.modules.lobby.lobby.enums import LobbyStatus 
+from app.shared.components.search import FullTextSearch
 
 class Lobby(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    host_id = Column(Integer, ForeignKey("user.id"), nullable=False)
-    algorithm_id = Column(Integer, ForeignKey("algorithm.id"), nullable=False)
+    host_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
+    algorithm_id = Column(Integer, ForeignKey("algorithm.id"), nullable=False, index=True)
     status = Column(SQLAlchemyEnum(LobbyStatus), nullable=False, default=LobbyStatus.ACTIVE)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    closed_at = Column(DateTime(timezone=True), nullable=True)
+    search_vector = deferred(Column(TSVECTOR, FullTextSearch.document("name", "description")))
 
     host = relationship("User", back_populates="lobbies", lazy="selectin")
     algorithm = relationship("Algorithm", back_populates="lobbies", lazy="selectin")
     participants = relationship("LobbyParticipant", back_populates="lobby")
     teams = relationship("Team", back_populates="lobby", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_lobby_status_active", "status", postgresql_where=text("status = 'ACTIVE'")),
+        Index("ix_lobby_closed_at_archived", "closed_at", postgresql_where=text("status = 'ARCHIVED'")),
+        Index("ix_lobby_search_vector", "search_vector", postgresql_using="gin"),
+    )
@@ -1,7 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
+from app.core.config import settings
 from app.modules.auth.user.schemas import UserReadRegular
 from app.modules.lobby.algorithm.schemas import AlgorithmReadSimple
 from app.modules.lobby.lobby.enums import LobbyStatus, LobbyParticipantRole
@@ -45,6 +46,32 @@ class LobbyRead(BaseModel):
     status: LobbyStatus
 
 
+class LobbyStateMemberRead(BaseModel):
+    id: int
+    user: UserReadRegular
+    role: LobbyParticipantRole
+    is_active: bool
+
+
+class LobbyStateTeamRead(BaseModel):
+    id: int
+    name: str
+    members: list[LobbyStateMemberRead]
+
+
+class LobbyStateRead(BaseModel):
+    lobby: LobbyRead
+    teams: list[LobbyStateTeamRead]
+    spectators: list[LobbyStateMemberRead]
+
+
+class LobbyAccess(BaseModel):
+    id: int
+    host_id: int
+    status: LobbyStatus
+    name: str
+
+
 class LobbyUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
@@ -64,6 +91,23 @@ class LobbyParticipantUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class LobbyParticipantBulkItem(LobbyParticipantUpdate):
+    participant_id: int
+
+
+class LobbyParticipantBulkUpdate(BaseModel):
+    participants: list[LobbyParticipantBulkItem] = Field(min_length=1, max_length=settings.LOBBY_PARTICIPANTS_BULK_LIMIT)
+
+
+    @field_validator("participants")
+    def validate_participants(cls, participants: list[LobbyParticipantBulkItem]) -> list[LobbyParticipantBulkItem]:
+        participant_ids = {participant.participant_id for participant in participants}
+        if len(participant_ids) != len(participants):
+            raise ValueError("Each participant can be changed only once per request")
+
+        return participants
+
+
 class LobbyResponse(BaseModel):
     id: int
     description: str
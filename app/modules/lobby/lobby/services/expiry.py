@@ -0,0 +1,23 @@
+import logging
+
+from app.core.session import SessionLocal
+
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.services.lobby import LobbyService
+
+
+logger = logging.getLogger(__name__)
+
+
+async def close_idle_lobbies(keys: list[str]) -> None:
+    async with SessionLocal() as db:
+        lobby_service = LobbyService(db)
+
+        for key in keys:
+            lobby = await lobby_service.get_access(int(key))
+            if lobby is None or lobby.status != LobbyStatus.ACTIVE:
+                continue
+
+            await lobby_service.close(lobby.id)
+            logger.info("Closed idle lobby %s", lobby.id)
+
@@ -1,22 +1,116 @@
+from typing import Optional
+
 from fastapi import Depends
+from pydantic import BaseModel
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.database import get_async_session
 
+from app.modules.lobby.algorithm.compiler import AlgorithmCompiler
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
 from app.modules.lobby.lobby.models import Lobby
-from app.modules.lobby.lobby.enums import LobbyStatus
-from app.modules.lobby.lobby.schemas import LobbyUpdate
+from app.modules.lobby.lobby.schemas import LobbyAccess, LobbyStateRead
 from app.modules.lobby.lobby.crud import LobbyCRUD
 
 from app.core.base.service import BaseService
+from app.core.cache import LocalCache, cache
 
 
 class LobbyService(BaseService[Lobby, LobbyCRUD]):
 
+    state_cache: LocalCache = cache
+
+
     def __init__(self, db: AsyncSession = Depends(get_async_session)):
         super().__init__(Lobby, LobbyCRUD, db)
+        self.events = LobbyEventService()
+
+
+    @staticmethod
+    def get_state_key(lobby_id: int) -> tuple[str, int]:
+        return ("lobby_state", lobby_id)
+
+
+    async def get_state(self, lobby_id: int) -> Optional[LobbyStateRead]:
+        key = self.get_state_key(lobby_id)
+        state = self.state_cache.get(key)
+        if state is not None:
+            return state
+
+        data = await self.crud.get_state(lobby_id)
+        if data is None:
+            return None
+
+        algorithm = data["lobby"]["algorithm"]
+        algorithm["compiled"] = AlgorithmCompiler.get(
+            algorithm["id"], algorithm["version"], algorithm["algorithm"], algorithm["teams_count"]
+        )
+        state = LobbyStateRead.model_validate(data, from_attributes=True)
+
+        self.state_cache.set(key, state, self.get_state_tags(state))
+        return state
+
+
+    @staticmethod
+    def get_state_tags(state: LobbyStateRead) -> list[tuple[str, Optional[int]]]:
+        members = [member for team in state.teams for member in team.members] + state.spectators
+
+        return [
+            ("lobby_state", state.lobby.id),
+            ("lobby", state.lobby.id),
+            ("algorithm", state.lobby.algorithm.id),
+            ("user", state.lobby.host.id),
+            ("team", None),
+            ("lobbyparticipant", None),
+            ("userdata", None),
+            *(("user", member.user.id) for member in members),
+        ]
+
+
+    async def get_access(self, lobby_id: int) -> Optional[LobbyAccess]:
+        row = await self.crud.get_access(lobby_id)
+        if row is None:
+            return None
+
+        return LobbyAccess.model_construct(**row._mapping)
+
+
+    async def create(self, obj: BaseModel) -> Lobby:
+        new_lobby = await super().create(obj)
+        self.events.track_activity(new_lobby.id)
+
+        return new_lobby
+
+
+    async def update(self, lobby: Lobby, update_data: BaseModel) -> Optional[Lobby]:
+        updated_lobby = await super().update(lobby, update_data)
+        if updated_lobby:
+            await self.events.lobby(LobbyEventType.LOBBY_UPDATED, updated_lobby)
+
+        return updated_lobby
+
+
+    async def update_by_id(self, lobby_id: int, update_data: BaseModel) -> Optional[Lobby]:
+        updated_lobby = await super().update_by_id(lobby_id, update_data)
+        if updated_lobby:
+            await self.events.lobby(LobbyEventType.LOBBY_UPDATED, updated_lobby)
+
+        return updated_lobby
+
+
+    async def close(self, lobby_id: int) -> Optional[Lobby]:
+        closed_lobby = await self.crud.close(lobby_id)
+        if closed_lobby:
+            await self.events.lobby(LobbyEventType.LOBBY_CLOSED, closed_lobby)
+
+        return closed_lobby
+
 
+    async def delete_by_id(self, lobby_id: int) -> bool:
+        result = await super().delete_by_id(lobby_id)
+        if result:
+            await self.events.publish(LobbyEventType.LOBBY_DELETED, lobby_id, {"id": lobby_id}, "lobby")
 
-    async def close(self, lobby: Lobby) -> Lobby:
-        return await self.update(lobby, LobbyUpdate(status=LobbyStatus.ARCHIVED))
+        return result
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from app.core.config import settings
+from app.modules.lobby.algorithm.compiler import AlgorithmCompiler
 
 
 class LobbyValidator:
@@ -25,21 +26,7 @@ class LobbyValidator:
             raise ValueError("Algorithm should contain at least one step")
 
         teams_count = LobbyValidator.teams_count(teams_count)
-        steps = algorithm_str.split()
-        valid_steps = {"B", "P", "T"}
-
-        for index, step in enumerate(steps):        
-            if not all(char in valid_steps for char in step):
-                raise ValueError(f"Step '{step}' containings incorrect symbols. Available only these: {', '.join(valid_steps)}.")
-
-            if step != "T" and len(step) != teams_count:
-                raise ValueError(f"Size of the step '{step}' must be equal to teams count ({teams_count=}).")
-
-            if step == "T" and index != len(steps) - 1:
-                raise ValueError("Step 'T' (tiebreak) can be only at the last step of algorithm.")
-
-            if "T" in step and len(step) > 1:
-                raise ValueError(f"Step 'T' must be separated from algorithm ({step=})")
+        AlgorithmCompiler.compile(algorithm_str, teams_count)
 
         return algorithm_str
     
@@ -0,0 +1,96 @@
+from typing import Sequence
+
+from sqlalchemy import func, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.modules.lobby.algorithm.models import Algorithm
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+
+
+class MatchmakingCRUD:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+
+    async def get_algorithms(self, algorithm_ids: list[int]) -> dict[int, tuple[str, int]]:
+        result = await self.db.execute(
+            select(Algorithm.id, Algorithm.name, Algorithm.teams_count)
+            .filter(Algorithm.id.in_(algorithm_ids))
+        )
+
+        return {row.id: (row.name, row.teams_count) for row in result}
+
+
+    async def get_open_lobbies(self, lobby_ids: list[int]) -> Sequence[Row]:
+        players = (
+            select(func.count())
+            .select_from(LobbyParticipant)
+            .filter(LobbyParticipant.lobby_id == Lobby.id, LobbyParticipant.is_active.is_(True))
+            .scalar_subquery()
+        )
+
+        result = await self.db.execute(
+            select(Lobby.id, Lobby.status, players.label("players"))
+            .filter(Lobby.id.in_(lobby_ids))
+            .order_by(players.desc(), Lobby.id)
+        )
+
+        return result.all()
+
+
+    async def create_lobbies(self, algorithm_id: int, name: str, host_ids: list[int]) -> dict[int, int]:
+        if not host_ids:
+            return {}
+
+        result = await self.db.execute(
+            insert(Lobby).returning(Lobby.host_id, Lobby.id),
+            [
+                {"name": name, "host_id": host_id, "algorithm_id": algorithm_id, "status": LobbyStatus.ACTIVE}
+                for host_id in host_ids
+            ],
+        )
+
+        return dict(result.tuples().all())
+
+
+    async def add_participants(self, participants: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        if not participants:
+            return []
+
+        query = insert(LobbyParticipant)
+        result = await self.db.execute(
+            query
+            .on_conflict_do_update(
+                index_elements=[LobbyParticipant.lobby_id, LobbyParticipant.user_id],
+                set_={"is_active": true(), "role": query.excluded.role},
+            )
+            .returning(LobbyParticipant.id, LobbyParticipant.lobby_id),
+            [
+                {
+                    "lobby_id": lobby_id,
+                    "user_id": user_id,
+                    "team_id": None,
+                    "role": LobbyParticipantRole.PLAYER,
+                    "is_active": True,
+                }
+                for lobby_id, user_id in participants
+            ],
+        )
+
+        return list(result.tuples().all())
+
+
+    async def get_participants(self, participant_ids: list[int]) -> Sequence[LobbyParticipant]:
+        result = await self.db.execute(
+            select(LobbyParticipant)
+            .filter(LobbyParticipant.id.in_(participant_ids))
+            .order_by(LobbyParticipant.id)
+        )
+
+        return result.scalars().all()
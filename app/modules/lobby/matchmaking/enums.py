@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class MatchmakingStatus(StrEnum):
+    QUEUED      = "queued"
+    MATCHED     = "matched"
@@ -0,0 +1,29 @@
+from fastapi import HTTPException, status
+
+
+class HTTPMatchmakingException(HTTPException):
+    pass
+
+
+class HTTPMatchmakingAlreadyQueued(HTTPMatchmakingException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User is already in the matchmaking queue",
+        )
+
+
+class HTTPMatchmakingNotQueued(HTTPMatchmakingException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User is not in the matchmaking queue",
+        )
+
+
+class HTTPMatchmakingUnavailable(HTTPMatchmakingException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Matchmaking is unavailable, retry later",
+        )
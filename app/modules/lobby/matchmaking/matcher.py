@@ -0,0 +1,278 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Callable, Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import MetricsSnapshot, metrics
+from app.core.ownership import CLAIM_SCRIPT, RELEASE_SCRIPT
+from app.core.session import SessionLocal
+
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.matchmaking.crud import MatchmakingCRUD
+from app.modules.lobby.matchmaking.queue import MatchmakingQueue, QueuedPlayer, matchmaking_queue
+
+
+logger = logging.getLogger(__name__)
+
+
+type MatchPlan = tuple[dict[int, list[QueuedPlayer]], list[list[QueuedPlayer]], list[QueuedPlayer]]
+type MatchResult = tuple[dict[int, int], list[int], list[int]]
+
+
+class MatchmakingMetrics:
+
+    def __init__(self):
+        self.enqueued = 0
+        self.left = 0
+        self.matched = 0
+        self.requeued = 0
+        self.lobbies_created = 0
+        self.lobbies_filled = 0
+        self.rounds = 0
+        self.match_time = 0.0
+
+
+    @property
+    def rate(self) -> float:
+        if not self.match_time:
+            return 0.0
+
+        return self.matched / self.match_time
+
+
+    def snapshot(self) -> MetricsSnapshot:
+        return {
+            "enqueued": self.enqueued,
+            "left": self.left,
+            "matched": self.matched,
+            "requeued": self.requeued,
+            "lobbies_created": self.lobbies_created,
+            "lobbies_filled": self.lobbies_filled,
+            "rounds": self.rounds,
+            "match_time": round(self.match_time, 6),
+            "matched_per_second": round(self.rate, 1),
+        }
+
+
+class Matchmaker:
+
+    def __init__(self,
+            queue: MatchmakingQueue,
+            session_factory: Callable[[], AsyncSession],
+            team_size: int = 5,
+            batch_size: int = 1000,
+            interval: float = 0.5,
+            lock_ttl: float = 10.0,
+            stats: Optional[MatchmakingMetrics] = None,
+            worker_id: Optional[str] = None
+    ):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.team_size = team_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lock_ttl = lock_ttl
+        self.stats = stats or MatchmakingMetrics()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.events = LobbyEventService()
+
+        self._task: Optional[asyncio.Task] = None
+
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+    @property
+    def lock_key(self) -> str:
+        return f"{self.queue.prefix}:lock"
+
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        try:
+            await self.queue.redis.eval(RELEASE_SCRIPT, 1, self.lock_key, self.worker_id)
+        except Exception as error:
+            logger.warning("Failed to release matchmaking lock: %s", error)
+
+
+    async def claim(self) -> bool:
+        owner = await self.queue.redis.eval(CLAIM_SCRIPT, 1, self.lock_key, self.worker_id, int(self.lock_ttl * 1000))
+        return owner == self.worker_id
+
+
+    @staticmethod
+    def plan(players: list[QueuedPlayer], open_lobbies: list[tuple[int, int]], size: int) -> MatchPlan:
+        fills = {}
+        index = 0
+
+        for lobby_id, free in open_lobbies:
+            if index >= len(players):
+                break
+
+            fills[lobby_id] = players[index:index + free]
+            index += len(fills[lobby_id])
+
+        rest = players[index:]
+        full = len(rest) - len(rest) % size
+        groups = [rest[start:start + size] for start in range(0, full, size)]
+
+        return fills, groups, rest[full:]
+
+
+    async def match_all(self) -> int:
+        algorithm_ids = await self.queue.get_algorithms()
+        if not algorithm_ids:
+            return 0
+
+        async with self.session_factory() as db:
+            algorithms = await self.get_algorithms(db, algorithm_ids)
+
+        matched = 0
+        for algorithm_id in algorithm_ids:
+            if algorithm_id not in algorithms:
+                await self.queue.discard(algorithm_id)
+                continue
+
+            name, teams_count = algorithms[algorithm_id]
+            matched += await self.match(algorithm_id, name, teams_count * self.team_size)
+
+        return matched
+
+
+    async def match(self, algorithm_id: int, name: str, size: int) -> int:
+        start = time.perf_counter()
+
+        players = await self.queue.pop(algorithm_id, self.batch_size)
+        if not players:
+            return 0
+
+        try:
+            async with self.session_factory() as db:
+                open_lobbies = await self.get_open_lobbies(db, algorithm_id, size)
+                fills, groups, leftover = self.plan(players, open_lobbies, size)
+                matches, lobby_ids, joined = await self.commit(db, algorithm_id, name, fills, groups)
+        except Exception:
+            await self.queue.requeue(algorithm_id, players)
+            raise
+
+        requeued = await self.queue.requeue(algorithm_id, leftover)
+        await self.queue.complete(matches)
+
+        # Players are already seated once the commit succeeded, so a failure from here on must not requeue them
+        try:
+            await self.announce(algorithm_id, lobby_ids, joined)
+        except Exception as error:
+            logger.warning("Failed to announce matches for algorithm %s: %s", algorithm_id, error)
+
+        self.stats.rounds += 1
+        self.stats.matched += len(matches)
+        self.stats.requeued += requeued
+        self.stats.lobbies_created += len(groups)
+        self.stats.lobbies_filled += sum(1 for players in fills.values() if players)
+        self.stats.match_time += time.perf_counter() - start
+
+        return len(matches)
+
+
+    async def get_algorithms(self, db: AsyncSession, algorithm_ids: list[int]) -> dict[int, tuple[str, int]]:
+        return await MatchmakingCRUD(db).get_algorithms(algorithm_ids)
+
+
+    async def get_open_lobbies(self, db: AsyncSession, algorithm_id: int, size: int) -> list[tuple[int, int]]:
+        lobby_ids = await self.queue.get_lobbies(algorithm_id)
+        if not lobby_ids:
+            return []
+
+        rows = await MatchmakingCRUD(db).get_open_lobbies(lobby_ids)
+        active = {row.id for row in rows if row.status == LobbyStatus.ACTIVE}
+        await self.queue.remove_lobbies(algorithm_id, [lobby_id for lobby_id in lobby_ids if lobby_id not in active])
+
+        return [(row.id, size - row.players) for row in rows if row.id in active and row.players < size]
+
+
+    async def commit(self,
+            db: AsyncSession,
+            algorithm_id: int,
+            name: str,
+            fills: dict[int, list[QueuedPlayer]],
+            groups: list[list[QueuedPlayer]]
+    ) -> MatchResult:
+        crud = MatchmakingCRUD(db)
+        lobbies = await crud.create_lobbies(algorithm_id, f"{name} match", [group[0][0] for group in groups])
+
+        matches = {user_id: lobby_id for lobby_id, players in fills.items() for user_id, _ in players}
+        for group in groups:
+            lobby_id = lobbies[group[0][0]]
+            matches.update((user_id, lobby_id) for user_id, _ in group)
+
+        participants = await crud.add_participants([(lobby_id, user_id) for user_id, lobby_id in matches.items()])
+        await db.commit()
+
+        joined = [participant_id for participant_id, lobby_id in participants if lobby_id in fills]
+        return matches, list(lobbies.values()), joined
+
+
+    async def announce(self, algorithm_id: int, lobby_ids: list[int], joined: list[int]) -> None:
+        await self.queue.add_lobbies(algorithm_id, lobby_ids)
+        for lobby_id in lobby_ids:
+            self.events.track_activity(lobby_id)
+
+        if not joined:
+            return
+
+        async with self.session_factory() as db:
+            for participant in await MatchmakingCRUD(db).get_participants(joined):
+                await self.events.participant(LobbyEventType.PARTICIPANT_JOINED, participant)
+
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self.claim() and await self.match_all():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.warning("Matchmaking round failed: %s", error)
+
+            await asyncio.sleep(self.interval)
+
+
+matchmaking_stats = MatchmakingMetrics()
+metrics.register("matchmaking", matchmaking_stats.snapshot)
+
+matchmaker = Matchmaker(
+    matchmaking_queue,
+    SessionLocal,
+    settings.MATCHMAKING_TEAM_SIZE,
+    settings.MATCHMAKING_BATCH_SIZE,
+    settings.MATCHMAKING_INTERVAL,
+    settings.MATCHMAKING_LOCK_TTL,
+    matchmaking_stats,
+)
@@ -0,0 +1,186 @@
+import time
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+
+ENQUEUE_SCRIPT = """
+if not redis.call('SET', KEYS[1], ARGV[2], 'NX') then
+    return 0
+end
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+redis.call('SADD', KEYS[3], ARGV[2])
+redis.call('DEL', KEYS[4])
+return 1
+"""
+
+LEAVE_SCRIPT = """
+local algorithm_id = redis.call('GET', KEYS[1])
+if not algorithm_id then
+    return false
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', ARGV[1] .. algorithm_id, ARGV[2])
+return algorithm_id
+"""
+
+POP_SCRIPT = """
+local players = redis.call('ZPOPMIN', KEYS[1], ARGV[1])
+local claimed = {}
+for index = 1, #players, 2 do
+    local key = ARGV[2] .. players[index]
+    if redis.call('GET', key) == ARGV[3] then
+        redis.call('DEL', key)
+        table.insert(claimed, players[index])
+        table.insert(claimed, players[index + 1])
+    end
+end
+return claimed
+"""
+
+REQUEUE_SCRIPT = """
+local requeued = 0
+for index = 3, #ARGV, 2 do
+    if redis.call('SET', ARGV[2] .. ARGV[index], ARGV[1], 'NX') then
+        redis.call('ZADD', KEYS[1], ARGV[index + 1], ARGV[index])
+        requeued = requeued + 1
+    end
+end
+return requeued
+"""
+
+
+type QueuedPlayer = tuple[int, float]
+
+
+class MatchmakingQueue:
+
+    def __init__(self, redis: Redis, prefix: str, result_ttl: int = 300):
+        self.redis = redis
+        self.prefix = prefix
+        self.result_ttl = result_ttl
+
+
+    @property
+    def algorithms_key(self) -> str:
+        return f"{self.prefix}:algorithms"
+
+
+    def get_queue_key(self, algorithm_id: int | str = "") -> str:
+        return f"{self.prefix}:queue:{algorithm_id}"
+
+
+    def get_player_key(self, user_id: int | str = "") -> str:
+        return f"{self.prefix}:player:{user_id}"
+
+
+    def get_result_key(self, user_id: int | str) -> str:
+        return f"{self.prefix}:result:{user_id}"
+
+
+    def get_lobbies_key(self, algorithm_id: int) -> str:
+        return f"{self.prefix}:lobbies:{algorithm_id}"
+
+
+    async def enqueue(self, user_id: int, algorithm_id: int, score: Optional[float] = None) -> bool:
+        keys = (
+            self.get_player_key(user_id),
+            self.get_queue_key(algorithm_id),
+            self.algorithms_key,
+            self.get_result_key(user_id),
+        )
+        score = time.time() if score is None else score
+
+        return bool(await self.redis.eval(ENQUEUE_SCRIPT, len(keys), *keys, user_id, algorithm_id, score))
+
+
+    async def enqueue_many(self, algorithm_id: int, players: list[QueuedPlayer]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.mset({self.get_player_key(user_id): algorithm_id for user_id, _ in players})
+            pipeline.zadd(self.get_queue_key(algorithm_id), {str(user_id): score for user_id, score in players})
+            pipeline.sadd(self.algorithms_key, algorithm_id)
+            await pipeline.execute()
+
+
+    async def leave(self, user_id: int) -> Optional[int]:
+        algorithm_id = await self.redis.eval(
+            LEAVE_SCRIPT, 1, self.get_player_key(user_id), self.get_queue_key(), user_id
+        )
+
+        return None if algorithm_id is None else int(algorithm_id)
+
+
+    async def get_status(self, user_id: int) -> tuple[Optional[int], Optional[int], Optional[int]]:
+        algorithm_id, lobby_id = await self.redis.mget(self.get_player_key(user_id), self.get_result_key(user_id))
+        position = None
+        if algorithm_id is not None:
+            position = await self.redis.zrank(self.get_queue_key(algorithm_id), user_id)
+
+        return (
+            None if algorithm_id is None else int(algorithm_id),
+            position,
+            None if lobby_id is None else int(lobby_id),
+        )
+
+
+    async def get_algorithms(self) -> list[int]:
+        return [int(algorithm_id) for algorithm_id in await self.redis.smembers(self.algorithms_key)]
+
+
+    async def pop(self, algorithm_id: int, count: int) -> list[QueuedPlayer]:
+        players = await self.redis.eval(
+            POP_SCRIPT, 1, self.get_queue_key(algorithm_id), count, self.get_player_key(), algorithm_id
+        )
+
+        return [(int(user_id), float(score)) for user_id, score in zip(players[::2], players[1::2])]
+
+
+    async def requeue(self, algorithm_id: int, players: list[QueuedPlayer]) -> int:
+        if not players:
+            return 0
+
+        args = [value for user_id, score in players for value in (user_id, score)]
+        return await self.redis.eval(
+            REQUEUE_SCRIPT, 1, self.get_queue_key(algorithm_id), algorithm_id, self.get_player_key(), *args
+        )
+
+
+    async def complete(self, matches: dict[int, int]) -> None:
+        if not matches:
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for user_id, lobby_id in matches.items():
+                pipeline.set(self.get_result_key(user_id), lobby_id, ex=self.result_ttl)
+            await pipeline.execute()
+
+
+    async def discard(self, algorithm_id: int) -> None:
+        user_ids = await self.redis.zrange(self.get_queue_key(algorithm_id), 0, -1)
+
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.delete(self.get_queue_key(algorithm_id), self.get_lobbies_key(algorithm_id))
+            if user_ids:
+                pipeline.delete(*(self.get_player_key(user_id) for user_id in user_ids))
+            pipeline.srem(self.algorithms_key, algorithm_id)
+            await pipeline.execute()
+
+
+    async def get_lobbies(self, algorithm_id: int) -> list[int]:
+        return [int(lobby_id) for lobby_id in await self.redis.smembers(self.get_lobbies_key(algorithm_id))]
+
+
+    async def add_lobbies(self, algorithm_id: int, lobby_ids: list[int]) -> None:
+        if lobby_ids:
+            await self.redis.sadd(self.get_lobbies_key(algorithm_id), *lobby_ids)
+
+
+    async def remove_lobbies(self, algorithm_id: int, lobby_ids: list[int]) -> None:
+        if lobby_ids:
+            await self.redis.srem(self.get_lobbies_key(algorithm_id), *lobby_ids)
+
+
+matchmaking_queue = MatchmakingQueue(RedisClient, settings.MATCHMAKING_PREFIX, settings.MATCHMAKING_RESULT_TTL)
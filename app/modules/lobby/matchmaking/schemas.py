@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.modules.lobby.matchmaking.enums import MatchmakingStatus
+
+
+class MatchmakingCreate(BaseModel):
+    algorithm_id: int
+
+
+class MatchmakingRead(BaseModel):
+    user_id: int
+    status: MatchmakingStatus
+    algorithm_id: Optional[int] = None
+    position: Optional[int] = None
+    lobby_id: Optional[int] = None
+
+
+class MatchmakingResponse(BaseModel):
+    user_id: int
+    description: str
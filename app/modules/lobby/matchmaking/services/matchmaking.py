@@ -0,0 +1,61 @@
+from redis.exceptions import RedisError
+
+from app.modules.lobby.matchmaking.enums import MatchmakingStatus
+from app.modules.lobby.matchmaking.exceptions import (
+    HTTPMatchmakingAlreadyQueued,
+    HTTPMatchmakingNotQueued,
+    HTTPMatchmakingUnavailable,
+)
+from app.modules.lobby.matchmaking.matcher import MatchmakingMetrics, matchmaking_stats
+from app.modules.lobby.matchmaking.queue import MatchmakingQueue, matchmaking_queue
+from app.modules.lobby.matchmaking.schemas import MatchmakingRead, MatchmakingResponse
+
+
+class MatchmakingService:
+
+    def __init__(self):
+        self.queue: MatchmakingQueue = matchmaking_queue
+        self.stats: MatchmakingMetrics = matchmaking_stats
+
+
+    async def enqueue(self, user_id: int, algorithm_id: int) -> MatchmakingRead:
+        try:
+            queued = await self.queue.enqueue(user_id, algorithm_id)
+        except RedisError:
+            raise HTTPMatchmakingUnavailable()
+
+        if not queued:
+            raise HTTPMatchmakingAlreadyQueued()
+
+        self.stats.enqueued += 1
+        return await self.get(user_id)
+
+
+    async def get(self, user_id: int) -> MatchmakingRead:
+        try:
+            algorithm_id, position, lobby_id = await self.queue.get_status(user_id)
+        except RedisError:
+            raise HTTPMatchmakingUnavailable()
+
+        if algorithm_id is not None:
+            return MatchmakingRead(
+                user_id=user_id, status=MatchmakingStatus.QUEUED, algorithm_id=algorithm_id, position=position
+            )
+
+        if lobby_id is not None:
+            return MatchmakingRead(user_id=user_id, status=MatchmakingStatus.MATCHED, lobby_id=lobby_id)
+
+        raise HTTPMatchmakingNotQueued()
+
+
+    async def leave(self, user_id: int) -> MatchmakingResponse:
+        try:
+            algorithm_id = await self.queue.leave(user_id)
+        except RedisError:
+            raise HTTPMatchmakingUnavailable()
+
+        if algorithm_id is None:
+            raise HTTPMatchmakingNotQueued()
+
+        self.stats.left += 1
+        return MatchmakingResponse(user_id=user_id, description="User successfully left the matchmaking queue")
@@ -1,10 +1,14 @@
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
+from sqlalchemy import Boolean, Integer, case, cast, column, func, update, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.schemas import LobbyParticipantBulkItem
 from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
 
 from app.core.base.crud import BaseCRUD
 from app.shared.components.filters import FilterField
@@ -56,6 +60,89 @@ class LobbyParticipantCRUD(BaseCRUD[LobbyParticipant]):
         return result.scalars().first()
 
 
+    async def upsert_active(self, lobby_id: int, user_id: int, team_id: Optional[int] = None) -> Optional[LobbyParticipant]:
+        query = (
+            insert(self.model)
+            .values(
+                lobby_id=lobby_id,
+                user_id=user_id,
+                team_id=team_id,
+                role=LobbyParticipantRole.SPECTATOR,
+                is_active=True
+            )
+            .on_conflict_do_update(
+                index_elements=[self.model.lobby_id, self.model.user_id],
+                set_={"is_active": True},
+                where=self.model.is_active.is_(False)
+            )
+            .returning(self.model)
+        )
+
+        result = await self.db.execute(query, execution_options={"populate_existing": True})
+        participant = result.scalars().first()
+        await self.db.commit()
+
+        if participant is not None:
+            await self.db.refresh(participant)
+
+        return participant
+
+
+    async def get_team_ids(self, lobby_id: int, team_ids: set[int]) -> set[int]:
+        result = await self.db.execute(
+            select(Team.id)
+            .filter(Team.lobby_id == lobby_id, Team.id.in_(team_ids))
+        )
+
+        return set(result.scalars())
+
+
+    async def update_many(self, lobby_id: int, changes: list[LobbyParticipantBulkItem]) -> Optional[Sequence[LobbyParticipant]]:
+        rows = []
+        for change in changes:
+            data = change.model_dump(exclude_unset=True)
+            rows.append((change.participant_id, data.get("team_id"), "team_id" in data, data.get("role"), data.get("is_active")))
+
+        changes_table = values(
+            column("id", Integer),
+            column("team_id", Integer),
+            column("set_team", Boolean),
+            column("role", self.model.role.type),
+            column("is_active", Boolean),
+            name="changes",
+        ).data(rows)
+
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == changes_table.c.id, self.model.lobby_id == lobby_id)
+            .values(
+                team_id=case(
+                    (cast(changes_table.c.set_team, Boolean), cast(changes_table.c.team_id, Integer)),
+                    else_=self.model.team_id
+                ),
+                role=func.coalesce(cast(changes_table.c.role, self.model.role.type), self.model.role),
+                is_active=func.coalesce(cast(changes_table.c.is_active, Boolean), self.model.is_active),
+            )
+            .returning(self.model.id)
+        )
+
+        participant_ids = list(result.scalars())
+        if len(participant_ids) != len(rows):
+            await self.db.rollback()
+            return None
+
+        await self.db.commit()
+
+        result = await self.db.execute(
+            select(self.model)
+            .filter(self.model.id.in_(participant_ids))
+            .order_by(self.model.id)
+            .execution_options(populate_existing=True)
+        )
+
+        return result.scalars().all()
+
+
     def custom_filters(self, filters: dict[str, Any]) -> list[Any]:
         conditions = []
         
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Boolean, ForeignKey, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, Boolean, ForeignKey, UniqueConstraint, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship
 
 from app.core.base.model import Base
@@ -8,12 +8,16 @@ from app.modules.lobby.lobby.enums import LobbyParticipantRole
 class LobbyParticipant(Base):
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
     lobby_id = Column(Integer, ForeignKey("lobby.id"), nullable=False)
-    team_id = Column(Integer, ForeignKey("team.id"), nullable=True)
-    role = Column(SQLAlchemyEnum(LobbyParticipantRole), nullable=False, default=LobbyParticipantRole.SPECTATOR)
+    team_id = Column(Integer, ForeignKey("team.id"), nullable=True, index=True)
+    role = Column(SQLAlchemyEnum(LobbyParticipantRole), nullable=False, default=LobbyParticipantRole.SPECTATOR, index=True)
     is_active = Column(Boolean, nullable=False, default=True)
 
     user = relationship("User", back_populates="participants", lazy="selectin")
     lobby = relationship("Lobby", back_populates="participants", lazy="selectin")
     team = relationship("Team", back_populates="participants", lazy="selectin")
+
+    __table_args__ = (
+        UniqueConstraint("lobby_id", "user_id", name="uq_lobbyparticipant_lobby_id_user_id"),
+    )
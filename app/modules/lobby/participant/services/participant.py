@@ -1,11 +1,13 @@
-from typing import Optional
+from typing import Optional, Sequence
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies.database import get_async_session
 
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
 from app.modules.lobby.lobby.enums import LobbyParticipantRole
-from app.modules.lobby.lobby.schemas import LobbyParticipantCreate, LobbyParticipantUpdate
+from app.modules.lobby.lobby.schemas import LobbyParticipantBulkItem, LobbyParticipantCreate, LobbyParticipantUpdate
 from app.modules.lobby.participant.crud import LobbyParticipantCRUD
 from app.modules.lobby.participant.models import LobbyParticipant
 
@@ -16,6 +18,7 @@ class LobbyParticipantService(BaseService[LobbyParticipant, LobbyParticipantCRUD
 
     def __init__(self, db: AsyncSession = Depends(get_async_session)):
         super().__init__(LobbyParticipant, LobbyParticipantCRUD, db)
+        self.events = LobbyEventService()
 
 
     async def get_by_id(self, lobby_id: int, participant_id: int) -> Optional[LobbyParticipant]:
@@ -44,9 +47,53 @@ class LobbyParticipantService(BaseService[LobbyParticipant, LobbyParticipantCRUD
             is_active=True
         )
         new_participant = LobbyParticipant.from_create(participant_scheme)
-        return await self.crud.create(new_participant)
+        participant = await self.crud.create(new_participant)
+
+        await self.events.participant(LobbyEventType.PARTICIPANT_JOINED, participant)
+        return participant
+
+
+    async def join(self, lobby_id: int, user_id: int, team_id: Optional[int] = None) -> Optional[LobbyParticipant]:
+        participant = await self.crud.upsert_active(lobby_id, user_id, team_id)
+        if participant:
+            await self.events.participant(LobbyEventType.PARTICIPANT_JOINED, participant)
+
+        return participant
+
+
+    async def update(self, participant: LobbyParticipant, update_data: LobbyParticipantUpdate) -> Optional[LobbyParticipant]:
+        updated_participant = await self.crud.update(participant, update_data)
+        if updated_participant:
+            await self.events.participant(LobbyEventType.PARTICIPANT_UPDATED, updated_participant)
+
+        return updated_participant
+
+
+    async def has_teams(self, lobby_id: int, team_ids: set[int]) -> bool:
+        if not team_ids:
+            return True
+
+        return await self.crud.get_team_ids(lobby_id, team_ids) == team_ids
+
+
+    async def update_many(self, lobby_id: int, changes: list[LobbyParticipantBulkItem]) -> Optional[Sequence[LobbyParticipant]]:
+        participants = await self.crud.update_many(lobby_id, changes)
+        if participants is None:
+            return None
+
+        left_ids = {change.participant_id for change in changes if change.is_active is False}
+        await self.events.participants(lobby_id, [
+            (LobbyEventType.PARTICIPANT_LEFT if participant.id in left_ids else LobbyEventType.PARTICIPANT_UPDATED, participant)
+            for participant in participants
+        ])
+
+        return participants
 
 
     async def leave(self, participant: LobbyParticipant) -> Optional[LobbyParticipant]:
         update_data = LobbyParticipantUpdate(is_active=False)
-        return await self.crud.update(participant, update_data)
+        left_participant = await self.crud.update(participant, update_data)
+        if left_participant:
+            await self.events.participant(LobbyEventType.PARTICIPANT_LEFT, left_participant)
+
+        return left_participant
@@ -0,0 +1,54 @@
+from random import Random
+from typing import Optional, Sequence
+
+from app.modules.lobby.team.enums import TeamBalanceStrategy
+
+
+class TeamBalancer:
+
+    @staticmethod
+    def round_robin(player_ids: Sequence[int], teams_count: int) -> list[list[int]]:
+        teams = [[] for _ in range(teams_count)]
+        for index, player_id in enumerate(player_ids):
+            teams[index % teams_count].append(player_id)
+
+        return teams
+
+
+    @classmethod
+    def random(cls, player_ids: Sequence[int], teams_count: int, seed: Optional[int] = None) -> list[list[int]]:
+        shuffled = list(player_ids)
+        Random(seed).shuffle(shuffled)
+        return cls.round_robin(shuffled, teams_count)
+
+
+    @staticmethod
+    def balanced(players: Sequence[tuple[int, float]], teams_count: int) -> list[list[int]]:
+        ordered = sorted(players, key=lambda player: (-player[1], player[0]))
+        teams = [[] for _ in range(teams_count)]
+        totals = [0.0] * teams_count
+
+        for start in range(0, len(ordered), teams_count):
+            weakest = sorted(range(teams_count), key=lambda index: (totals[index], index))
+            for (player_id, rating), index in zip(ordered[start:start + teams_count], weakest):
+                teams[index].append(player_id)
+                totals[index] += rating
+
+        return teams
+
+
+    @classmethod
+    def split(cls,
+            strategy: TeamBalanceStrategy,
+            players: Sequence[tuple[int, float]],
+            teams_count: int,
+            seed: Optional[int] = None
+    ) -> list[list[int]]:
+        if strategy == TeamBalanceStrategy.BALANCED:
+            return cls.balanced(players, teams_count)
+
+        player_ids = sorted(player_id for player_id, _ in players)
+        if strategy == TeamBalanceStrategy.RANDOM:
+            return cls.random(player_ids, teams_count, seed)
+
+        return cls.round_robin(player_ids, teams_count)
@@ -1,5 +1,13 @@
+from typing import Optional, Sequence
+
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
 
+from app.modules.lobby.algorithm.models import Algorithm
+from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
 from app.modules.lobby.team.models import Team
 
 from app.core.base.crud import BaseCRUD
@@ -14,6 +22,41 @@ class TeamCRUD(BaseCRUD[Team]):
         "lobby_id": FilterField(int)
     }
 
+    version_relations = ["lobby", "lobby.host", "lobby.algorithm"]
+
 
     def __init__(self, db: AsyncSession):
         super().__init__(db, Team)
+
+
+    async def get_lobby_settings(self, lobby_id: int) -> Optional[Row]:
+        result = await self.db.execute(
+            select(Lobby.status, Algorithm.teams_count)
+            .join(Algorithm, Lobby.algorithm_id == Algorithm.id)
+            .filter(Lobby.id == lobby_id)
+        )
+
+        return result.first()
+
+
+    async def get_team_ids(self, lobby_id: int) -> list[int]:
+        result = await self.db.execute(
+            select(Team.id)
+            .filter(Team.lobby_id == lobby_id)
+            .order_by(Team.id)
+        )
+
+        return list(result.scalars().all())
+
+
+    async def get_players(self, lobby_id: int) -> Sequence[Row]:
+        result = await self.db.execute(
+            select(LobbyParticipant.id, LobbyParticipant.user_id, LobbyParticipant.team_id)
+            .filter(
+                LobbyParticipant.lobby_id == lobby_id,
+                LobbyParticipant.is_active.is_(True),
+                LobbyParticipant.role == LobbyParticipantRole.PLAYER,
+            )
+        )
+
+        return result.all()
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class TeamBalanceStrategy(StrEnum):
+    ROUND_ROBIN = "round_robin"
+    RANDOM      = "random"
+    BALANCED    = "balanced"
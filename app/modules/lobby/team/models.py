@@ -7,7 +7,8 @@ from app.core.base.model import Base
 class Team(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    lobby_id = Column(Integer, ForeignKey("lobby.id"), nullable=False)
+    lobby_id = Column(Integer, ForeignKey("lobby.id"), nullable=False, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     lobby = relationship("Lobby", back_populates="teams", lazy="selectin")
     participants = relationship("LobbyParticipant", back_populates="team")
@@ -4,6 +4,7 @@ from pydantic import BaseModel, field_validator
 
 from app.modules.lobby.lobby.schemas import LobbyRead
 from app.modules.lobby.lobby.validators import LobbyValidator
+from app.modules.lobby.team.enums import TeamBalanceStrategy
 
 
 class TeamBase(BaseModel):
@@ -38,4 +39,22 @@ class TeamUpdate(BaseModel):
     @field_validator("name", mode="before")
     def validate_name(cls, name: Optional[str]) -> Optional[str]:
         return LobbyValidator.name(name, "Team")
-    
\ No newline at end of file
+    
+
+class TeamBalanceCreate(BaseModel):
+    lobby_id: int
+    strategy: TeamBalanceStrategy = TeamBalanceStrategy.ROUND_ROBIN
+    seed: Optional[int] = None
+    ratings: dict[int, float] = {}
+
+
+class TeamBalanceTeamRead(BaseModel):
+    id: int
+    participant_ids: list[int]
+    rating: float
+
+
+class TeamBalanceRead(BaseModel):
+    lobby_id: int
+    strategy: TeamBalanceStrategy
+    teams: list[TeamBalanceTeamRead]
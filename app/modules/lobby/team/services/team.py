@@ -1,10 +1,21 @@
+from typing import Optional
+
 from fastapi import Depends
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.dependencies.database import get_async_session
 
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.exceptions import HTTPLobbyNotActive, HTTPLobbyNotFound, HTTPTeamBalanceTooLarge, HTTPTeamsCountMismatch
+from app.modules.lobby.lobby.schemas import LobbyParticipantBulkItem
+from app.modules.lobby.team.balancer import TeamBalancer
 from app.modules.lobby.team.crud import TeamCRUD
 from app.modules.lobby.team.models import Team
+from app.modules.lobby.team.schemas import TeamBalanceCreate, TeamBalanceRead, TeamBalanceTeamRead
 
 from app.core.base.service import BaseService
 
@@ -13,3 +24,69 @@ class TeamService(BaseService[Team, TeamCRUD]):
 
     def __init__(self, db: AsyncSession = Depends(get_async_session)):
         super().__init__(Team, TeamCRUD, db)
+        self.events = LobbyEventService()
+
+
+    async def create(self, obj: BaseModel) -> Team:
+        team = await super().create(obj)
+        await self.events.team(LobbyEventType.TEAM_CREATED, team)
+        return team
+
+
+    async def update(self, team: Team, update_data: BaseModel) -> Optional[Team]:
+        updated_team = await super().update(team, update_data)
+        if updated_team:
+            await self.events.team(LobbyEventType.TEAM_UPDATED, updated_team)
+
+        return updated_team
+
+
+    async def delete(self, team: Team) -> bool:
+        result = await super().delete(team)
+        if result:
+            await self.events.team(LobbyEventType.TEAM_DELETED, team)
+
+        return result
+
+
+    async def balance(self, balance_data: TeamBalanceCreate) -> tuple[TeamBalanceRead, list[LobbyParticipantBulkItem]]:
+        lobby = await self.crud.get_lobby_settings(balance_data.lobby_id)
+        if lobby is None:
+            raise HTTPLobbyNotFound()
+
+        if lobby.status != LobbyStatus.ACTIVE:
+            raise HTTPLobbyNotActive()
+
+        teams_count = lobby.teams_count
+        team_ids = await self.crud.get_team_ids(balance_data.lobby_id)
+        if len(team_ids) != teams_count:
+            raise HTTPTeamsCountMismatch(len(team_ids), teams_count)
+
+        players = await self.crud.get_players(balance_data.lobby_id)
+        ratings = {player.id: balance_data.ratings.get(player.user_id, 0.0) for player in players}
+        split = TeamBalancer.split(balance_data.strategy, list(ratings.items()), teams_count, balance_data.seed)
+
+        current = {player.id: player.team_id for player in players}
+        changes = [
+            LobbyParticipantBulkItem(participant_id=participant_id, team_id=team_id)
+            for team_id, participant_ids in zip(team_ids, split)
+            for participant_id in participant_ids
+            if current[participant_id] != team_id
+        ]
+        if len(changes) > settings.LOBBY_PARTICIPANTS_BULK_LIMIT:
+            raise HTTPTeamBalanceTooLarge(len(changes), settings.LOBBY_PARTICIPANTS_BULK_LIMIT)
+
+        balance = TeamBalanceRead(
+            lobby_id=balance_data.lobby_id,
+            strategy=balance_data.strategy,
+            teams=[
+                TeamBalanceTeamRead(
+                    id=team_id,
+                    participant_ids=participant_ids,
+                    rating=sum(ratings[participant_id] for participant_id in participant_ids),
+                )
+                for team_id, participant_ids in zip(team_ids, split)
+            ],
+        )
+
+        return balance, changes
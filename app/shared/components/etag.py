@@ -0,0 +1,50 @@
+import hashlib
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy.engine import Row
+
+
+class ETag:
+
+    @staticmethod
+    def build(namespace: str, rows: Iterable[Row | tuple]) -> str:
+        digest = hashlib.sha1(namespace.encode())
+        for row in rows:
+            digest.update(b"|")
+            digest.update(":".join(str(value) for value in row).encode())
+
+        return f'"{digest.hexdigest()}"'
+
+
+    @staticmethod
+    def parse(header: Optional[str]) -> set[str]:
+        if not header:
+            return set()
+
+        tags = set()
+        for tag in header.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+
+            if tag:
+                tags.add(tag)
+
+        return tags
+
+
+    @classmethod
+    def is_not_modified(cls, request: Request, etag: str) -> bool:
+        tags = cls.parse(request.headers.get("if-none-match"))
+        return "*" in tags or etag in tags
+
+
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+    @staticmethod
+    def set_header(response: Response, etag: str) -> None:
+        response.headers["ETag"] = etag
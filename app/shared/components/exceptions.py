@@ -0,0 +1,37 @@
+from fastapi import HTTPException, status
+
+
+class HTTPComponentException(HTTPException):
+    pass
+
+
+class HTTPInvalidFields(HTTPComponentException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=detail
+        )
+
+
+class HTTPIdempotencyKeyInvalid(HTTPComponentException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Idempotency-Key must be between 1 and 255 characters long"
+        )
+
+
+class HTTPIdempotencyKeyReused(HTTPComponentException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for a different request"
+        )
+
+
+class HTTPIdempotencyInProgress(HTTPComponentException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still in progress"
+        )
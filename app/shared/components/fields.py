@@ -0,0 +1,167 @@
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Callable, Optional, Self, Union, get_args, get_origin
+
+from fastapi import Query, Response
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, noload, selectinload
+from sqlalchemy.orm.interfaces import ONETOMANY
+
+from app.core.responses import JSONSerializer
+from app.shared.components.exceptions import HTTPInvalidFields
+
+
+def get_nested_model(annotation: Any) -> Optional[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    if get_origin(annotation) in (Union, UnionType, list):
+        for arg in get_args(annotation):
+            model = get_nested_model(arg)
+            if model is not None:
+                return model
+
+    return None
+
+
+class FieldSet:
+
+    def __init__(self, model: type[BaseModel], fields: dict[str, Optional["FieldSet"]]):
+        self.model = model
+        self.fields = fields
+
+
+    def __str__(self) -> str:
+        parts = []
+        for name, nested in self.fields.items():
+            parts.append(f"{name}({nested})" if nested is not None else name)
+
+        return ",".join(parts)
+
+
+    @classmethod
+    def all(cls, model: type[BaseModel]) -> Self:
+        return cls.from_paths(model, [[name] for name in model.model_fields])
+
+
+    @classmethod
+    def from_paths(cls, model: type[BaseModel], paths: list[list[str]]) -> Self:
+        grouped: dict[str, list[list[str]]] = {}
+        for path in paths:
+            name, rest = path[0], path[1:]
+            if name not in model.model_fields:
+                raise ValueError(f"Unknown field '{name}' for {model.__name__}")
+
+            grouped.setdefault(name, [])
+            if rest:
+                grouped[name].append(rest)
+
+        fields = {}
+        for name, nested_paths in grouped.items():
+            nested_model = get_nested_model(model.model_fields[name].annotation)
+            if nested_model is None:
+                if nested_paths:
+                    raise ValueError(f"Field '{name}' of {model.__name__} has no nested fields")
+
+                fields[name] = None
+                continue
+
+            if nested_paths:
+                fields[name] = cls.from_paths(nested_model, nested_paths)
+            else:
+                fields[name] = cls.all(nested_model)
+
+        return cls(model, fields)
+
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def parse(cls, model: type[BaseModel], fields: str) -> Self:
+        paths = [field.strip().split(".") for field in fields.split(",") if field.strip()]
+        if not paths:
+            raise ValueError("At least one field must be provided")
+
+        return cls.from_paths(model, paths)
+
+
+    @classmethod
+    def query(cls, model: type[BaseModel]) -> Callable[..., Optional[Self]]:
+        def get_fields(fields: Optional[str] = Query(default=None)) -> Optional[FieldSet]:
+            if fields is None:
+                return None
+
+            try:
+                return cls.parse(model, fields)
+            except ValueError as error:
+                raise HTTPInvalidFields(str(error))
+
+        return get_fields
+
+
+    def load_options(self, orm_model: type, required: tuple[str, ...] = ()) -> list[Any]:
+        mapper = inspect(orm_model)
+        columns = [column.key for column in mapper.primary_key]
+        columns.extend(required)
+        options = []
+
+        for name, relationship in mapper.relationships.items():
+            nested = self.fields.get(name)
+            attribute = getattr(orm_model, name)
+
+            if nested is None:
+                options.append(noload(attribute))
+                continue
+
+            nested_required = ()
+            if relationship.direction == ONETOMANY:
+                nested_required = tuple(column.key for column in relationship.remote_side)
+            else:
+                columns.extend(column.key for column in relationship.local_columns)
+
+            nested_options = nested.load_options(relationship.mapper.class_, nested_required)
+            options.append(selectinload(attribute).options(*nested_options))
+
+        columns.extend(name for name in self.fields if name in mapper.column_attrs)
+        field_columns = getattr(orm_model, "__field_columns__", {})
+        columns.extend(column for name in self.fields for column in field_columns.get(name, ()))
+        columns = [getattr(orm_model, name) for name in dict.fromkeys(columns)]
+        return [load_only(*columns), *options]
+
+
+    def build(self, obj: Any) -> Optional[BaseModel]:
+        if obj is None:
+            return None
+
+        values = {}
+        for name, nested in self.fields.items():
+            value = getattr(obj, name)
+            if nested is not None:
+                value = [nested.build(item) for item in value] if isinstance(value, (list, tuple)) else nested.build(value)
+
+            values[name] = value
+
+        return self.model.model_construct(**values)
+
+
+    def dump(self, content: Any) -> Any:
+        if isinstance(content, (list, tuple)):
+            return [self.dump(obj) for obj in content]
+
+        obj = self.build(content)
+        if obj is None:
+            return None
+
+        return obj.model_dump(mode="json", exclude_unset=True)
+
+
+    def response(self, content: Any, source: Optional[Response] = None) -> Response:
+        response = Response(
+            content=JSONSerializer.dumps(self.dump(content)),
+            media_type="application/json",
+        )
+
+        if source is not None:
+            response.headers.raw.extend(source.headers.raw)
+
+        return response
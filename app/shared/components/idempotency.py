@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+from uuid import uuid4
+
+from fastapi import HTTPException, Request, Response
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.ownership import RELEASE_SCRIPT
+from app.core.redis import RedisBytesClient
+from app.modules.auth.token.utils import TokenManager
+from app.shared.components.exceptions import (
+    HTTPIdempotencyInProgress,
+    HTTPIdempotencyKeyInvalid,
+    HTTPIdempotencyKeyReused,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+type RouteHandler = Callable[[Request], Awaitable[Response]]
+
+
+class Idempotency:
+
+    header = "Idempotency-Key"
+    max_key_length = 255
+
+
+    def __init__(self,
+            redis: Redis,
+            prefix: str,
+            ttl: int = 86400,
+            lock_ttl: float = 10.0,
+            enabled: bool = True
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.enabled = enabled
+
+
+    @staticmethod
+    def endpoint(scope: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+            endpoint.__idempotent__ = scope
+            return endpoint
+
+        return decorator
+
+
+    @staticmethod
+    def get_owner(request: Request) -> Optional[str]:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        try:
+            correct, payload = TokenManager.is_correct_type(token, "access", True)
+        except ValueError:
+            return None
+
+        user_id = payload.get("user_id")
+        return str(user_id) if correct and user_id is not None else None
+
+
+    def get_key(self, scope: str, owner: str, key: str) -> str:
+        return f"{self.prefix}:{scope}:{owner}:{key}"
+
+
+    @staticmethod
+    async def get_fingerprint(request: Request) -> str:
+        digest = hashlib.sha256()
+        for part in (request.method.encode(), request.url.path.encode(), request.url.query.encode(), await request.body()):
+            digest.update(part)
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+
+    def wrap(self, scope: str, handler: RouteHandler) -> RouteHandler:
+        if not self.enabled:
+            return handler
+
+        async def idempotent_handler(request: Request) -> Response:
+            key = request.headers.get(self.header)
+            if key is None:
+                return await handler(request)
+
+            if not key or len(key) > self.max_key_length:
+                raise HTTPIdempotencyKeyInvalid()
+
+            # Keys are scoped per user, so a refreshed token still replays; unauthenticated requests are left to the auth dependency
+            owner = self.get_owner(request)
+            if owner is None:
+                return await handler(request)
+
+            fingerprint = await self.get_fingerprint(request)
+            return await self.execute(self.get_key(scope, owner, key), fingerprint, lambda: handler(request))
+
+        return idempotent_handler
+
+
+    async def execute(self, key: str, fingerprint: str, call: Callable[[], Awaitable[Response]]) -> Response:
+        lock_key = f"{key}:lock"
+        token = uuid4().hex
+
+        try:
+            response = await self.load(key, fingerprint)
+            if response is not None:
+                return response
+
+            locked = await self.redis.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+        except HTTPException:
+            raise
+        except Exception as error:
+            logger.warning("Idempotency store is unavailable, running request '%s' without it: %s", key, error)
+            return await call()
+
+        if not locked:
+            raise HTTPIdempotencyInProgress()
+
+        try:
+            response = await self.load(key, fingerprint)
+            if response is not None:
+                return response
+
+            response = await call()
+            if response.status_code < 500:
+                await self.save(key, fingerprint, response)
+
+            return response
+
+        finally:
+            try:
+                await self.redis.eval(RELEASE_SCRIPT, 1, lock_key, token)
+            except Exception as error:
+                logger.warning("Failed to release idempotency lock '%s': %s", lock_key, error)
+
+
+    async def load(self, key: str, fingerprint: str) -> Optional[Response]:
+        stored = await self.redis.hgetall(key)
+        if not stored:
+            return None
+
+        if stored[b"fingerprint"].decode() != fingerprint:
+            raise HTTPIdempotencyKeyReused()
+
+        response = Response(content=stored[b"body"], status_code=int(stored[b"status"]))
+        response.headers.raw.extend(
+            (name.encode("latin-1"), value.encode("latin-1")) for name, value in json.loads(stored[b"headers"])
+        )
+        response.headers["Idempotent-Replayed"] = "true"
+        return response
+
+
+    async def save(self, key: str, fingerprint: str, response: Response) -> None:
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in response.headers.raw if name != b"content-length"
+        ]
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                pipeline.hset(key, mapping={
+                    "status": response.status_code,
+                    "headers": json.dumps(headers),
+                    "body": response.body,
+                    "fingerprint": fingerprint,
+                })
+                pipeline.expire(key, self.ttl)
+                await pipeline.execute()
+        except Exception as error:
+            logger.warning("Failed to store idempotent response '%s': %s", key, error)
+
+
+idempotency = Idempotency(
+    RedisBytesClient,
+    settings.IDEMPOTENCY_PREFIX,
+    settings.IDEMPOTENCY_TTL,
+    settings.IDEMPOTENCY_LOCK_TTL,
+    bool(settings.IDEMPOTENCY_ENABLED),
+)
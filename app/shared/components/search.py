@@ -0,0 +1,19 @@
+from sqlalchemy import Computed, func
+from sqlalchemy.sql.expression import ColumnElement
+
+
+class FullTextSearch:
+
+    config = "simple"
+
+
+    @classmethod
+    def document(cls, *columns: str) -> Computed:
+        text = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        return Computed(f"to_tsvector('{cls.config}'::regconfig, {text})", persisted=True)
+
+
+    @classmethod
+    def match(cls, vector: ColumnElement, value: str) -> tuple[ColumnElement, ColumnElement]:
+        query = func.websearch_to_tsquery(cls.config, value)
+        return vector.bool_op("@@")(query), func.ts_rank(vector, query)
@@ -4,6 +4,8 @@ from app.modules.auth.token.models import Token
 from app.modules.auth.user.models import User
 
 from app.modules.lobby.algorithm.models import Algorithm
+from app.modules.lobby.archive.models import LobbyArchive, LobbyParticipantArchive, TeamArchive
+from app.modules.lobby.events.models import LobbyEventLog, LobbyEventSnapshot
 from app.modules.lobby.lobby.models import Lobby
 from app.modules.lobby.participant.models import LobbyParticipant
 from app.modules.lobby.team.models import Team
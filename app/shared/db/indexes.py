@@ -0,0 +1,97 @@
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy import Boolean, Column, MetaData, Table, UniqueConstraint
+
+import app.modules
+from app.core.base.crud import BaseCRUD
+from app.shared.components.filters import FilterField
+from app.shared.db.base import Base
+
+
+@dataclass(frozen=True)
+class UnindexedColumn:
+    table: str
+    column: str
+    reason: str
+
+
+    def __str__(self) -> str:
+        return f"{self.table}.{self.column} ({self.reason})"
+
+
+def load_crud_classes() -> list[type[BaseCRUD]]:
+    for path in app.modules.__path__:
+        for crud_path in sorted(Path(path).rglob("crud.py")):
+            parts = crud_path.relative_to(path).with_suffix("").parts
+            importlib.import_module(".".join((app.modules.__name__, *parts)))
+
+    crud_classes, pending = [], list(BaseCRUD.__subclasses__())
+    while pending:
+        crud_class = pending.pop()
+        crud_classes.append(crud_class)
+        pending.extend(crud_class.__subclasses__())
+
+    return crud_classes
+
+
+def get_leading_columns(table: Table) -> set[str]:
+    columns = {column.name for column in list(table.primary_key.columns)[:1]}
+
+    for index in table.indexes:
+        if index.expressions and isinstance(index.expressions[0], Column):
+            columns.add(index.expressions[0].name)
+
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.columns:
+            columns.add(next(iter(constraint.columns)).name)
+
+    for column in table.columns:
+        if column.unique or column.index:
+            columns.add(column.name)
+
+    return columns
+
+
+def is_indexable_filter(filter_field: FilterField, column: Optional[Column]) -> bool:
+    if column is None or filter_field.ignore:
+        return False
+
+    if filter_field.operator is not FilterField.exact:
+        return False
+
+    return not isinstance(column.type, Boolean)
+
+
+def find_unindexed_columns(
+    metadata: MetaData = Base.metadata,
+    crud_classes: Optional[Iterable[type[BaseCRUD]]] = None,
+) -> list[UnindexedColumn]:
+
+    if crud_classes is None:
+        crud_classes = load_crud_classes()
+
+    missing: dict[tuple[str, str], UnindexedColumn] = {}
+
+    for table in metadata.sorted_tables:
+        indexed = get_leading_columns(table)
+        for foreign_key in table.foreign_keys:
+            column = foreign_key.parent
+            if column.name not in indexed:
+                missing[(table.name, column.name)] = UnindexedColumn(table.name, column.name, f"foreign key to {foreign_key.target_fullname}")
+
+    for crud_class in crud_classes:
+        table = metadata.tables.get(crud_class(None).model.__table__.name)
+        if table is None:
+            continue
+
+        indexed = get_leading_columns(table)
+
+        for key, filter_field in crud_class.default_filters.items():
+            column = table.columns.get(key)
+            if is_indexable_filter(filter_field, column) and column.name not in indexed:
+                missing.setdefault((table.name, column.name), UnindexedColumn(table.name, column.name, f"filter in {crud_class.__name__}"))
+
+    return sorted(missing.values(), key=lambda item: (item.table, item.column))
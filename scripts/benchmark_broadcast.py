@@ -0,0 +1,147 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import time
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.core.broadcast import Broadcaster, Frame, SendPolicy, Subscription
+from app.core.responses import JSONSerializer
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.schemas import LobbyEvent
+
+
+CHANNEL = "lobby:1"
+
+
+class LocalSocket:
+
+    def __init__(self, expected: int, done: asyncio.Event, counter: list[int]):
+        self.expected = expected
+        self.done = done
+        self.counter = counter
+        self.received = 0
+        self.bytes = 0
+
+
+    def receive(self, size: int) -> None:
+        self.received += 1
+        self.bytes += size
+        self.counter[0] += 1
+        if self.counter[0] == self.expected:
+            self.done.set()
+
+
+    async def send_text(self, data: str) -> None:
+        self.receive(len(data))
+
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.receive(len(data))
+
+
+def create_event(index: int) -> LobbyEvent:
+    return LobbyEvent(
+        type=LobbyEventType.PARTICIPANT_UPDATED,
+        lobby_id=1,
+        data={"id": index % 50, "user_id": index, "team_id": index % 2, "role": "SPECTATOR", "is_active": True},
+    )
+
+
+async def send_per_socket(socket: LocalSocket, subscription: Subscription, events: list[LobbyEvent]) -> None:
+    async for frame in subscription:
+        event = events[int(frame.data)]
+        await socket.send_text(JSONSerializer.dumps(event.model_dump(mode="json")).decode("utf-8"))
+
+
+async def send_text(socket: LocalSocket, subscription: Subscription, events: list[LobbyEvent]) -> None:
+    async for frame in subscription:
+        await socket.send_text(frame.text)
+
+
+async def send_bytes(socket: LocalSocket, subscription: Subscription, events: list[LobbyEvent]) -> None:
+    async for frame in subscription:
+        await socket.send_bytes(frame.data)
+
+
+async def run_case(sender, clients: int, events: list[LobbyEvent], policy: SendPolicy, queue_size: int) -> tuple[float, int, int]:
+    broadcaster = Broadcaster(None, "benchmark", queue_size, policy)
+    done = asyncio.Event()
+    counter = [0]
+    sockets = [LocalSocket(clients * len(events), done, counter) for _ in range(clients)]
+    subscriptions = [broadcaster.attach(CHANNEL) for _ in range(clients)]
+    tasks = [
+        asyncio.create_task(sender(socket, subscription, events))
+        for socket, subscription in zip(sockets, subscriptions)
+    ]
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for index, event in enumerate(events):
+        if sender is send_per_socket:
+            message = Frame.encode(str(index).encode("utf-8"))
+        else:
+            message = Frame.encode(JSONSerializer.dumps(event.model_dump(mode="json")), f"participant:{event.data['id']}")
+
+        broadcaster.dispatch(CHANNEL, message)
+        await asyncio.sleep(0)
+
+    while not done.is_set() and any(len(subscription) for subscription in subscriptions):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    for subscription in subscriptions:
+        broadcaster.detach(subscription)
+
+    dropped = sum(subscription.dropped + subscription.coalesced for subscription in subscriptions)
+    return elapsed, counter[0], dropped
+
+
+async def run_benchmark(clients: int, count: int, policy: SendPolicy, queue_size: int) -> None:
+    events = [create_event(index) for index in range(count)]
+    cases = {
+        "serialize per socket (send_text)": send_per_socket,
+        "serialize once, shared text frame": send_text,
+        "serialize once, shared bytes frame": send_bytes,
+    }
+
+    print(f"Broadcasting {count} events to {clients} local sockets, policy '{policy}', queue size {queue_size}")
+
+    baseline = None
+    for name, sender in cases.items():
+        elapsed, delivered, skipped = await run_case(sender, clients, events, policy, queue_size)
+        rate = delivered / elapsed
+        baseline = baseline or rate
+        print(
+            f"{name:<40} {count / elapsed:>10.1f} events/s {rate:>14.0f} deliveries/s"
+            f"  skipped {skipped:>7}  x{rate / baseline:.2f}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Lobby broadcast fan-out benchmark.")
+
+    parser.add_argument("--clients", type=int, default=10000, help="Local socket clients (default: 10000)")
+    parser.add_argument("--count", type=int, default=100, help="Events to broadcast (default: 100)")
+    parser.add_argument("--queue-size", type=int, default=100, help="Per-connection queue size (default: 100)")
+    parser.add_argument(
+        "--policy",
+        choices=[policy.value for policy in SendPolicy],
+        default=SendPolicy.DROP_OLDEST.value,
+        help="Slow consumer policy (default: drop_oldest)"
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_benchmark(args.clients, args.count, SendPolicy(args.policy), args.queue_size))
@@ -0,0 +1,124 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import time
+from itertools import count
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.core.redis import RedisClient
+from app.modules.lobby.matchmaking.matcher import Matchmaker, MatchResult
+from app.modules.lobby.matchmaking.queue import MatchmakingQueue, QueuedPlayer
+
+
+class LocalSession:
+
+    async def __aenter__(self) -> "LocalSession":
+        return self
+
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class LocalMatchmaker(Matchmaker):
+
+    def __init__(self, *args, algorithms: dict[int, tuple[str, int]], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.algorithms = algorithms
+        self.lobby_ids = count(1)
+
+
+    async def get_algorithms(self, db, algorithm_ids: list[int]) -> dict[int, tuple[str, int]]:
+        return {algorithm_id: self.algorithms[algorithm_id] for algorithm_id in algorithm_ids if algorithm_id in self.algorithms}
+
+
+    async def get_open_lobbies(self, db, algorithm_id: int, size: int) -> list[tuple[int, int]]:
+        return []
+
+
+    async def commit(self, db, algorithm_id: int, name: str, fills: dict, groups: list[list[QueuedPlayer]]) -> MatchResult:
+        matches = {}
+        for group in groups:
+            lobby_id = next(self.lobby_ids)
+            matches.update((user_id, lobby_id) for user_id, _ in group)
+
+        return matches, [], []
+
+
+async def fill_queue(queue: MatchmakingQueue, players: int, algorithms: int, chunk: int = 10000) -> float:
+    start = time.perf_counter()
+    now = time.time()
+
+    for offset in range(0, players, chunk):
+        batch: dict[int, list[QueuedPlayer]] = {}
+        for user_id in range(offset + 1, min(offset + chunk, players) + 1):
+            batch.setdefault(user_id % algorithms + 1, []).append((user_id, now + user_id / players))
+
+        for algorithm_id, queued in batch.items():
+            await queue.enqueue_many(algorithm_id, queued)
+
+    return time.perf_counter() - start
+
+
+async def clear(queue: MatchmakingQueue) -> None:
+    keys = [key async for key in queue.redis.scan_iter(f"{queue.prefix}:*", count=10000)]
+    for index in range(0, len(keys), 10000):
+        await queue.redis.delete(*keys[index:index + 10000])
+
+
+async def run_benchmark(players: int, algorithms: int, teams_count: int, team_size: int, batch_size: int) -> None:
+    queue = MatchmakingQueue(RedisClient, "benchmark:matchmaking")
+    matchmaker = LocalMatchmaker(
+        queue,
+        LocalSession,
+        team_size=team_size,
+        batch_size=batch_size,
+        algorithms={algorithm_id: (f"Algorithm {algorithm_id}", teams_count) for algorithm_id in range(1, algorithms + 1)},
+    )
+
+    await clear(queue)
+    try:
+        enqueue_time = await fill_queue(queue, players, algorithms)
+        print(
+            f"Queued {players} players over {algorithms} algorithms in {enqueue_time:.2f}s"
+            f" ({players / enqueue_time:.0f} players/s)"
+        )
+
+        start = time.perf_counter()
+        rounds = 0
+        while await matchmaker.match_all():
+            rounds += 1
+        elapsed = time.perf_counter() - start
+
+        stats = matchmaker.stats
+        print(
+            f"Matched {stats.matched} players into {stats.lobbies_created} lobbies of {teams_count * team_size}"
+            f" in {rounds} rounds, {elapsed:.2f}s"
+        )
+        print(f"{stats.matched / elapsed:>10.0f} players/s {stats.lobbies_created / elapsed:>10.0f} matches/s")
+        print(f"Left in queue: {players - stats.matched}")
+    finally:
+        await clear(queue)
+        await RedisClient.aclose()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Matchmaking queue throughput benchmark against the configured Redis.")
+
+    parser.add_argument("--players", type=int, default=100000, help="Queued players (default: 100000)")
+    parser.add_argument("--algorithms", type=int, default=4, help="Algorithms players queue for (default: 4)")
+    parser.add_argument("--teams-count", type=int, default=2, help="Teams per lobby (default: 2)")
+    parser.add_argument("--team-size", type=int, default=5, help="Players per team (default: 5)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Players popped per round (default: 1000)")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_benchmark(args.players, args.algorithms, args.teams_count, args.team_size, args.batch_size))
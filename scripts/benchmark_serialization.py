@@ -0,0 +1,105 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import JSONSerializer, orjson
+from app.shared.db.base import Algorithm, Lobby, LobbyParticipant, Team, User
+from app.modules.auth.user.enums import UserRole
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
+from app.modules.lobby.participant.schemas import LobbyParticipantRead
+from app.modules.user.data.models import UserData
+
+
+RESPONSE_MODEL = list[LobbyParticipantRead]
+
+
+def create_participants(count: int) -> list[LobbyParticipant]:
+    host = User(id=1, username="host", email="host@example.com", role=UserRole.USER)
+    host.data = UserData(id=1, first_name="Host", created_at=datetime.now(timezone.utc))
+    algorithm = Algorithm(id=1, name="Algorithm", algorithm="BB PP T", teams_count=2, creator_id=1)
+    lobby = Lobby(id=1, name="Lobby", host=host, algorithm=algorithm, status=LobbyStatus.ACTIVE)
+    teams = [Team(id=i, name=f"Team {i}", lobby=lobby) for i in range(1, 3)]
+
+    participants = []
+    for i in range(1, count + 1):
+        user = User(id=i + 1, username=f"user{i}", email=f"user{i}@example.com", role=UserRole.USER)
+        user.data = UserData(id=i + 1, first_name=f"First {i}", last_name=f"Last {i}", created_at=datetime.now(timezone.utc))
+
+        participant = LobbyParticipant(
+            id=i,
+            user=user,
+            lobby=lobby,
+            team=teams[i % 2],
+            role=LobbyParticipantRole.PLAYER,
+            is_active=True,
+        )
+        participants.append(participant)
+
+    return participants
+
+
+def serialize_default(adapter: TypeAdapter, participants: list[LobbyParticipant]) -> bytes:
+    value = adapter.validate_python(participants, from_attributes=True)
+    content = jsonable_encoder(adapter.dump_python(value, mode="json"))
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def serialize_fast_response(adapter: TypeAdapter, participants: list[LobbyParticipant]) -> bytes:
+    value = adapter.validate_python(participants, from_attributes=True)
+    return JSONSerializer.dumps(adapter.dump_python(value, mode="json"))
+
+
+def serialize_trusted(participants: list[LobbyParticipant]) -> bytes:
+    return JSONSerializer.dump_model(RESPONSE_MODEL, participants)
+
+
+def run_benchmark(count: int, number: int, repeat: int) -> None:
+    participants = create_participants(count)
+    adapter = TypeAdapter(RESPONSE_MODEL)
+
+    cases = {
+        "stdlib json (validate + encode + json.dumps)": lambda: serialize_default(adapter, participants),
+        f"fast response ({'orjson' if orjson else 'stdlib'})": lambda: serialize_fast_response(adapter, participants),
+        "trusted (precompiled TypeAdapter.dump_json)": lambda: serialize_trusted(participants),
+    }
+
+    payloads = {name: case() for name, case in cases.items()}
+    reference = json.loads(next(iter(payloads.values())))
+    for name, payload in payloads.items():
+        if json.loads(payload) != reference:
+            raise RuntimeError(f"Payload mismatch for '{name}'")
+
+    print(f"Serializing list[LobbyParticipantRead] of {count} elements, {number} loops x {repeat} runs")
+    print(f"Payload size: {len(payloads[name])} bytes")
+
+    baseline = None
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        baseline = baseline or best
+        print(f"{name:<48} {best * 1e6:>10.1f} us/response  x{baseline / best:.2f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Response serialization benchmark.")
+
+    parser.add_argument("--count", type=int, default=100, help="Elements per response (default: 100)")
+    parser.add_argument("--number", type=int, default=200, help="Responses per run (default: 200)")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs (default: 5)")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_benchmark(args.count, args.number, args.repeat)
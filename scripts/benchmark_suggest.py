@@ -0,0 +1,170 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import random
+import time
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.dependencies.database import get_async_session
+from app.main import app
+from app.modules.auth.token.services.token import TokenService
+from app.modules.auth.user.crud import UserCRUD
+from app.modules.auth.user.models import User
+from app.shared.db.base import Base
+
+
+EMAIL_DOMAIN = "benchmark.local"
+PREFIX_ALPHABET = "0123456789abcdef"
+
+
+async def seed_users(engine: AsyncEngine, users: int, chunk: int = 100000) -> float:
+    start = time.perf_counter()
+
+    async with engine.begin() as conn:
+        for offset in range(0, users, chunk):
+            await conn.execute(
+                text(
+                    'INSERT INTO "user" (username, email, password, role, version) '
+                    "SELECT substr(md5(i::text), 1, 8) || '_' || i, 'user' || i || '@' || CAST(:domain AS text), 'x', 'USER', 1 "
+                    "FROM generate_series(CAST(:start AS integer), CAST(:end AS integer)) AS i"
+                ),
+                {"domain": EMAIL_DOMAIN, "start": offset + 1, "end": min(offset + chunk, users)},
+            )
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text('ANALYZE "user"'))
+
+    return time.perf_counter() - start
+
+
+async def clear_users(engine: AsyncEngine) -> None:
+    benchmark_users = 'SELECT id FROM "user" WHERE email LIKE :pattern'
+    params = {"pattern": f"%@{EMAIL_DOMAIN}"}
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DELETE FROM token WHERE user_id IN ({benchmark_users})"), params)
+        await conn.execute(text(f'DELETE FROM "user" WHERE id IN ({benchmark_users})'), params)
+
+
+async def create_headers(SessionLocalAsync: sessionmaker) -> dict[str, str]:
+    async with SessionLocalAsync() as db:
+        user = User(username="benchmark_host", email=f"host@{EMAIL_DOMAIN}", password="x")
+        db.add(user)
+        await db.commit()
+
+        token = await TokenService(db).create_access_token(user)
+        return {"Authorization": f"Bearer {token.token}"}
+
+
+def percentile(latencies: list[float], value: float) -> float:
+    return latencies[min(int(len(latencies) * value), len(latencies) - 1)]
+
+
+def report(name: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    print(
+        f"{name:<10} p50 {percentile(latencies, 0.50) * 1000:.2f} ms  p95 {percentile(latencies, 0.95) * 1000:.2f} ms"
+        f"  p99 {percentile(latencies, 0.99) * 1000:.2f} ms  max {latencies[-1] * 1000:.2f} ms"
+        f"  ({len(latencies) / sum(latencies):.0f} requests/s)"
+    )
+
+
+async def measure_query(SessionLocalAsync: sessionmaker, prefixes: list[str], limit: int) -> list[float]:
+    latencies = []
+    async with SessionLocalAsync() as db:
+        crud = UserCRUD(db)
+        for prefix in prefixes:
+            start = time.perf_counter()
+            await crud.suggest(prefix, limit)
+            latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+async def run_benchmark(db_name: str, users: int, requests: int, limit: int, cached: bool, keep: bool) -> None:
+    url = settings.DATABASE_URL_ASYNC if db_name == "main" else settings.DATABASE_URL_TEST_ASYNC
+    print(f"Working with: {url}")
+
+    engine = create_async_engine(url)
+    SessionLocalAsync = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_async_session():
+        async with SessionLocalAsync() as session:
+            yield session
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+
+    if db_name == "test":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    await clear_users(engine)
+    try:
+        seed_time = await seed_users(engine, users)
+        print(f"Seeded {users} users in {seed_time:.2f}s")
+
+        headers = await create_headers(SessionLocalAsync)
+        prefixes = [
+            "".join(random.choices(PREFIX_ALPHABET, k=random.randint(1, 3)))
+            for _ in range(requests)
+        ]
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark") as client:
+            for prefix in prefixes[:50]:
+                await client.get("/api/v1/users/suggest", params={"prefix": prefix, "limit": limit}, headers=headers)
+
+            latencies = []
+            for prefix in prefixes:
+                if not cached:
+                    cache.flush()
+
+                start = time.perf_counter()
+                response = await client.get("/api/v1/users/suggest", params={"prefix": prefix, "limit": limit}, headers=headers)
+                latencies.append(time.perf_counter() - start)
+
+                if response.status_code != 200:
+                    raise RuntimeError(f"Suggest failed with {response.status_code}: {response.text}")
+
+        print(f"{requests} requests, limit {limit}, cache {'on' if cached else 'flushed per request'}")
+        report("endpoint", latencies)
+        report("query", await measure_query(SessionLocalAsync, prefixes, limit))
+    finally:
+        if not keep:
+            await clear_users(engine)
+        await engine.dispose()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Username suggest latency benchmark through the API against a seeded database.")
+
+    parser.add_argument(
+        "--db",
+        choices=["main", "test"],
+        default="test",
+        help="Database to seed, tables are created for the test database (default: test)"
+    )
+    parser.add_argument("--users", type=int, default=1000000, help="Seeded users (default: 1000000)")
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests (default: 2000)")
+    parser.add_argument("--limit", type=int, default=settings.USER_SUGGEST_LIMIT, help="Suggestions per request (default: USER_SUGGEST_LIMIT)")
+    parser.add_argument("--cached", action="store_true", help="Keep the response cache between requests")
+    parser.add_argument("--keep", action="store_true", help="Keep seeded users after the run")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_benchmark(args.db, args.users, args.requests, args.limit, args.cached, args.keep))
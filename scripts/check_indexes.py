@@ -0,0 +1,54 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sqlalchemy import MetaData, create_engine
+
+from app.core.config import settings
+from app.shared.db.base import Base
+from app.shared.db.indexes import find_unindexed_columns
+
+
+def load_metadata(db_name: str) -> MetaData:
+    if db_name == "models":
+        return Base.metadata
+
+    url = settings.DATABASE_URL_SYNC if db_name == "main" else settings.DATABASE_URL_TEST_SYNC
+    print(f"Working with: {url}")
+
+    metadata = MetaData()
+    metadata.reflect(bind=create_engine(url), only=list(Base.metadata.tables.keys()))
+    return metadata
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Reports filter and foreign key columns without an index.")
+
+    parser.add_argument(
+        "--db",
+        choices=["models", "main", "test"],
+        default="models",
+        help="Check model metadata or reflect a live database (default: models)"
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    unindexed = find_unindexed_columns(load_metadata(args.db))
+
+    if not unindexed:
+        print("All filter and foreign key columns are indexed.")
+        sys.exit(0)
+
+    print(f"Found {len(unindexed)} unindexed column(s):")
+    for column in unindexed:
+        print(f"  {column}")
+
+    sys.exit(1)
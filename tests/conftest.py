@@ -7,6 +7,10 @@ load_dotenv()
 
 from tests.test_config.fixtures.database import *
 from tests.test_config.fixtures.client import *
+from tests.test_config.fixtures.redis import *
+from tests.test_config.fixtures.core import *
+from tests.test_config.fixtures.modules import *
+from tests.test_config.fixtures.components import *
 
 from tests.test_config.fixtures.routes import *
 
@@ -6,6 +6,7 @@ from fastapi import Response
 from httpx import AsyncClient
 
 from app.modules.auth.user.models import User
+from app.modules.auth.user.services.user import UserService
 
 from tests.test_config.classes.setup import BaseTestSetup
 from tests.test_config.factories.general_factory import GeneralFactory
@@ -120,6 +121,48 @@ class TestUpdateUser(BaseTestUpdateUser):
             assert error_substr in str(json_data["detail"]), f"Expected error '{error_substr}', got '{json_data["detail"]}'"
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("update_data", params.UPDATE_USER_DATA_DUPLICATES)
+    @pytest.mark.parametrize("duplicate_email", [False])
+    @pytest.mark.parametrize("duplicate_username, expected_status, error_substr", params.UPDATE_USER_DUPLICATE_USERNAME_EXPECT_ERROR)
+    async def test_duplicate_username_missed_by_availability_filter(self,
+            client_async: AsyncClient,
+            base_user: BaseUserData,
+            duplicate_user: Optional[User],
+            update_data: InputData,
+            duplicate_email: bool,
+            duplicate_username: bool,
+            expected_status: int,
+            error_substr: str,
+            monkeypatch: pytest.MonkeyPatch
+    ):
+        async def is_available(username: str, email: str) -> bool:
+            return True
+
+        monkeypatch.setattr(UserService.availability, "is_available", is_available)
+
+        response = await self._send_update_request(client_async, base_user, update_data)
+        json_data = response.json()
+
+        assert response.status_code == expected_status, f"Expected {expected_status}, got {response.status_code}"
+        if expected_status != 200:
+            assert error_substr in str(json_data["detail"]), f"Expected error '{error_substr}', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_own_username_and_email(self,
+            client_async: AsyncClient,
+            base_user: BaseUserData
+    ):
+        update_data = {"username": base_user.user.username, "email": base_user.user.email}
+
+        response = await self._send_update_request(client_async, base_user, update_data)
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert "access_token" in json_data, "Response does not contain access_token"
+
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("update_data", params.UPDATE_USER_DATA_VALID)
     async def test_successful_update(self,
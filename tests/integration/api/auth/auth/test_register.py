@@ -4,6 +4,8 @@ from fastapi import Response
 
 from httpx import AsyncClient
 
+from app.modules.auth.user.services.user import UserService
+
 from tests.test_config.classes.setup import BaseTestSetup
 from tests.test_config.utils.constants import Roles
 from tests.test_config.utils.dataclasses import BaseUserData
@@ -62,6 +64,34 @@ class TestRegisterUser(BaseTestRegisterUser):
         assert error_message in json_data["detail"], f"Expected error '{error_message}', got '{json_data["detail"]}'"
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("user_data", params.REGISTER_USER_VALID_DATA)
+    @pytest.mark.parametrize("duplicate_field, expected_status, error_message", params.REGISTER_USER_DUPLICATE_DATA)
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_register_duplicate_missed_by_availability_filter(self,
+            client_async: AsyncClient,
+            existing_user: InputData,
+            user_data: InputData,
+            duplicate_field: str,
+            expected_status: int,
+            error_message: str,
+            monkeypatch: pytest.MonkeyPatch
+    ):
+        async def is_available(username: str, email: str) -> bool:
+            return True
+
+        monkeypatch.setattr(UserService.availability, "is_available", is_available)
+
+        new_user_data = user_data.copy()
+        new_user_data[duplicate_field] = existing_user[duplicate_field]
+
+        response = await self._send_post_request(client_async, new_user_data)
+        json_data = response.json()
+
+        assert response.status_code == expected_status, f"Expected {expected_status}, got {response.status_code}"
+        assert error_message in json_data["detail"], f"Expected error '{error_message}', got '{json_data["detail"]}'"
+
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("user_data, error_message", params.REGISTER_USER_INVALID_DATA)
     async def test_register_invalid_data(self, 
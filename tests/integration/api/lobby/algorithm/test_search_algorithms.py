@@ -0,0 +1,91 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.algorithm.models import Algorithm
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestSearchAlgorithms(BaseTestSetup):
+    route = "/api/v1/algorithm/list"
+
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            params: InputData,
+            headers: Optional[InputData] = None,
+            route: Optional[str] = None
+    ) -> Response:
+        return await client_async.get(route or self.route, params=params, headers=headers or {})
+
+
+    @pytest.fixture
+    async def algorithms(self, general_factory: GeneralFactory, base_user: BaseUserData) -> list[Algorithm]:
+        data = [
+            ("Snake Draft", "classic snake pick order"),
+            ("Captain Draft", "captains pick in turns"),
+        ]
+
+        return [
+            await general_factory.algorithm_factory.crud.create(Algorithm(
+                name=name, description=description, algorithm="BB PP T", teams_count=2, creator_id=base_user.user.id
+            ))
+            for name, description in data
+        ]
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestSearchAlgorithms(BaseTestSearchAlgorithms):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    @pytest.mark.parametrize("search, expected", [
+        ("draft", [0, 1]),
+        ("snake", [0]),
+        ("pick turns", [1]),
+        ("draft -captain", [0]),
+        ("auction", []),
+    ])
+    async def test_search_algorithms_success(self,
+            client_async: AsyncClient,
+            algorithms: list[Algorithm],
+            base_user: BaseUserData,
+            search: str,
+            expected: list[int]
+    ):
+        response = await self._send_get_request(client_async, {"search": search}, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [algorithms[i].id for i in expected], f"Unexpected algorithms for '{search}'"
+
+        response = await self._send_get_request(client_async, {"search": search}, base_user.headers, "/api/v1/algorithm/list-count")
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["total_count"] == len(expected), f"Unexpected algorithm count for '{search}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_search_algorithms_sorts_equal_ranks(self,
+            client_async: AsyncClient,
+            algorithms: list[Algorithm],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, {"search": "draft", "sort_order": "desc"}, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [algorithms[1].id, algorithms[0].id], "Equal ranks must follow sort_by"
+
+
+    @pytest.mark.asyncio
+    async def test_search_algorithms_unauthorized(self, client_async: AsyncClient):
+        response = await self._send_get_request(client_async, {"search": "draft"})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
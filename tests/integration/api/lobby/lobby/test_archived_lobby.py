@@ -0,0 +1,208 @@
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.archive.archiver import LobbyArchiver
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.fixtures.database import get_engine_and_session_async
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestArchivedLobby(BaseTestSetup):
+    route = "/api/v1/lobby"
+
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            path: str,
+            headers: Optional[InputData] = None,
+            params: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.get(f"{self.route}{path}", headers=headers or {}, params=params)
+
+
+    async def _close_lobby(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby], headers: InputData) -> None:
+        response = await client_async.put(f"{self.route}/{lobby.id}/close", headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+
+    async def _archive(self, retention_days: int = 30, batch_size: int = 500) -> int:
+        engine_async, SessionLocalAsync = get_engine_and_session_async()
+        archiver = LobbyArchiver(SessionLocalAsync, retention_days=retention_days, batch_size=batch_size)
+
+        try:
+            return await archiver.archive(datetime.now(timezone.utc) + timedelta(days=retention_days, minutes=1))
+        finally:
+            await engine_async.dispose()
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestArchivedLobby(BaseTestArchivedLobby):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_reads(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        await self._close_lobby(client_async, lobby, base_user.headers)
+        assert await self._archive() == 1, "Closed lobby was not archived"
+
+        archived = {"archived": True}
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}", base_user.headers, archived)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["name"] == lobby.data.name, "Archived lobby name does not match"
+        assert response.json()["status"] == LobbyStatus.ARCHIVED, "Archived lobby status does not match"
+
+        response = await self._send_get_request(client_async, "/list", base_user.headers, {**archived, "only_active": False})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [lobby.id], "Archived lobby list does not match"
+
+        response = await self._send_get_request(client_async, "/list-count", base_user.headers, {**archived, "only_active": False})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["total_count"] == 1, "Archived lobby count does not match"
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}/participants", base_user.headers, archived)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [participant.id], "Archived participants do not match"
+
+        response = await client_async.get(f"/api/v1/teams/{team.id}", headers=base_user.headers, params=archived)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["lobby"]["id"] == lobby.id, "Archived team lobby does not match"
+
+        response = await client_async.get("/api/v1/teams/list", headers=base_user.headers, params={**archived, "lobby_id": lobby.id})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [team.id], "Archived team list does not match"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_leaves_live_tables(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        await self._close_lobby(client_async, lobby, base_user.headers)
+        assert await self._archive() == 1, "Closed lobby was not archived"
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}", base_user.headers)
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+        response = await self._send_get_request(client_async, "/list", base_user.headers, {"only_active": False})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json() == [], "Archived lobby is still listed"
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}/participants", base_user.headers)
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+        response = await client_async.get(f"/api/v1/teams/{team.id}", headers=base_user.headers)
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_keeps_recently_closed(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        await self._close_lobby(client_async, lobby, base_user.headers)
+
+        engine_async, SessionLocalAsync = get_engine_and_session_async()
+        try:
+            assert await LobbyArchiver(SessionLocalAsync, retention_days=30).archive() == 0, "Lobby was archived before retention"
+        finally:
+            await engine_async.dispose()
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}", base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        response = await self._send_get_request(client_async, f"/{lobby.id}", base_user.headers, {"archived": True})
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_follows_status_updates(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await client_async.put(f"{self.route}/{lobby.id}", json={"status": LobbyStatus.ARCHIVED}, headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        response = await client_async.put(f"{self.route}/{lobby.id}", json={"status": LobbyStatus.ACTIVE}, headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert await self._archive() == 0, "Reopened lobby was archived"
+
+        response = await client_async.put(f"{self.route}/{lobby.id}", json={"status": LobbyStatus.ARCHIVED}, headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert await self._archive() == 1, "Lobby archived through an update was not archived"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_moves_in_batches(self,
+            client_async: AsyncClient,
+            general_factory: GeneralFactory,
+            base_user: BaseUserData
+    ):
+        algorithm = await general_factory.create_conditional_algorithm(base_user.user)
+        for i in range(1, 6):
+            lobby = await general_factory.lobby_factory.create(base_user.user, algorithm.data, i)
+            await self._close_lobby(client_async, BaseObjectData(lobby.id, lobby), base_user.headers)
+
+        assert await self._archive(batch_size=2) == 5, "Archiver must keep going until a partial batch"
+
+        response = await self._send_get_request(client_async, "/list-count", base_user.headers, {"archived": True, "only_active": False})
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["total_count"] == 5, "Archived lobby count does not match"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_not_found(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, f"/{lobby.id}", base_user.headers, {"archived": True})
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Lobby not found" in json_data["detail"], f"Expected error message 'Lobby not found', got: '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_archived_lobby_unauthorized(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby]):
+        response = await self._send_get_request(client_async, f"/{lobby.id}", params={"archived": True})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
@@ -70,6 +70,24 @@ class TestConnectToLobby(BaseTestConnectToLobby):
         assert "User already in lobby" in json_data["detail"], f"Expected error message 'User already in lobby', got '{json_data["detail"]}'"
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    async def test_connect_to_lobby_after_leave(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        first_response = await self._send_post_request(client_async, lobby, base_user.headers)
+        leave_response = await client_async.delete(f"/api/v1/lobby/{lobby.id}/leave", headers=base_user.headers)
+        response = await self._send_post_request(client_async, lobby, base_user.headers)
+        json_data = response.json()
+
+        assert leave_response.status_code == 200, f"Expected 200, got {leave_response.status_code}"
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert json_data["id"] == first_response.json()["id"], "Participant was duplicated instead of reactivated"
+        assert json_data["is_active"] is True, "Participant was not reactivated"
+
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("lobby_exists", [True])
     async def test_connect_to_lobby_unauthorized(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby]):
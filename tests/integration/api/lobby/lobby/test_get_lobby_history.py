@@ -0,0 +1,124 @@
+import pytest
+
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.schemas import LobbyEvent
+from app.modules.lobby.events.writer import LobbyEventWriter
+from app.modules.lobby.lobby.crud import LobbyCRUD
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.lobby.schemas import LobbyRead
+from app.modules.lobby.participant.crud import LobbyParticipantCRUD
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.participant.schemas import LobbyParticipantRead
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.fixtures.database import get_engine_and_session_async
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestGetLobbyHistory(BaseTestSetup):
+    route = "/api/v1/lobby/{lobby_id}/history"
+
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            headers: Optional[InputData] = None,
+            params: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.get(self.route.format(lobby_id=lobby.id), headers=headers or {}, params=params)
+
+
+    async def _write_history(self, lobby: BaseObjectData[Lobby]) -> datetime:
+        engine_async, SessionLocalAsync = get_engine_and_session_async()
+        writer = LobbyEventWriter(SessionLocalAsync)
+
+        try:
+            await writer.snapshot(lobby.id)
+
+            async with SessionLocalAsync() as db:
+                lobby_data = LobbyRead.model_validate(await LobbyCRUD(db).get_by_id(lobby.id), from_attributes=True)
+                participants = await LobbyParticipantCRUD(db).get_list(
+                    {"lobby_id": lobby.id, "all_db_participants": False}, limit=None
+                )
+
+            participant_data = LobbyParticipantRead.model_validate(participants[0], from_attributes=True)
+            participant_data.is_active = False
+
+            writer.append(LobbyEvent(
+                type=LobbyEventType.LOBBY_UPDATED,
+                lobby_id=lobby.id,
+                data=lobby_data.model_copy(update={"name": "Renamed Lobby"}).model_dump(mode="json")
+            ))
+            writer.append(LobbyEvent(
+                type=LobbyEventType.PARTICIPANT_LEFT,
+                lobby_id=lobby.id,
+                data=participant_data.model_dump(mode="json")
+            ))
+            at = datetime.now(timezone.utc)
+
+            assert await writer.flush(), "Lobby events were not written"
+        finally:
+            await engine_async.dispose()
+
+        return at
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestGetLobbyHistory(BaseTestGetLobbyHistory):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_history_success(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        at = await self._write_history(lobby)
+
+        response = await self._send_get_request(client_async, lobby, base_user.headers, {"at": at.isoformat()})
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert json_data["lobby"]["name"] == "Renamed Lobby", "Lobby event was not replayed over the snapshot"
+        assert json_data["lobby"]["host"]["id"] == base_user.user.id, "Lobby host does not match"
+        assert json_data["lobby"]["host"]["role"] == str(base_user.user.role), "Lobby host role does not match"
+        assert [item["id"] for item in json_data["participants"]] == [participant.id], "Participants do not match"
+        assert json_data["participants"][0]["is_active"] is False, "Participant event was not replayed over the snapshot"
+
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["lobby"]["name"] == lobby.data.name, "Latest snapshot must reflect the stored lobby"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_history_before_first_snapshot(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, lobby, base_user.headers, {"at": "2000-01-01T00:00:00Z"})
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Lobby not found" in json_data["detail"], f"Expected error message 'Lobby not found', got: '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_history_unauthorized(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby]):
+        response = await self._send_get_request(client_async, lobby)
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
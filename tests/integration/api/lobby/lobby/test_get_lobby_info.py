@@ -16,8 +16,13 @@ from tests.test_config.utils.types import InputData
 class BaseTestGetLobby(BaseTestSetup):
     route = "/api/v1/lobby/{lobby_id}"
 
-    async def _send_get_request(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby], headers: Optional[InputData] = None) -> Response:
-        return await client_async.get(self.route.format(lobby_id=lobby.id), headers=headers or {})
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            headers: Optional[InputData] = None,
+            params: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.get(self.route.format(lobby_id=lobby.id), headers=headers or {}, params=params)
 
 
 @pytest.mark.usefixtures("client_async")
@@ -41,6 +46,50 @@ class TestGetLobby(BaseTestGetLobby):
         assert json_data["algorithm"]["id"] == lobby.data.algorithm_id, "Algorithm ID does not match"
 
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_not_modified(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        etag = response.headers.get("etag")
+        assert etag, "ETag header is missing"
+
+        headers = {**base_user.headers, "If-None-Match": etag}
+        response = await self._send_get_request(client_async, lobby, headers)
+        assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+        assert response.headers.get("etag") == etag, "ETag does not match"
+
+        update_response = await client_async.put(self.route.format(lobby_id=lobby.id), json={"name": "Changed Lobby"}, headers=base_user.headers)
+        assert update_response.status_code == 200, f"Expected 200, got {update_response.status_code}"
+
+        response = await self._send_get_request(client_async, lobby, headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.headers.get("etag") != etag, "ETag was not changed after update"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_sparse_fields(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, lobby, base_user.headers, {"fields": "id,name,algorithm.id"})
+        full_response = await self._send_get_request(client_async, lobby, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json() == {"id": lobby.id, "name": lobby.data.name, "algorithm": {"id": lobby.data.algorithm_id}}
+        assert response.headers.get("etag") != full_response.headers.get("etag"), "Sparse and full representations share an ETag"
+
+        response = await self._send_get_request(client_async, lobby, base_user.headers, {"fields": "id,unknown"})
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("lobby_exists", [False])
     @pytest.mark.parametrize("role", Roles.LIST)
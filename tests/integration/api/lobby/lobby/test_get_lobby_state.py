@@ -0,0 +1,126 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestGetLobbyState(BaseTestSetup):
+    route = "/api/v1/lobby/{lobby_id}/state"
+
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            headers: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.get(self.route.format(lobby_id=lobby.id), headers=headers or {})
+
+
+    async def _assign_team(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            participant: BaseObjectData[LobbyParticipant],
+            team: BaseObjectData[Team],
+            headers: InputData
+    ) -> None:
+        update_data = {"team_id": team.id, "role": LobbyParticipantRole.PLAYER}
+        response = await client_async.put(f"/api/v1/lobby/{lobby.id}/participants/{participant.id}", json=update_data, headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestGetLobbyState(BaseTestGetLobbyState):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_state_success(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            participant_other: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        await self._assign_team(client_async, lobby, participant, team, base_user.headers)
+
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        json_data = response.json()
+
+        lobby_response = await client_async.get(f"/api/v1/lobby/{lobby.id}", headers=base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert json_data["lobby"] == lobby_response.json(), "Lobby state does not match the lobby"
+        assert json_data["lobby"]["algorithm"]["compiled"]["total_steps"] == 5, "Compiled algorithm is missing"
+
+        assert [item["id"] for item in json_data["teams"]] == [team.id], "Teams do not match"
+        members = json_data["teams"][0]["members"]
+        assert [member["id"] for member in members] == [participant.id], "Team members do not match"
+        assert members[0]["user"]["id"] == participant.data.user_id, "Team member user does not match"
+        assert members[0]["role"] == LobbyParticipantRole.PLAYER, "Team member role does not match"
+
+        assert [member["id"] for member in json_data["spectators"]] == [participant_other.id], "Spectators do not match"
+        assert json_data["spectators"][0]["user"]["id"] == participant_other.data.user_id, "Spectator user does not match"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_state_reflects_updates(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["teams"][0]["members"] == [], "Team must start empty"
+
+        await self._assign_team(client_async, lobby, participant, team, base_user.headers)
+
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [member["id"] for member in json_data["teams"][0]["members"]] == [participant.id], "Cached state was not invalidated"
+        assert json_data["spectators"] == [], "Cached state was not invalidated"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_state_not_found(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, lobby, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Lobby not found" in json_data["detail"], f"Expected error message 'Lobby not found', got: '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_get_lobby_state_unauthorized(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby]):
+        response = await self._send_get_request(client_async, lobby)
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
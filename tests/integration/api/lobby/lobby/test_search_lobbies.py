@@ -0,0 +1,104 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.lobby.models import Lobby
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestSearchLobbies(BaseTestSetup):
+    route = "/api/v1/lobby/list"
+
+    async def _send_get_request(self,
+            client_async: AsyncClient,
+            params: InputData,
+            headers: Optional[InputData] = None,
+            route: Optional[str] = None
+    ) -> Response:
+        return await client_async.get(route or self.route, params=params, headers=headers or {})
+
+
+    @pytest.fixture
+    async def lobbies(self, general_factory: GeneralFactory, base_user: BaseUserData) -> list[Lobby]:
+        algorithm = (await general_factory.create_conditional_algorithm(base_user.user)).data
+        data = [
+            ("Ranked Cup", "Finals"),
+            ("Ranked Ladder", "ranked practice"),
+            ("Casual Night", "just for fun"),
+        ]
+
+        return [
+            await general_factory.lobby_factory.crud.create(Lobby(
+                name=name, description=description, host_id=base_user.user.id, algorithm_id=algorithm.id
+            ))
+            for name, description in data
+        ]
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestSearchLobbies(BaseTestSearchLobbies):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    @pytest.mark.parametrize("search, expected", [
+        ("ranked", [1, 0]),
+        ("RANKED cup", [0]),
+        ("ranked -cup", [1]),
+        ('"casual night"', [2]),
+        ("fun", [2]),
+        ("tournament", []),
+    ])
+    async def test_search_lobbies_success(self,
+            client_async: AsyncClient,
+            lobbies: list[Lobby],
+            base_user: BaseUserData,
+            search: str,
+            expected: list[int]
+    ):
+        response = await self._send_get_request(client_async, {"search": search}, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [lobbies[i].id for i in expected], f"Unexpected lobbies for '{search}'"
+
+        response = await self._send_get_request(client_async, {"search": search}, base_user.headers, "/api/v1/lobby/list-count")
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["total_count"] == len(expected), f"Unexpected lobby count for '{search}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_search_lobbies_with_filters_and_pagination(self,
+            client_async: AsyncClient,
+            lobbies: list[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, {"search": "ranked", "id": lobbies[0].id}, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [lobbies[0].id], "Search must combine with filters"
+
+        response = await self._send_get_request(client_async, {"search": "ranked", "limit": 1, "offset": 1}, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in response.json()] == [lobbies[0].id], "Search must paginate in ranked order"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_search_lobbies_empty_terms(self, client_async: AsyncClient, base_user: BaseUserData):
+        response = await self._send_get_request(client_async, {"search": ""}, base_user.headers)
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+
+    @pytest.mark.asyncio
+    async def test_search_lobbies_unauthorized(self, client_async: AsyncClient):
+        response = await self._send_get_request(client_async, {"search": "ranked"})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
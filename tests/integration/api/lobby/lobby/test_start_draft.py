@@ -0,0 +1,89 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.team.models import Team
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestStartDraft(BaseTestSetup):
+    route = "/api/v1/lobby"
+
+    async def _send_post_request(self,
+            client_async: AsyncClient,
+            path: str,
+            headers: Optional[InputData] = None,
+            json_data: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.post(f"{self.route}{path}", json=json_data, headers=headers or {})
+
+
+    @pytest.fixture
+    async def teams(self, general_factory: GeneralFactory, lobby: BaseObjectData[Lobby]) -> list[Team]:
+        return [(await general_factory.create_conditional_team(lobby.data, True, i)).data for i in range(1, 3)]
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestStartDraft(BaseTestStartDraft):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_start_draft_closed_lobby(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            base_user: BaseUserData
+    ):
+        response = await client_async.put(f"{self.route}/{lobby.id}/close", headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        response = await self._send_post_request(client_async, f"/{lobby.id}/draft", base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 409, f"Expected 409, got {response.status_code}"
+        assert "Lobby is not active" in json_data["detail"], f"Expected error message 'Lobby is not active', got: '{json_data["detail"]}'"
+
+        response = await self._send_post_request(client_async, f"/{lobby.id}/draft/actions", base_user.headers, {"choice": "Mirage"})
+        assert response.status_code == 409, f"Expected 409, got {response.status_code}"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_start_draft_teams_without_players(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            base_user: BaseUserData
+    ):
+        response = await self._send_post_request(client_async, f"/{lobby.id}/draft", base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+        assert "2 teams have no players" in json_data["detail"], f"Expected error message '2 teams have no players', got: '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_draft_action_lobby_not_found(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_post_request(client_async, f"/{lobby.id}/draft/actions", base_user.headers, {"choice": "Mirage"})
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Lobby not found" in json_data["detail"], f"Expected error message 'Lobby not found', got: '{json_data["detail"]}'"
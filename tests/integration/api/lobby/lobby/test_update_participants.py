@@ -0,0 +1,197 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.models import Team
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestEditParticipants(BaseTestSetup):
+    route = "/api/v1/lobby/{lobby_id}/participants"
+
+    async def _send_put_request(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            json_data: InputData,
+            headers: Optional[InputData] = None
+    ) -> Response:
+        return await client_async.put(self.route.format(lobby_id=lobby.id), json=json_data, headers=headers or {})
+
+
+    async def _get_participants(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            headers: InputData
+    ) -> dict[int, InputData]:
+        response = await client_async.get(self.route.format(lobby_id=lobby.id), headers=headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        return {participant["id"]: participant for participant in response.json()}
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestEditParticipants(BaseTestEditParticipants):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_success(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            participant_other: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        update_data = {"participants": [
+            {"participant_id": participant.id, "team_id": team.id, "role": LobbyParticipantRole.PLAYER},
+            {"participant_id": participant_other.id, "role": LobbyParticipantRole.SPECTATOR, "is_active": False},
+        ]}
+
+        response = await self._send_put_request(client_async, lobby, update_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["id"] for item in json_data] == sorted([participant.id, participant_other.id]), "Participant IDs do not match"
+
+        participants = await self._get_participants(client_async, lobby, base_user.headers)
+        assert participants[participant.id]["team"]["id"] == team.id, "Participant team was not updated"
+        assert participants[participant.id]["role"] == LobbyParticipantRole.PLAYER, "Participant role was not updated"
+        assert participants[participant.id]["is_active"] is True, "Unset field must keep its value"
+        assert participants[participant_other.id]["role"] == LobbyParticipantRole.SPECTATOR, "Participant role was not updated"
+        assert participants[participant_other.id]["is_active"] is False, "Participant activity status was not updated"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_clears_team(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        response = await self._send_put_request(client_async, lobby, {"participants": [{"participant_id": participant.id, "team_id": team.id}]}, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()[0]["team"]["id"] == team.id, "Participant team was not updated"
+
+        response = await self._send_put_request(client_async, lobby, {"participants": [{"participant_id": participant.id, "team_id": None}]}, base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()[0]["team"] is None, "Participant team was not cleared"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_rolls_back_when_participant_is_missing(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        update_data = {"participants": [
+            {"participant_id": participant.id, "is_active": False},
+            {"participant_id": participant.id + 1000, "is_active": False},
+        ]}
+
+        response = await self._send_put_request(client_async, lobby, update_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Participant not found" in json_data["detail"], f"Expected error message 'Participant not found', got '{json_data["detail"]}'"
+
+        participants = await self._get_participants(client_async, lobby, base_user.headers)
+        assert participants[participant.id]["is_active"] is True, "Partial bulk update was not rolled back"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_team_not_found(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        update_data = {"participants": [{"participant_id": participant.id, "team_id": team.id + 1000}]}
+
+        response = await self._send_put_request(client_async, lobby, update_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Team not found" in json_data["detail"], f"Expected error message 'Team not found', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_duplicate_ids(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            participant: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        update_data = {"participants": [
+            {"participant_id": participant.id, "is_active": False},
+            {"participant_id": participant.id, "is_active": True},
+        ]}
+
+        response = await self._send_put_request(client_async, lobby, update_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+        assert "only once per request" in str(json_data["detail"]), f"Expected duplicate error, got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST_USER)
+    @pytest.mark.parametrize("role_other", Roles.LIST)
+    async def test_edit_participants_forbidden(self,
+            client_async: AsyncClient,
+            lobby_other: BaseObjectData[Lobby],
+            participant_lobby_other: BaseObjectData[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        update_data = {"participants": [{"participant_id": participant_lobby_other.id, "is_active": False}]}
+
+        response = await self._send_put_request(client_async, lobby_other, update_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+        assert "No access to control lobby" in json_data["detail"], f"Expected 'No access to control lobby', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("participant_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_edit_participants_unauthorized(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            participant: BaseObjectData[LobbyParticipant]
+    ):
+        response = await self._send_put_request(client_async, lobby, {"participants": [{"participant_id": participant.id, "is_active": False}]})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
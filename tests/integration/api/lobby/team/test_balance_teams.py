@@ -0,0 +1,198 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.models import Lobby
+from app.modules.lobby.participant.models import LobbyParticipant
+from app.modules.lobby.team.enums import TeamBalanceStrategy
+from app.modules.lobby.team.models import Team
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData, BaseObjectData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestBalanceTeams(BaseTestSetup):
+    route = "/api/v1/teams/balance"
+
+    async def _send_post_request(self, client_async: AsyncClient, json_data: InputData, headers: Optional[InputData] = None) -> Response:
+        return await client_async.post(self.route, json=json_data, headers=headers or {})
+
+
+    @pytest.fixture
+    async def players(self,
+            client_async: AsyncClient,
+            general_factory: GeneralFactory,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ) -> list[LobbyParticipant]:
+        participants = [
+            (await general_factory.create_conditional_participant(lobby.data, True, i)).data
+            for i in range(1, 5)
+        ]
+
+        update_data = {"participants": [
+            {"participant_id": participant.id, "role": LobbyParticipantRole.PLAYER} for participant in participants
+        ]}
+        response = await client_async.put(f"/api/v1/lobby/{lobby.id}/participants", json=update_data, headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        return participants
+
+
+    @pytest.fixture
+    async def teams(self, general_factory: GeneralFactory, lobby: BaseObjectData[Lobby]) -> list[Team]:
+        return [(await general_factory.create_conditional_team(lobby.data, True, i)).data for i in range(1, 3)]
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestBalanceTeams(BaseTestBalanceTeams):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_success(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            players: list[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        ratings = {participant.user_id: rating for participant, rating in zip(players, (10, 8, 6, 4))}
+        balance_data = {"lobby_id": lobby.id, "strategy": TeamBalanceStrategy.BALANCED, "ratings": ratings}
+
+        response = await self._send_post_request(client_async, balance_data, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [team["id"] for team in json_data["teams"]] == [team.id for team in teams], "Team IDs do not match"
+        assert [team["rating"] for team in json_data["teams"]] == [14.0, 14.0], "Teams are not balanced"
+
+        response = await client_async.get(f"/api/v1/lobby/{lobby.id}/participants", headers=base_user.headers)
+        assigned = {participant["id"]: participant["team"]["id"] for participant in response.json()}
+        for team in json_data["teams"]:
+            assert all(assigned[participant_id] == team["id"] for participant_id in team["participant_ids"]), "Balance was not persisted"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_is_stable(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            players: list[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        balance_data = {"lobby_id": lobby.id, "strategy": TeamBalanceStrategy.RANDOM, "seed": 7}
+
+        first = await self._send_post_request(client_async, balance_data, base_user.headers)
+        second = await self._send_post_request(client_async, balance_data, base_user.headers)
+
+        assert first.status_code == 200, f"Expected 200, got {first.status_code}"
+        assert first.json() == second.json(), "Seeded balance must be reproducible"
+        assert sorted(len(team["participant_ids"]) for team in first.json()["teams"]) == [2, 2], "Players are not split evenly"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_closed_lobby(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            players: list[LobbyParticipant],
+            base_user: BaseUserData
+    ):
+        response = await client_async.put(f"/api/v1/lobby/{lobby.id}/close", headers=base_user.headers)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+        response = await self._send_post_request(client_async, {"lobby_id": lobby.id}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 409, f"Expected 409, got {response.status_code}"
+        assert "Lobby is not active" in json_data["detail"], f"Expected error message 'Lobby is not active', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_too_many_changes(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            teams: list[Team],
+            players: list[LobbyParticipant],
+            base_user: BaseUserData,
+            monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "LOBBY_PARTICIPANTS_BULK_LIMIT", 3)
+
+        response = await self._send_post_request(client_async, {"lobby_id": lobby.id}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+        assert "Balance moves 4 participants, at most 3 are allowed" in json_data["detail"], f"Expected balance size error, got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("team_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_count_mismatch(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            team: BaseObjectData[Team],
+            base_user: BaseUserData
+    ):
+        response = await self._send_post_request(client_async, {"lobby_id": lobby.id}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+        assert "Lobby has 1 teams, algorithm requires 2" in json_data["detail"], f"Expected teams count error, got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [True])
+    @pytest.mark.parametrize("role", Roles.LIST_USER)
+    @pytest.mark.parametrize("role_other", Roles.LIST)
+    async def test_balance_teams_forbidden(self,
+            client_async: AsyncClient,
+            lobby_other: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_post_request(client_async, {"lobby_id": lobby_other.id}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+        assert "No access to control team" in json_data["detail"], f"Expected 'No access to control team', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_lobby_not_found(self,
+            client_async: AsyncClient,
+            lobby: BaseObjectData[Lobby],
+            base_user: BaseUserData
+    ):
+        response = await self._send_post_request(client_async, {"lobby_id": lobby.id}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+        assert "Lobby not found" in json_data["detail"], f"Expected error message 'Lobby not found', got '{json_data["detail"]}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lobby_exists", [False])
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_balance_teams_unauthorized(self, client_async: AsyncClient, lobby: BaseObjectData[Lobby]):
+        response = await self._send_post_request(client_async, {"lobby_id": lobby.id})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
@@ -0,0 +1,107 @@
+import pytest
+
+from typing import Optional
+from fastapi import Response
+
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.modules.auth.user.models import User
+
+from tests.test_config.classes.setup import BaseTestSetup
+from tests.test_config.factories.general_factory import GeneralFactory
+from tests.test_config.utils.constants import Roles
+from tests.test_config.utils.dataclasses import BaseUserData
+from tests.test_config.utils.types import InputData
+
+
+class BaseTestSuggestUsers(BaseTestSetup):
+    route = "/api/v1/users/suggest"
+
+    async def _send_get_request(self, client_async: AsyncClient, params: InputData, headers: Optional[InputData] = None) -> Response:
+        return await client_async.get(self.route, params=params, headers=headers or {})
+
+
+    @pytest.fixture
+    async def users(self, general_factory: GeneralFactory) -> dict[str, User]:
+        return {
+            prefix: await general_factory.user_factory.create(prefix=prefix)
+            for prefix in ("Alice", "alina", "al_ex", "alxyz", "bob")
+        }
+
+
+@pytest.mark.usefixtures("client_async")
+@pytest.mark.usefixtures("general_factory")
+class TestSuggestUsers(BaseTestSuggestUsers):
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_suggest_users_success(self,
+            client_async: AsyncClient,
+            users: dict[str, User],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, {"prefix": "AL"}, base_user.headers)
+        json_data = response.json()
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["username"] for item in json_data] == ["al_ex", "Alice", "alina", "alxyz"], "Suggestions do not match"
+        assert all(set(item) == {"id", "username"} for item in json_data), "Suggestions must only contain id and username"
+        assert json_data[1]["id"] == users["Alice"].id, "Suggested user ID does not match"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    @pytest.mark.parametrize("prefix, expected", [
+        ("al_", ["al_ex"]),
+        ("%", []),
+        ("alice", ["Alice"]),
+        ("carol", []),
+    ])
+    async def test_suggest_users_matches_literal_prefix(self,
+            client_async: AsyncClient,
+            users: dict[str, User],
+            base_user: BaseUserData,
+            prefix: str,
+            expected: list[str]
+    ):
+        response = await self._send_get_request(client_async, {"prefix": prefix}, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["username"] for item in response.json()] == expected, f"Unexpected suggestions for '{prefix}'"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    async def test_suggest_users_limit(self,
+            client_async: AsyncClient,
+            users: dict[str, User],
+            base_user: BaseUserData
+    ):
+        response = await self._send_get_request(client_async, {"prefix": "al", "limit": 2}, base_user.headers)
+
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert [item["username"] for item in response.json()] == ["al_ex", "Alice"], "Suggestions were not limited"
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("role", Roles.LIST)
+    @pytest.mark.parametrize("params", [
+        {"prefix": ""},
+        {"prefix": "al", "limit": 0},
+        {"prefix": "al", "limit": settings.USER_SUGGEST_LIMIT + 1},
+        {},
+    ])
+    async def test_suggest_users_invalid_params(self,
+            client_async: AsyncClient,
+            base_user: BaseUserData,
+            params: InputData
+    ):
+        response = await self._send_get_request(client_async, params, base_user.headers)
+        assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+
+
+    @pytest.mark.asyncio
+    async def test_suggest_users_unauthorized(self, client_async: AsyncClient):
+        response = await self._send_get_request(client_async, {"prefix": "al"})
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
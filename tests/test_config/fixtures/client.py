@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from httpx import ASGITransport, AsyncClient
 
+from app.core.cache import cache
 from app.main import app
 
 from app.dependencies.database import get_async_session
@@ -17,6 +18,7 @@ async def client_async(db_async: AsyncSession) -> AsyncGenerator[AsyncClient, No
         return db_async
     
     app.dependency_overrides[get_async_session] = override_get_async_session
+    cache.flush()
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from fakeredis import FakeAsyncRedis
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.core.responses import TrustedRoute
+from app.modules.auth.token.utils import TokenManager
+from app.modules.auth.user.enums import UserRole
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.user.data.models import UserData
+from app.shared.components.idempotency import Idempotency
+from app.shared.db.base import Algorithm, Lobby, User
+
+from tests.test_config.utils.types import HeadersFactory
+
+
+class IdempotentItem(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def idempotency_gate() -> asyncio.Event:
+    gate = asyncio.Event()
+    gate.set()
+    return gate
+
+
+@pytest.fixture
+def idempotency_created() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def idempotency_app(
+        redis_bytes_async: FakeAsyncRedis,
+        monkeypatch: pytest.MonkeyPatch,
+        idempotency_gate: asyncio.Event,
+        idempotency_created: list[str]
+) -> FastAPI:
+    monkeypatch.setattr("app.core.responses.idempotency", Idempotency(redis_bytes_async, "test"))
+    router = APIRouter(route_class=TrustedRoute)
+
+    @router.post("/items", response_model=IdempotentItem, status_code=201)
+    @Idempotency.endpoint("item.create")
+    async def create_item_(item: IdempotentItem):
+        await idempotency_gate.wait()
+        idempotency_created.append(item.name)
+        return {"name": f"{item.name}-{len(idempotency_created)}"}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest_asyncio.fixture
+async def idempotency_client(idempotency_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    async with AsyncClient(transport=ASGITransport(app=idempotency_app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def idempotency_headers() -> HeadersFactory:
+    def create(user_id: int, key: str = "abc") -> dict[str, str]:
+        token = TokenManager.create_token(TokenManager.get_encode_access_data(TokenManager.create_data(f"user{user_id}", user_id)))
+        return {"Idempotency-Key": key, "Authorization": f"Bearer {token}"}
+
+    return create
+
+
+@pytest.fixture
+def fieldset_lobby() -> Lobby:
+    host = User(id=1, username="host", email="host@example.com", role=UserRole.USER)
+    host.data = UserData(id=1, first_name="Host", created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    algorithm = Algorithm(id=2, name="Algorithm", algorithm="BB PP T", teams_count=2, creator_id=1)
+    return Lobby(id=3, name="Lobby", host=host, algorithm=algorithm, status=LobbyStatus.ACTIVE)
@@ -0,0 +1,75 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from fakeredis import FakeAsyncRedis
+from fastapi import FastAPI, Response
+
+from app.core.compression import CompressionMetrics, CompressionMiddleware
+from app.core.ownership import OwnershipCoordinator
+from app.core.scheduler import Scheduler
+
+from tests.test_config.utils.constants import COMPRESSION_PAYLOAD
+from tests.test_config.utils.fakes import FakeCounter
+from tests.test_config.utils.types import WorkerFactory
+
+
+@pytest.fixture
+def fired() -> list[list[str]]:
+    return []
+
+
+@pytest.fixture
+def scheduler(redis_async: FakeAsyncRedis, fired: list[list[str]]) -> Scheduler:
+    scheduler = Scheduler(redis_async, "timers", tick=1.0, wheel_size=8, batch_size=2)
+
+    async def handler(keys: list[str]) -> None:
+        fired.append(keys)
+
+    scheduler.register("lobby.idle", handler)
+    return scheduler
+
+
+@pytest_asyncio.fixture
+async def ownership_worker(redis_async: FakeAsyncRedis) -> AsyncGenerator[WorkerFactory, None]:
+    workers = []
+
+    def create(worker_id: str) -> tuple[OwnershipCoordinator, FakeCounter]:
+        coordinator = OwnershipCoordinator(redis_async, "test", lease_ttl=10, command_timeout=1, block_timeout=0.1, worker_id=worker_id)
+        counter = FakeCounter()
+        coordinator.register("counter", counter.handle, counter.evict)
+        workers.append(coordinator)
+        return coordinator, counter
+
+    yield create
+
+    for worker in workers:
+        await worker.stop()
+
+
+@pytest.fixture
+def compression_metrics() -> CompressionMetrics:
+    return CompressionMetrics()
+
+
+@pytest.fixture
+def compression_options() -> dict:
+    return {"minimum_size": 100}
+
+
+@pytest.fixture
+def compression_app(compression_metrics: CompressionMetrics, compression_options: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    async def get_items_(response: Response):
+        response.headers["ETag"] = '"items"'
+        return COMPRESSION_PAYLOAD
+
+    @app.get("/small")
+    async def get_small_():
+        return {"id": 1}
+
+    app.add_middleware(CompressionMiddleware, compression_metrics=compression_metrics, **compression_options)
+    return app
@@ -0,0 +1,63 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.core.cache import LocalCache
+from app.modules.auth.user.availability import UserAvailabilityFilter
+from app.modules.auth.user.models import User
+from app.modules.auth.user.services.user import UserService
+from app.modules.lobby.draft.engine import DraftSession
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.schemas import LobbyEvent
+from app.modules.lobby.lobby.services.lobby import LobbyService
+
+from tests.test_config.utils.constants import DRAFT_HOST_ID, DRAFT_PLAYERS, DRAFT_TEAMS
+from tests.test_config.utils.fakes import FakeDraftRedis, FakeLobbyCRUD, FakeSession, FakeUserCRUD, FakeUserIdentityCRUD
+from tests.test_config.utils.types import EventFactory
+
+
+@pytest.fixture
+def availability_filter(redis_bytes_async: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch) -> UserAvailabilityFilter:
+    monkeypatch.setattr("app.modules.auth.user.availability.UserCRUD", FakeUserIdentityCRUD)
+    monkeypatch.setattr(FakeUserIdentityCRUD, "registered", [])
+    return UserAvailabilityFilter(redis_bytes_async, FakeSession, "availability", size=4096, hashes=5)
+
+
+@pytest.fixture
+def user_service() -> UserService:
+    service = UserService.__new__(UserService)
+    service.model = User
+    service.crud = FakeUserCRUD()
+    service.suggest_cache = LocalCache()
+    return service
+
+
+@pytest.fixture
+def draft_session() -> DraftSession:
+    return DraftSession(7, DRAFT_HOST_ID, "BB PP T", DRAFT_TEAMS, DRAFT_PLAYERS)
+
+
+@pytest_asyncio.fixture
+async def draft_redis(redis_server: FakeServer) -> AsyncGenerator[FakeDraftRedis, None]:
+    redis = FakeDraftRedis(server=redis_server, decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest.fixture
+def lobby_event() -> EventFactory:
+    def create(event_type: LobbyEventType, lobby_id: int = 1, **data) -> LobbyEvent:
+        return LobbyEvent(type=event_type, lobby_id=lobby_id, data={"id": 1, **data})
+
+    return create
+
+
+@pytest.fixture
+def lobby_service() -> LobbyService:
+    service = LobbyService.__new__(LobbyService)
+    service.crud = FakeLobbyCRUD()
+    service.state_cache = LocalCache()
+    return service
@@ -0,0 +1,25 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from fakeredis import FakeAsyncRedis, FakeServer
+
+
+@pytest.fixture
+def redis_server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest_asyncio.fixture
+async def redis_async(redis_server: FakeServer) -> AsyncGenerator[FakeAsyncRedis, None]:
+    redis = FakeAsyncRedis(server=redis_server, decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture
+async def redis_bytes_async(redis_server: FakeServer) -> AsyncGenerator[FakeAsyncRedis, None]:
+    redis = FakeAsyncRedis(server=redis_server, decode_responses=False)
+    yield redis
+    await redis.aclose()
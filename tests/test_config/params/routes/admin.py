@@ -3,4 +3,5 @@ from tests.test_config.utils.constants import Roles
 
 ROUTES = [
     ("DELETE",  "/api/v1/admin/clear-tokens", Roles.ADMIN),
+    ("GET",     "/api/v1/admin/metrics",      Roles.ADMIN),
 ]
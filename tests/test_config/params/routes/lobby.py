@@ -8,16 +8,25 @@ ROUTES = [
     ("GET",     "/api/v1/lobby/list-count",             Roles.ALL_ROLES),
     ("GET",     "/api/v1/lobby/list",                   Roles.ALL_ROLES),
     ("GET",     "/api/v1/lobby/1",                      Roles.ALL_ROLES),
+    ("GET",     "/api/v1/lobby/1/state",                Roles.ALL_ROLES),
     ("PUT",     "/api/v1/lobby/1",                      Roles.ALL_ROLES),
     ("PUT",     "/api/v1/lobby/1/close",                Roles.ALL_ROLES),
     ("DELETE",  "/api/v1/lobby/1",                      Roles.ALL_ROLES),
+    ("GET",     "/api/v1/lobby/1/history",              Roles.ALL_ROLES),
     ("GET",     "/api/v1/lobby/1/participants-count",   Roles.ALL_ROLES),
     ("GET",     "/api/v1/lobby/1/participants",         Roles.ALL_ROLES),
     ("POST",    "/api/v1/lobby/1/participants",         Roles.ALL_ROLES),
+    ("PUT",     "/api/v1/lobby/1/participants",         Roles.ALL_ROLES),
     ("PUT",     "/api/v1/lobby/1/participants/1",       Roles.ALL_ROLES),
     ("DELETE",  "/api/v1/lobby/1/participants/1",       Roles.ALL_ROLES),
     ("POST",    "/api/v1/lobby/1/connect",              Roles.ALL_ROLES),
     ("DELETE",  "/api/v1/lobby/1/leave",                Roles.ALL_ROLES),
+    ("POST",    "/api/v1/lobby/1/draft",                Roles.ALL_ROLES),
+    ("GET",     "/api/v1/lobby/1/draft",                Roles.ALL_ROLES),
+    ("POST",    "/api/v1/lobby/1/draft/actions",        Roles.ALL_ROLES),
+    ("POST",    "/api/v1/matchmaking/",                 Roles.ALL_ROLES),
+    ("GET",     "/api/v1/matchmaking/",                 Roles.ALL_ROLES),
+    ("DELETE",  "/api/v1/matchmaking/",                 Roles.ALL_ROLES),
 ]
 
 LOBBY_VALID_DATA = [
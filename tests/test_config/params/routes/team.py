@@ -3,6 +3,7 @@ from tests.test_config.utils.constants import Roles, TEAMS_COUNT
 
 ROUTES = [
     ("POST",    "/api/v1/teams/",            Roles.ALL_ROLES),
+    ("POST",    "/api/v1/teams/balance",     Roles.ALL_ROLES),
     ("GET",     "/api/v1/teams/list-count",  Roles.ALL_ROLES),
     ("GET",     "/api/v1/teams/list",        Roles.ALL_ROLES),
     ("GET",     "/api/v1/teams/1",           Roles.ALL_ROLES),
@@ -6,6 +6,7 @@ from tests.test_config.utils.constants import Roles, USERS_COUNT
 ROUTES = [
     ("GET",     "/api/v1/users/list",       Roles.ALL_ROLES),
     ("GET",     "/api/v1/users/list-count", Roles.ALL_ROLES),
+    ("GET",     "/api/v1/users/suggest",    Roles.ALL_ROLES),
     ("GET",     "/api/v1/users/",           Roles.ALL_ROLES),
     ("PUT",     "/api/v1/users/",           Roles.ADMIN),
     ("DELETE",  "/api/v1/users/",           Roles.ADMIN),
@@ -9,6 +9,12 @@ LOBBIES_COUNT:      Final[int] = 5
 TEAMS_COUNT:        Final[int] = 5
 PARTICIPANTS_COUNT: Final[int] = 8
 
+COMPRESSION_PAYLOAD: Final[list[dict]] = [{"id": i, "name": f"Participant {i}"} for i in range(200)]
+
+DRAFT_HOST_ID:      Final[int] = 1
+DRAFT_TEAMS:        Final[list[int]] = [10, 20]
+DRAFT_PLAYERS:      Final[dict[int, int]] = {2: 10, 3: 20}
+
 
 class Roles:
     LIST:               Final[list[UserRole]]       = [UserRole.USER, UserRole.MODERATOR, UserRole.ADMIN]
@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any
+
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+
+from app.modules.auth.user.enums import UserRole
+from app.modules.lobby.lobby.enums import LobbyParticipantRole, LobbyStatus
+
+
+class FakeSession:
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class FakeFailingSession:
+
+    async def __aenter__(self):
+        raise ConnectionError("database is down")
+
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class FakeCounter:
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.evicted: list[str] = []
+        self.gate = asyncio.Event()
+
+
+    async def handle(self, resource_id: str, command: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if command == "fail":
+            raise HTTPException(status_code=409, detail="Conflict")
+
+        if command == "wait":
+            await self.gate.wait()
+
+        self.values[resource_id] = self.values.get(resource_id, 0) + payload["step"]
+        return {"value": self.values[resource_id]}
+
+
+    def evict(self, resource_id: str) -> None:
+        self.evicted.append(resource_id)
+        self.values.pop(resource_id, None)
+
+
+class FakeUserCRUD:
+
+    def __init__(self):
+        self.calls: list[tuple[str, int]] = []
+
+
+    async def suggest(self, prefix: str, limit: int) -> list[dict]:
+        self.calls.append((prefix, limit))
+        return [{"id": 1, "username": "Alice"}, {"id": 2, "username": "alina"}]
+
+
+class FakeUserIdentityCRUD:
+
+    users = [("alice", "alice@example.com"), ("bob", "bob@example.com")]
+    registered: list = []
+
+
+    def __init__(self, db):
+        pass
+
+
+    async def stream_identities(self, batch_size: int):
+        for username, email in self.users:
+            yield username, email
+
+        for availability in self.registered:
+            await availability.add("late", "late@example.com")
+
+
+class FakeDraftRedis(FakeAsyncRedis):
+
+    async def get(self, name: str):
+        # Yield like a network round trip so concurrent loads interleave
+        await asyncio.sleep(0)
+        return await super().get(name)
+
+
+class FakeLobbyCRUD:
+
+    def __init__(self):
+        self.calls = 0
+
+
+    @staticmethod
+    def get_user(user_id: int) -> dict:
+        return {
+            "id": user_id,
+            "username": f"user{user_id}",
+            "role": UserRole.USER.value,
+            "data": {"first_name": None, "last_name": None, "external_id": None, "created_at": "2026-10-19T12:00:00+00:00"},
+        }
+
+
+    @classmethod
+    def get_member(cls, participant_id: int, user_id: int, role: LobbyParticipantRole) -> dict:
+        return {"id": participant_id, "user": cls.get_user(user_id), "role": role.value, "is_active": True}
+
+
+    async def get_state(self, lobby_id: int) -> dict | None:
+        self.calls += 1
+        if lobby_id != 1:
+            return None
+
+        return {
+            "lobby": {
+                "id": 1,
+                "name": "Lobby",
+                "description": None,
+                "status": LobbyStatus.ACTIVE.value,
+                "host": self.get_user(10),
+                "algorithm": {"id": 3, "name": "Classic", "description": None, "algorithm": "BB PP T", "teams_count": 2, "version": 1},
+            },
+            "teams": [{"id": 5, "name": "Red", "members": [self.get_member(1, 11, LobbyParticipantRole.PLAYER)]}],
+            "spectators": [self.get_member(2, 12, LobbyParticipantRole.SPECTATOR)],
+        }
@@ -1,9 +1,16 @@
-from typing import Any
+from typing import Any, Callable
 
+from app.core.ownership import OwnershipCoordinator
 from app.modules.auth.user.enums import UserRole
+from app.modules.lobby.events.schemas import LobbyEvent
+
+from tests.test_config.utils.fakes import FakeCounter
 
 
 type AllowedRoles = tuple[UserRole, ...]
 type InputData = dict[str, Any]
 type Routes = list[tuple[str, str, tuple[UserRole, ...]]]
 type RouteBaseFixture = tuple[str, str, AllowedRoles]
+type EventFactory = Callable[..., LobbyEvent]
+type HeadersFactory = Callable[..., dict[str, str]]
+type WorkerFactory = Callable[[str], tuple[OwnershipCoordinator, FakeCounter]]
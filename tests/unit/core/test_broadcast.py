@@ -0,0 +1,164 @@
+import asyncio
+import json
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.core.broadcast import Broadcaster, Frame, SendPolicy, SubscriberGroup, Subscription
+from app.core.scheduler import Scheduler
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.services.events import LobbyEventService
+
+
+def test_subscription_drops_oldest_when_full():
+    subscription = Subscription("lobby:1", max_size=2)
+    for data in (b"first", b"second", b"third"):
+        subscription.put(Frame(data))
+
+    assert subscription.dropped == 1
+    assert subscription.get_nowait().data == b"second"
+
+
+def test_subscription_drops_newest_when_full():
+    subscription = Subscription("lobby:1", max_size=2, policy=SendPolicy.DROP_NEWEST)
+    for data in (b"first", b"second", b"third"):
+        subscription.put(Frame(data))
+
+    assert subscription.dropped == 1
+    assert [subscription.get_nowait().data for _ in range(len(subscription))] == [b"first", b"second"]
+
+
+def test_subscription_coalesces_pending_frames_by_key():
+    subscription = Subscription("lobby:1", max_size=10, policy=SendPolicy.COALESCE)
+    subscription.put(Frame(b"joined", "participant:1"))
+    subscription.put(Frame(b"team", "team:1"))
+    subscription.put(Frame(b"left", "participant:1"))
+    subscription.put(Frame(b"unkeyed"))
+
+    assert subscription.coalesced == 1
+    assert [subscription.get_nowait().data for _ in range(len(subscription))] == [b"left", b"team", b"unkeyed"]
+    assert subscription.dropped == 0
+
+
+def test_frame_roundtrip_is_shared_between_subscribers():
+    group = SubscriberGroup()
+    subscriptions = [Subscription("lobby:1") for _ in range(3)]
+    for subscription in subscriptions:
+        group.add(subscription)
+
+    group.dispatch(Frame.decode(Frame.encode(b'{"a":1}', "lobby")))
+    frames = [subscription.get_nowait() for subscription in subscriptions]
+
+    assert all(frame is frames[0] for frame in frames), "Frame was copied per subscriber"
+    assert frames[0].key == "lobby"
+    assert frames[0].text == '{"a":1}'
+
+
+def test_frame_header_carries_sequence():
+    frame = Frame.decode(Frame.encode(b"{}", "team:3", 42))
+
+    assert (frame.seq, frame.key, frame.data) == (42, "team:3", b"{}")
+    assert Frame.decode(Frame.encode(b"{}")).seq is None
+
+
+def test_subscriber_group_replays_contiguous_history():
+    group = SubscriberGroup(history_size=3)
+    for seq in range(1, 6):
+        group.dispatch(Frame(b"", seq=seq))
+
+    assert [frame.seq for frame in group.replay(2)] == [3, 4, 5]
+    assert group.replay(5) == []
+    assert group.replay(1) is None, "Gap older than the ring buffer must not be replayed"
+
+
+def test_subscriber_group_removes_in_place():
+    group = SubscriberGroup()
+    first, second, third = (Subscription("lobby:1") for _ in range(3))
+    for subscription in (first, second, third):
+        group.add(subscription)
+
+    assert group.remove(first)
+    assert not group.remove(first)
+    assert group.members == [third, second]
+    assert (third.index, second.index) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_fans_out_per_channel(redis_bytes_async: FakeAsyncRedis):
+    broadcaster = Broadcaster(redis_bytes_async, "test")
+
+    try:
+        first = await broadcaster.subscribe("lobby:1")
+        second = await broadcaster.subscribe("lobby:1")
+        other = await broadcaster.subscribe("lobby:2")
+        await asyncio.sleep(0)
+
+        await broadcaster.publish("lobby:1", b"event")
+
+        assert (await asyncio.wait_for(first.get(), 1)).data == b"event"
+        assert (await asyncio.wait_for(second.get(), 1)).data == b"event"
+        assert not len(other), "Message leaked to another channel"
+        assert set(await redis_bytes_async.pubsub_channels()) == {b"test:lobby:1", b"test:lobby:2"}
+
+        await broadcaster.unsubscribe(first)
+        await broadcaster.unsubscribe(second)
+        assert await redis_bytes_async.pubsub_channels() == [b"test:lobby:2"], "Channel without local subscribers is still subscribed"
+    finally:
+        await broadcaster.stop()
+
+
+@pytest.mark.asyncio
+async def test_lobby_event_service_publishes_envelope(redis_bytes_async: FakeAsyncRedis):
+    broadcaster = Broadcaster(redis_bytes_async, "test")
+    events = LobbyEventService(broadcaster)
+
+    try:
+        async with broadcaster.subscription(LobbyEventService.get_channel(7)) as subscription:
+            await asyncio.sleep(0)
+            await events.publish(LobbyEventType.LOBBY_DELETED, 7, {"id": 7})
+            frame = await asyncio.wait_for(subscription.get(), 1)
+
+        assert frame.text == '{"type":"lobby.deleted","lobby_id":7,"seq":1,"data":{"id":7}}'
+        assert (frame.key, frame.seq) == (None, 1)
+    finally:
+        await broadcaster.stop()
+
+
+@pytest.mark.asyncio
+async def test_lobby_event_service_replays_from_redis_history(redis_bytes_async: FakeAsyncRedis):
+    events = LobbyEventService(Broadcaster(redis_bytes_async, "test"), history_size=3)
+
+    for team_id in range(1, 6):
+        await events.publish(LobbyEventType.TEAM_UPDATED, 7, {"id": team_id}, f"team:{team_id}")
+
+    assert await events.get_sequence(7) == 5
+    assert [frame.seq for frame in await events.replay(7, 2)] == [3, 4, 5]
+    assert (await events.replay(7, 3))[0].key == "team:4"
+    assert await events.replay(7, 5) == []
+    assert await events.replay(7, 1) is None, "Gap exceeding the buffer must fall back to a snapshot"
+    assert await events.replay(7, 9) is None
+
+
+@pytest.mark.asyncio
+async def test_lobby_event_service_publishes_batch_in_order(redis_bytes_async: FakeAsyncRedis):
+    events = LobbyEventService(Broadcaster(redis_bytes_async, "test"))
+
+    await events.publish(LobbyEventType.TEAM_UPDATED, 7, {"id": 1}, "team:1")
+    await events.publish_many(7, [(LobbyEventType.PARTICIPANT_UPDATED, {"id": i}, f"participant:{i}") for i in range(1, 4)])
+
+    frames = await events.replay(7, 1)
+    assert [frame.seq for frame in frames] == [2, 3, 4]
+    assert [frame.key for frame in frames] == ["participant:1", "participant:2", "participant:3"]
+    assert json.loads(frames[-1].text)["data"] == {"id": 3}
+
+
+@pytest.mark.asyncio
+async def test_lobby_event_service_skips_idle_timers_without_scheduler(redis_async: FakeAsyncRedis, redis_bytes_async: FakeAsyncRedis):
+    scheduler = Scheduler(redis_async, "test:timers")
+    events = LobbyEventService(Broadcaster(redis_bytes_async, "test"), lobby_scheduler=scheduler, idle_timeout=60)
+
+    await events.publish(LobbyEventType.TEAM_UPDATED, 7, {"id": 1})
+    await events.publish(LobbyEventType.LOBBY_CLOSED, 8, {"id": 8})
+
+    assert len(scheduler.wheel) == 0, "Timers must not accumulate when the scheduler is not running"
+    assert scheduler._pending == {}
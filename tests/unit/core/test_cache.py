@@ -0,0 +1,84 @@
+import pytest
+
+from app.core.cache import LocalCache
+from app.core.notify import ChangeListener, get_trigger_sql
+
+
+@pytest.fixture
+def local_cache() -> LocalCache:
+    local_cache = LocalCache(max_size=3)
+    local_cache.set("lobby:1", {"id": 1}, tags=[("lobby", 1)])
+    local_cache.set("lobby:2", {"id": 2}, tags=[("lobby", 2)])
+    local_cache.set("lobby:list", [1, 2], tags=[("lobby", None)])
+    return local_cache
+
+
+@pytest.fixture
+def listener(local_cache: LocalCache) -> ChangeListener:
+    return ChangeListener(local_cache, "postgresql://localhost/test", "row_change")
+
+
+@pytest.mark.parametrize(
+    "table, obj_id, expected_keys",
+    [
+        ("lobby",   1,      {"lobby:2"}),
+        ("lobby",   2,      {"lobby:1"}),
+        ("lobby",   3,      {"lobby:1", "lobby:2"}),
+        ("lobby",   None,   set()),
+        ("team",    1,      {"lobby:1", "lobby:2", "lobby:list"}),
+    ],
+)
+def test_local_cache_invalidate(
+        local_cache: LocalCache,
+        table: str,
+        obj_id: int,
+        expected_keys: set[str]
+):
+    local_cache.invalidate(table, obj_id)
+    remaining = {key for key in ("lobby:1", "lobby:2", "lobby:list") if key in local_cache}
+    assert remaining == expected_keys, f"Expected {expected_keys}, got {remaining}"
+
+
+def test_local_cache_evicts_least_recently_used(local_cache: LocalCache):
+    assert local_cache.get("lobby:1") == {"id": 1}
+
+    local_cache.set("team:1", {"id": 1}, tags=[("team", 1)])
+    assert len(local_cache) == 3, "Cache size exceeds limit"
+    assert "lobby:2" not in local_cache, "Least recently used entry was not evicted"
+    assert "lobby:1" in local_cache, "Recently used entry was evicted"
+
+    assert local_cache.invalidate("lobby", 2) == 1, "Evicted entry tags were not cleaned up"
+
+
+def test_local_cache_disabled():
+    local_cache = LocalCache(enabled=False)
+    local_cache.set("key", "value")
+    assert local_cache.get("key") is None, "Disabled cache should not store values"
+
+
+@pytest.mark.parametrize(
+    "payload, expected_size",
+    [
+        ('{"table": "lobby", "id": 1, "op": "UPDATE"}',     1),
+        ('{"table": "lobby", "id": 5, "op": "INSERT"}',     2),
+        ('{"table": "team", "id": 1, "op": "DELETE"}',      3),
+        ('{"table": "lobby", "op": "TRUNCATE"}',            0),
+        ('not a json',                                      0),
+        ('{"id": 1}',                                       0),
+    ],
+)
+def test_change_listener_handle_payload(
+        listener: ChangeListener,
+        local_cache: LocalCache,
+        payload: str,
+        expected_size: int
+):
+    listener.handle_payload(payload)
+    assert len(local_cache) == expected_size, f"Expected {expected_size} entries, got {len(local_cache)}"
+
+
+def test_trigger_sql_quotes_table_name():
+    drop_sql, create_sql = get_trigger_sql("user", "row_change")
+    assert 'ON "user"' in drop_sql
+    assert 'ON "user"' in create_sql
+    assert "notify_row_change('row_change')" in create_sql
@@ -0,0 +1,101 @@
+import gzip
+import json
+
+import pytest
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.compression import CompressionMetrics, CompressionMiddleware, CPUBudget, parse_accept_encoding
+
+from tests.test_config.utils.constants import COMPRESSION_PAYLOAD
+
+
+async def send_get(app: FastAPI, url: str, accept_encoding: str = "gzip") -> tuple[int, dict[str, str], bytes]:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with client.stream("GET", url, headers={"Accept-Encoding": accept_encoding}) as response:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+            return response.status_code, response.headers, body
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None,                      {}),
+        ("gzip",                    {"gzip": 1.0}),
+        ("gzip;q=0.5, br",          {"gzip": 0.5, "br": 1.0}),
+        ("gzip;q=bad, *;q=0",       {"gzip": 0.0, "*": 0.0}),
+    ],
+)
+def test_parse_accept_encoding(header: str, expected: dict[str, float]):
+    assert parse_accept_encoding(header) == expected
+
+
+def test_select_encoding_prefers_accepted():
+    middleware = CompressionMiddleware(FastAPI())
+
+    assert middleware.select_encoding("gzip") == "gzip"
+    assert middleware.select_encoding("identity") is None
+    assert middleware.select_encoding("gzip;q=0") is None
+    assert middleware.select_encoding("*") is not None
+
+
+def test_cpu_budget():
+    budget = CPUBudget(limit=0.1, window=60)
+    assert budget.available()
+
+    budget.spend(0.2)
+    assert not budget.available(), "Budget was not exhausted"
+
+
+@pytest.mark.asyncio
+async def test_compression_middleware_gzip(compression_app: FastAPI, compression_metrics: CompressionMetrics):
+    status_code, headers, body = await send_get(compression_app, "/items")
+
+    assert status_code == 200, f"Expected 200, got {status_code}"
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert headers["etag"] == 'W/"items"', "Strong ETag was kept for encoded body"
+    assert "Accept-Encoding" in headers["vary"]
+    assert json.loads(gzip.decompress(body)) == COMPRESSION_PAYLOAD
+
+    snapshot = compression_metrics.snapshot()
+    assert snapshot["compressed"] == 1
+    assert snapshot["ratio"] > 1, "Compression ratio is not reported"
+    assert snapshot["cpu_time"] > 0, "CPU time is not reported"
+
+
+@pytest.mark.asyncio
+async def test_compression_middleware_uses_precompressed_cache(compression_app: FastAPI, compression_metrics: CompressionMetrics):
+    _, _, first_body = await send_get(compression_app, "/items")
+    cpu_time = compression_metrics.cpu_time
+    _, _, second_body = await send_get(compression_app, "/items")
+
+    assert first_body == second_body
+    assert compression_metrics.cache_hits == 1, "Cached payload was compressed again"
+    assert compression_metrics.cpu_time == cpu_time
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url, accept_encoding, compression_options, skipped",
+    [
+        ("/small",  "gzip",     {"minimum_size": 100},                      "skipped_size"),
+        ("/items",  "gzip",     {"minimum_size": 100, "cpu_budget": 0},     "skipped_budget"),
+        ("/items",  "identity", {"minimum_size": 100},                      None),
+    ],
+)
+async def test_compression_middleware_skips(
+        compression_app: FastAPI,
+        compression_metrics: CompressionMetrics,
+        url: str,
+        accept_encoding: str,
+        skipped: str
+):
+    status_code, headers, body = await send_get(compression_app, url, accept_encoding)
+
+    assert status_code == 200, f"Expected 200, got {status_code}"
+    assert "content-encoding" not in headers, "Response should not be compressed"
+    assert json.loads(body)
+    if skipped:
+        assert compression_metrics.snapshot()[skipped] == 1
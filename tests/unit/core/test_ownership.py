@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+
+from tests.test_config.utils.types import WorkerFactory
+
+
+@pytest.mark.asyncio
+async def test_commands_are_forwarded_to_lease_owner(ownership_worker: WorkerFactory):
+    first, first_counter = ownership_worker("first")
+    second, second_counter = ownership_worker("second")
+
+    assert await first.execute("counter", 42, "add", {"step": 1}) == {"value": 1}
+    assert await second.execute("counter", 42, "add", {"step": 2}) == {"value": 3}
+    assert first.owns("counter", 42) and not second.owns("counter", 42)
+    assert second_counter.values == {}, "Non-owner must not keep lobby state"
+
+    with pytest.raises(HTTPException) as error:
+        await second.execute("counter", 42, "fail", {})
+    assert error.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_released_lease_fails_over_to_next_worker(ownership_worker: WorkerFactory):
+    first, first_counter = ownership_worker("first")
+    second, second_counter = ownership_worker("second")
+
+    await first.execute("counter", 7, "add", {"step": 5})
+    await first.stop()
+
+    assert first_counter.evicted == ["7", "7"]
+    assert await second.execute("counter", 7, "add", {"step": 1}) == {"value": 1}
+    assert second.owns("counter", 7)
+
+
+@pytest.mark.asyncio
+async def test_forward_to_dead_owner_times_out(redis_async: FakeAsyncRedis, ownership_worker: WorkerFactory):
+    await redis_async.set("test:lease:counter:1", "dead")
+    worker, _ = ownership_worker("alive")
+
+    with pytest.raises(TimeoutError):
+        await worker.execute("counter", 1, "add", {"step": 1})
+
+
+@pytest.mark.asyncio
+async def test_slow_forwarded_command_does_not_block_others(redis_async: FakeAsyncRedis, ownership_worker: WorkerFactory):
+    first, first_counter = ownership_worker("first")
+    second, _ = ownership_worker("second")
+
+    await first.execute("counter", 1, "add", {"step": 1})
+    await first.execute("counter", 2, "add", {"step": 1})
+
+    slow = asyncio.create_task(second.execute("counter", 1, "wait", {"step": 1}))
+    assert await second.execute("counter", 2, "add", {"step": 1}) == {"value": 2}
+    assert not slow.done()
+
+    first_counter.gate.set()
+    assert await slow == {"value": 2}
+
+    for stream in (first.get_command_stream("first"), first.get_reply_stream("second")):
+        assert 0 < await redis_async.ttl(stream) <= 60, f"Stream '{stream}' never expires"
+        assert await redis_async.xlen(stream) == 1, f"Consumed entries of '{stream}' were not trimmed"
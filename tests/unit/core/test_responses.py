@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from fastapi import APIRouter, FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+from app.core.responses import FastJSONResponse, JSONSerializer, TrustedRoute
+
+
+class ItemRead(BaseModel):
+    id: int
+    name: str
+
+
+class Item:
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+router = APIRouter(route_class=TrustedRoute)
+
+@router.get("/items/{item_id}", response_model=ItemRead, status_code=201)
+async def get_item_(item_id: int, response: Response):
+    response.headers["ETag"] = '"item"'
+    return Item(item_id, f"Item {item_id}")
+
+
+@router.get("/items", response_model=list[ItemRead])
+async def get_items_():
+    return [Item(1, "First"), {"id": 2, "name": "Second"}]
+
+
+@router.get("/raw")
+async def get_raw_():
+    return {"name": "Ünïcode"}
+
+
+app = FastAPI(default_response_class=FastJSONResponse)
+app.include_router(router, prefix="/api")
+
+
+@pytest.fixture
+async def client() -> AsyncClient:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"id": 1, "name": "Lobby"},
+        [1, 2.5, None, True, "Ünïcode"],
+        {},
+    ],
+)
+def test_json_serializer_dumps(content):
+    assert json.loads(JSONSerializer.dumps(content)) == content
+
+
+def test_json_serializer_dump_model_from_attributes():
+    payload = JSONSerializer.dump_model(list[ItemRead], [Item(1, "First")])
+    assert json.loads(payload) == [{"id": 1, "name": "First"}]
+    assert JSONSerializer.get_adapter(list[ItemRead]) is JSONSerializer.get_adapter(list[ItemRead]), "Adapter is not cached"
+
+
+@pytest.mark.asyncio
+async def test_trusted_route_keeps_status_and_headers(client: AsyncClient):
+    response = await client.get("/api/items/3")
+
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+    assert response.headers["etag"] == '"item"', "Headers from injected response were lost"
+    assert response.json() == {"id": 3, "name": "Item 3"}
+
+
+@pytest.mark.asyncio
+async def test_trusted_route_list(client: AsyncClient):
+    response = await client.get("/api/items")
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert response.json() == [{"id": 1, "name": "First"}, {"id": 2, "name": "Second"}]
+
+
+@pytest.mark.asyncio
+async def test_fast_json_response(client: AsyncClient):
+    response = await client.get("/api/raw")
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert response.json() == {"name": "Ünïcode"}
@@ -0,0 +1,76 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.core.scheduler import Scheduler, Timer, TimerWheel
+
+
+async def get_timers(redis: FakeAsyncRedis) -> dict[str, float]:
+    return dict(await redis.zrange("timers", 0, -1, withscores=True))
+
+
+def test_timer_wheel_fires_in_deadline_order_across_rounds():
+    wheel = TimerWheel(tick=1.0, size=4, now=0)
+    for key, deadline in (("a", 2.5), ("b", 6.0), ("c", 10.2)):
+        wheel.add(Timer("test", key, deadline))
+
+    assert wheel.advance(2.9) == []
+    assert [timer.key for timer in wheel.advance(3.0)] == ["a"]
+    assert [timer.key for timer in wheel.advance(7.5)] == ["b"], "Timer from a later round fired early"
+    assert [timer.key for timer in wheel.advance(100)] == ["c"]
+    assert len(wheel) == 0
+
+
+def test_timer_wheel_reschedules_and_cancels_in_place():
+    wheel = TimerWheel(tick=1.0, size=4, now=0)
+    wheel.add(Timer("test", "a", 1.0))
+    wheel.add(Timer("test", "a", 3.0))
+    wheel.add(Timer("test", "b", 2.0))
+
+    assert wheel.remove("test:b").key == "b"
+    assert wheel.remove("test:b") is None
+    assert wheel.advance(2.0) == []
+    assert [timer.deadline for timer in wheel.advance(3.0)] == [3.0]
+
+
+def test_timer_wheel_fires_past_deadlines_on_next_tick():
+    wheel = TimerWheel(tick=1.0, size=4, now=10)
+    wheel.add(Timer("test", "late", 5.0))
+
+    assert [timer.key for timer in wheel.advance(11.0)] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_persists_and_fires_batches(redis_async: FakeAsyncRedis, scheduler: Scheduler, fired: list[list[str]]):
+    for lobby_id in range(3):
+        scheduler.schedule("lobby.idle", lobby_id, 5)
+    scheduler.cancel("lobby.idle", 1)
+    await scheduler.flush()
+
+    timers = await get_timers(redis_async)
+    assert set(timers) == {"lobby.idle:0", "lobby.idle:2"}
+
+    deadline = timers["lobby.idle:2"]
+    assert await scheduler.fire(scheduler.wheel.advance(deadline + 1), deadline + 1) == 2
+    assert fired == [["0", "2"]]
+    assert await get_timers(redis_async) == {}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_timers_rescheduled_elsewhere(redis_async: FakeAsyncRedis, scheduler: Scheduler, fired: list[list[str]]):
+    timer = scheduler.schedule("lobby.idle", 7, 1)
+    await scheduler.flush()
+    await redis_async.zadd("timers", {timer.member: timer.deadline + 60})
+
+    assert await scheduler.fire([timer], timer.deadline) == 0
+    assert fired == []
+    assert timer.member in await get_timers(redis_async)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_recovers_overdue_timers_after_restart(redis_async: FakeAsyncRedis, scheduler: Scheduler, fired: list[list[str]]):
+    await redis_async.zadd("timers", {"lobby.idle:1": 10.0, "lobby.idle:2": 20.0, "lobby.idle:3": 1e12, "unknown:4": 10.0})
+
+    assert await scheduler.recover(100.0) == 2
+    assert await scheduler.recover(100.0) == 1
+    assert fired == [["1"], ["2"]]
+    assert set(await get_timers(redis_async)) == {"lobby.idle:3"}
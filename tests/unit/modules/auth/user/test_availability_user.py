@@ -0,0 +1,43 @@
+import pytest
+
+from app.core.bloom import BloomFilter
+from app.modules.auth.user.availability import UserAvailabilityFilter
+
+from tests.test_config.utils.fakes import FakeUserIdentityCRUD
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(8192, 5)
+    values = [f"user{index}" for index in range(500)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    assert sum(f"other{index}" in bloom for index in range(1000)) < 50
+    assert BloomFilter(8192, 5, bytes(bloom.data)).get_positions("user1") == bloom.get_positions("user1")
+
+
+@pytest.mark.asyncio
+async def test_filter_falls_back_until_built(monkeypatch, availability_filter: UserAvailabilityFilter):
+    assert not await availability_filter.is_available("carol", "carol@example.com"), "Missing filter must defer to the database"
+
+    monkeypatch.setattr(FakeUserIdentityCRUD, "registered", [availability_filter])
+    assert await availability_filter.rebuild()
+    assert not await availability_filter.rebuild(), "Rebuild ran twice within one interval"
+
+    assert await availability_filter.is_available("carol", "carol@example.com")
+    assert not await availability_filter.is_available("alice", "carol@example.com")
+    assert not await availability_filter.is_available("carol", "bob@example.com")
+    assert not await availability_filter.is_available("late", None), "User registered during the rebuild was lost"
+    assert availability_filter.snapshot() == {"checks": 5, "available": 1, "rebuilds": 1}
+
+
+@pytest.mark.asyncio
+async def test_filter_tracks_users_added_after_build(availability_filter: UserAvailabilityFilter):
+    await availability_filter.rebuild()
+
+    await availability_filter.add("dave", None)
+
+    assert not await availability_filter.is_available("dave", "dave@example.com")
+    assert await availability_filter.is_available(None, "dave@example.com")
+
@@ -0,0 +1,18 @@
+import pytest
+
+from app.modules.auth.user.services.user import UserService
+
+
+@pytest.mark.asyncio
+async def test_suggest_caches_prefix_until_users_change(user_service: UserService):
+    first = await user_service.suggest("AL", 10)
+    second = await user_service.suggest("al", 10)
+
+    assert [user.username for user in first] == ["Alice", "alina"]
+    assert second is first
+    assert user_service.crud.calls == [("AL", 10)]
+
+    user_service.suggest_cache.invalidate("user", 42)
+    await user_service.suggest("al", 10)
+
+    assert len(user_service.crud.calls) == 2, "User change did not drop cached suggestions"
@@ -0,0 +1,42 @@
+import pytest
+
+from app.modules.lobby.algorithm.compiler import AlgorithmCompiler
+from app.modules.lobby.algorithm.enums import AlgorithmAction
+
+
+def test_compile_algorithm_steps_and_counts():
+    compiled = AlgorithmCompiler.compile("BBB PBP T", 3)
+
+    assert compiled.total_steps == 7
+    assert compiled.steps[:4] == ((0, AlgorithmAction.BAN), (1, AlgorithmAction.BAN), (2, AlgorithmAction.BAN), (0, AlgorithmAction.PICK))
+    assert compiled.steps[-1] == (None, AlgorithmAction.TIEBREAK)
+    assert [(count.bans, count.picks) for count in compiled.team_counts] == [(1, 1), (2, 0), (1, 1)]
+    assert compiled.has_tiebreak
+
+
+def test_compiled_steps_are_interned():
+    first = AlgorithmCompiler.compile("BP PB", 2)
+    second = AlgorithmCompiler.compile("PB BP", 2)
+
+    assert first.steps[0] is second.steps[2]
+    assert not first.has_tiebreak
+
+
+@pytest.mark.parametrize("algorithm, teams_count, message", [
+    ("MM FS P",     2,  "Step 'MM' containings incorrect symbols"),
+    ("BBB PPP T",   2,  "Size of the step 'BBB' must be equal to teams count"),
+    ("BB T PP",     2,  "Step 'T' (tiebreak) can be only at the last step of algorithm."),
+    ("BB PT",       2,  "Step 'T' must be separated from algorithm"),
+])
+def test_compile_invalid_algorithm(algorithm: str, teams_count: int, message: str):
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        AlgorithmCompiler.compile(algorithm, teams_count)
+
+
+def test_compiled_algorithm_cached_by_id_and_version():
+    AlgorithmCompiler.cache.flush()
+    compiled = AlgorithmCompiler.get(1, 1, "BB PP T", 2)
+
+    assert AlgorithmCompiler.get(1, 1, "BB PP T", 2) is compiled
+    assert AlgorithmCompiler.get(1, 2, "BP PB T", 2) is not compiled
+    assert AlgorithmCompiler.get(None, None, "BB PP T", 2) is not compiled
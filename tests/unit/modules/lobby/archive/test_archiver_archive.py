@@ -0,0 +1,10 @@
+from app.modules.lobby.archive.models import LobbyParticipantArchive
+from app.modules.lobby.participant.models import LobbyParticipant
+
+
+def test_participant_archive_mirrors_live_columns():
+    live = {column.name for column in LobbyParticipant.__table__.columns}
+    archive = {column.name for column in LobbyParticipantArchive.__table__.columns}
+
+    assert live == archive
+    assert not LobbyParticipantArchive.__table__.info["notify"]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.modules.lobby.algorithm.enums import AlgorithmAction
+from app.modules.lobby.draft.engine import DraftEngine, DraftSession
+from app.modules.lobby.draft.exceptions import (
+    HTTPDraftAlreadyStarted,
+    HTTPDraftChoiceTaken,
+    HTTPDraftFinished,
+    HTTPDraftNotYourTurn,
+)
+
+from tests.test_config.utils.constants import DRAFT_HOST_ID, DRAFT_PLAYERS, DRAFT_TEAMS
+from tests.test_config.utils.fakes import FakeDraftRedis
+
+
+def test_draft_session_enforces_turn_order(draft_session: DraftSession):
+    assert draft_session.current == (0, AlgorithmAction.BAN)
+    with pytest.raises(HTTPDraftNotYourTurn):
+        draft_session.act(3, "map-a")
+
+    result = draft_session.act(2, "map-a")
+    assert (result.step, result.team_id, result.action) == (0, 10, AlgorithmAction.BAN)
+
+    with pytest.raises(HTTPDraftChoiceTaken):
+        draft_session.act(3, "MAP-A")
+
+    draft_session.act(3, "map-b")
+    draft_session.act(2, "map-c")
+    draft_session.act(3, "map-d")
+
+    with pytest.raises(HTTPDraftNotYourTurn):
+        draft_session.act(2, "map-e")
+
+    draft_session.act(DRAFT_HOST_ID, "map-e")
+    assert draft_session.is_finished
+    assert draft_session.read().current is None
+
+    with pytest.raises(HTTPDraftFinished):
+        draft_session.act(DRAFT_HOST_ID, "map-f")
+
+
+def test_draft_session_turn_is_constant_time():
+    steps = " ".join(["BP"] * 5000)
+    session = DraftSession(7, DRAFT_HOST_ID, steps, DRAFT_TEAMS, DRAFT_PLAYERS)
+
+    start = time.perf_counter()
+    for index in range(10000):
+        session.act(2 if index % 2 == 0 else 3, f"choice-{index}")
+    elapsed = time.perf_counter() - start
+
+    assert session.is_finished
+    assert elapsed / 10000 < 0.001
+
+
+@pytest.mark.asyncio
+async def test_draft_engine_persists_and_restores_sessions(draft_redis: FakeDraftRedis, draft_session: DraftSession):
+    engine = DraftEngine(draft_redis, "draft", flush_interval=0)
+
+    engine.put(draft_session)
+    engine.act(draft_session, 2, "map-a")
+    await engine.stop()
+
+    stored = json.loads(await draft_redis.get("draft:7"))
+    assert stored["results"][0]["choice"] == "map-a"
+
+    restored = await DraftEngine(draft_redis, "draft").get(7)
+    assert restored.step == 1
+    assert restored.can_act(3)
+
+    engine.discard(7)
+    await engine.stop()
+    assert not await draft_redis.exists("draft:7")
+
+
+@pytest.mark.asyncio
+async def test_draft_engine_concurrent_loads_share_one_session(draft_redis: FakeDraftRedis, draft_session: DraftSession):
+    await draft_redis.set("draft:7", json.dumps(draft_session.dump()))
+    engine = DraftEngine(draft_redis, "draft")
+
+    async def load_and_act(user_id: int, choice: str) -> DraftSession:
+        session = await engine.get(7)
+        if session.can_act(user_id):
+            engine.act(session, user_id, choice)
+        return session
+
+    first, second = await asyncio.gather(load_and_act(2, "map-a"), engine.get(7))
+
+    assert first is second is engine.sessions[7]
+    assert first.step == 1, "A concurrent cold load must not replace a session that already took an action"
+
+
+@pytest.mark.asyncio
+async def test_draft_engine_handles_owner_commands(draft_redis: FakeDraftRedis):
+    engine = DraftEngine(draft_redis, "draft", flush_interval=0)
+    payload = {"host_id": DRAFT_HOST_ID, "algorithm": "BB T", "teams": DRAFT_TEAMS, "players": {"2": 10, "3": 20}}
+
+    state = await engine.handle("7", "start", payload)
+    assert state["draft"]["current"] == {"step": 0, "team_id": 10, "action": "B"}
+
+    with pytest.raises(HTTPDraftAlreadyStarted):
+        await engine.handle("7", "start", payload)
+
+    state = await engine.handle("7", "act", {"user_id": 2, "choice": "map-a"})
+    assert state["result"]["choice"] == "map-a"
+    await engine.stop()
+
+    engine.evict("7")
+    assert 7 not in engine.sessions
+    state = await engine.handle("7", "get", {})
+    assert state["draft"]["current"]["team_id"] == 20, "Evicted session must be rebuilt from the Redis snapshot"
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.lobby.events.enums import LobbyEventType
+from app.modules.lobby.events.models import get_partition_bounds, get_partition_name
+from app.modules.lobby.events.services.history import LobbyState
+from app.modules.lobby.events.writer import LobbyEventWriter
+
+from tests.test_config.utils.fakes import FakeFailingSession
+from tests.test_config.utils.types import EventFactory
+
+
+def test_partition_bounds_roll_over_the_year():
+    start, end = get_partition_bounds(datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc))
+
+    assert (start, end) == (datetime(2026, 12, 1, tzinfo=timezone.utc), datetime(2027, 1, 1, tzinfo=timezone.utc))
+    assert get_partition_name(start) == "lobbyeventlog_2026_12"
+
+
+def test_writer_buffer_is_bounded(lobby_event: EventFactory):
+    writer = LobbyEventWriter(FakeFailingSession, batch_size=2, max_size=3)
+    for _ in range(5):
+        writer.append(lobby_event(LobbyEventType.TEAM_UPDATED))
+
+    assert len(writer) == 3
+    assert writer.dropped == 2
+    assert writer._full.is_set()
+
+
+def test_writer_snapshots_on_first_event_and_every_interval():
+    writer = LobbyEventWriter(FakeFailingSession, snapshot_interval=3)
+    batch = [{"lobby_id": lobby_id, "type": LobbyEventType.TEAM_UPDATED} for lobby_id in (1, 1, 2, 1, 1, 1)]
+
+    assert writer.take_snapshots(batch) == [1, 2]
+    assert writer.take_snapshots([{"lobby_id": 2, "type": LobbyEventType.LOBBY_DELETED}]) == []
+    assert 2 not in writer._counts
+
+
+@pytest.mark.asyncio
+async def test_writer_keeps_events_when_flush_fails(lobby_event: EventFactory):
+    writer = LobbyEventWriter(FakeFailingSession, batch_size=2)
+    for index in range(3):
+        writer.append(lobby_event(LobbyEventType.TEAM_UPDATED, name=str(index)))
+
+    assert not await writer.flush()
+    assert [row["data"]["name"] for row in writer._buffer] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_writer_counts_events_evicted_by_failed_flush(lobby_event: EventFactory):
+    writer = LobbyEventWriter(FakeFailingSession, batch_size=2, max_size=3)
+
+    class BusySession(FakeFailingSession):
+
+        async def __aenter__(self):
+            for index in range(3, 5):
+                writer.append(lobby_event(LobbyEventType.TEAM_UPDATED, name=str(index)))
+            await super().__aenter__()
+
+    writer.session_factory = BusySession
+    for index in range(3):
+        writer.append(lobby_event(LobbyEventType.TEAM_UPDATED, name=str(index)))
+
+    assert not await writer.flush()
+    assert [row["data"]["name"] for row in writer._buffer] == ["2", "3", "4"]
+    assert writer.dropped == 2, "Events evicted on restore were not counted"
+
+
+def test_lobby_state_replays_events_over_snapshot():
+    state = LobbyState({"lobby": {"id": 1, "name": "old"}, "participants": [{"id": 1, "is_active": True}], "teams": [{"id": 1}]})
+
+    state.apply(LobbyEventType.PARTICIPANT_LEFT, {"id": 1, "is_active": False})
+    state.apply(LobbyEventType.PARTICIPANT_JOINED, {"id": 2, "is_active": True})
+    state.apply(LobbyEventType.TEAM_DELETED, {"id": 1})
+    state.apply(LobbyEventType.LOBBY_UPDATED, {"id": 1, "name": "new"})
+    state.apply(LobbyEventType.DRAFT_ACTION, {"step": 0})
+
+    assert state.lobby == {"id": 1, "name": "new"}
+    assert state.participants == {1: {"id": 1, "is_active": False}, 2: {"id": 2, "is_active": True}}
+    assert state.teams == {}
+
+    state.apply(LobbyEventType.LOBBY_DELETED, {"id": 1})
+    assert state.read() is None
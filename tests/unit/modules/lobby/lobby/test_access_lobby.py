@@ -0,0 +1,54 @@
+import pytest
+
+from app.modules.auth.user.enums import UserRole
+from app.modules.auth.user.models import User
+from app.modules.lobby.lobby.access import LobbyAccessControl
+from app.modules.lobby.lobby.enums import LobbyStatus
+from app.modules.lobby.lobby.exceptions import HTTPLobbyAccessDenied, HTTPLobbyNotFound, HTTPLobbyTeamAccessDenied
+from app.modules.lobby.lobby.schemas import LobbyAccess
+
+
+class FakeLobbyService:
+
+    def __init__(self, lobby: LobbyAccess | None):
+        self.lobby = lobby
+        self.calls = 0
+
+
+    async def get_access(self, lobby_id: int) -> LobbyAccess | None:
+        self.calls += 1
+        return self.lobby
+
+
+LOBBY = LobbyAccess(id=1, host_id=10, status=LobbyStatus.ACTIVE, name="Lobby")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "user_id, role",
+    [
+        (10, UserRole.USER),
+        (20, UserRole.MODERATOR),
+        (20, UserRole.ADMIN),
+    ],
+)
+async def test_authorize_host_success(user_id: int, role: UserRole):
+    lobby_service = FakeLobbyService(LOBBY)
+    lobby = await LobbyAccessControl.authorize_host(lobby_service, User(id=user_id, role=role), LOBBY.id)
+
+    assert lobby == LOBBY
+    assert lobby_service.calls == 1, "Lobby access must be loaded with a single query"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "lobby, exception, expected",
+    [
+        (None,  HTTPLobbyAccessDenied,      HTTPLobbyNotFound),
+        (LOBBY, HTTPLobbyAccessDenied,      HTTPLobbyAccessDenied),
+        (LOBBY, HTTPLobbyTeamAccessDenied,  HTTPLobbyTeamAccessDenied),
+    ],
+)
+async def test_authorize_host_denied(lobby: LobbyAccess | None, exception: type, expected: type):
+    with pytest.raises(expected):
+        await LobbyAccessControl.authorize_host(FakeLobbyService(lobby), User(id=20, role=UserRole.USER), 1, exception)
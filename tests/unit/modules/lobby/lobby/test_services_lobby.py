@@ -0,0 +1,35 @@
+import pytest
+
+from app.modules.lobby.lobby.enums import LobbyParticipantRole
+from app.modules.lobby.lobby.services.lobby import LobbyService
+
+
+@pytest.mark.asyncio
+async def test_lobby_state_is_built_from_one_aggregate_row(lobby_service: LobbyService):
+    state = await lobby_service.get_state(1)
+
+    assert state.lobby.algorithm.compiled.total_steps == 5
+    assert [member.user.id for member in state.teams[0].members] == [11]
+    assert [member.role for member in state.spectators] == [LobbyParticipantRole.SPECTATOR]
+    assert await lobby_service.get_state(2) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "table, obj_id",
+    [
+        ("lobby_state", 1),
+        ("lobby", 1),
+        ("user", 12),
+        ("lobbyparticipant", 99),
+        ("team", 42),
+    ],
+)
+async def test_lobby_state_cache_is_invalidated_by_lobby_writes(lobby_service: LobbyService, table, obj_id):
+    first = await lobby_service.get_state(1)
+    assert await lobby_service.get_state(1) is first
+    assert lobby_service.crud.calls == 1
+
+    lobby_service.state_cache.invalidate(table, obj_id)
+    assert await lobby_service.get_state(1) is not first
+    assert lobby_service.crud.calls == 2
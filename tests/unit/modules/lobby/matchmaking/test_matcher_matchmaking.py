@@ -0,0 +1,112 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.modules.lobby.matchmaking.matcher import Matchmaker, MatchmakingMetrics
+from app.modules.lobby.matchmaking.queue import MatchmakingQueue
+
+from tests.test_config.utils.fakes import FakeSession
+
+
+class LocalMatchmaker(Matchmaker):
+
+    open_lobbies: list[tuple[int, int]] = []
+
+
+    async def get_algorithms(self, db, algorithm_ids: list[int]) -> dict[int, tuple[str, int]]:
+        return {1: ("Classic", 2)}
+
+
+    async def get_open_lobbies(self, db, algorithm_id: int, size: int) -> list[tuple[int, int]]:
+        return self.open_lobbies
+
+
+    async def commit(self, db, algorithm_id: int, name: str, fills: dict, groups: list) -> tuple[dict[int, int], list[int], list[int]]:
+        matches = {user_id: lobby_id for lobby_id, players in fills.items() for user_id, _ in players}
+        for index, group in enumerate(groups):
+            matches.update((user_id, 100 + index) for user_id, _ in group)
+
+        return matches, [100 + index for index in range(len(groups))], []
+
+
+class FailingAnnounceMatchmaker(LocalMatchmaker):
+
+    async def announce(self, algorithm_id: int, lobby_ids: list[int], joined: list[int]) -> None:
+        raise ConnectionError("Redis is down")
+
+
+def test_plan_fills_open_lobbies_before_creating_full_groups():
+    players = [(user_id, float(user_id)) for user_id in range(1, 10)]
+
+    fills, groups, leftover = Matchmaker.plan(players, [(7, 2), (8, 1)], 3)
+
+    assert fills == {7: [(1, 1.0), (2, 2.0)], 8: [(3, 3.0)]}
+    assert groups == [[(4, 4.0), (5, 5.0), (6, 6.0)], [(7, 7.0), (8, 8.0), (9, 9.0)]]
+    assert leftover == []
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_duplicates_and_skips_players_who_left(redis_async: FakeAsyncRedis):
+    queue = MatchmakingQueue(redis_async, "test")
+
+    assert await queue.enqueue(1, 5, score=1)
+    assert await queue.enqueue(2, 5, score=2)
+    assert not await queue.enqueue(1, 6), "Player was queued twice"
+    assert await queue.get_status(2) == (5, 1, None)
+
+    assert await queue.leave(1) == 5
+    assert await queue.leave(1) is None
+    assert await queue.pop(5, 10) == [(2, 2.0)]
+    assert await queue.leave(2) is None, "Popped player can leave while being matched"
+
+
+@pytest.mark.asyncio
+async def test_queue_requeue_skips_players_who_queued_again(redis_async: FakeAsyncRedis):
+    queue = MatchmakingQueue(redis_async, "test")
+    await queue.enqueue_many(5, [(1, 1.0), (2, 2.0)])
+
+    players = await queue.pop(5, 10)
+    assert await queue.get_status(1) == (None, None, None)
+    assert await queue.enqueue(2, 6, score=3)
+
+    assert await queue.requeue(5, players) == 1
+    assert await queue.get_status(1) == (5, 0, None)
+    assert await queue.get_status(2) == (6, 0, None), "Requeue overwrote a newer queue entry"
+
+
+@pytest.mark.asyncio
+async def test_matchmaker_creates_full_lobbies_and_requeues_the_rest(redis_async: FakeAsyncRedis):
+    queue = MatchmakingQueue(redis_async, "test")
+    await queue.enqueue_many(1, [(user_id, float(user_id)) for user_id in range(1, 24)])
+
+    matchmaker = LocalMatchmaker(queue, FakeSession, team_size=5, batch_size=100, stats=MatchmakingMetrics())
+
+    assert await matchmaker.match_all() == 20
+    assert await matchmaker.match_all() == 0
+    assert await queue.get_status(1) == (None, None, 100)
+    assert await queue.get_status(21) == (1, 0, None), "Leftover player lost queue priority"
+    assert (matchmaker.stats.lobbies_created, matchmaker.stats.requeued) == (2, 6)
+
+
+@pytest.mark.asyncio
+async def test_matchmaker_tops_up_open_lobbies(redis_async: FakeAsyncRedis):
+    queue = MatchmakingQueue(redis_async, "test")
+    await queue.enqueue_many(1, [(user_id, float(user_id)) for user_id in range(1, 4)])
+
+    matchmaker = LocalMatchmaker(queue, FakeSession, team_size=5, stats=MatchmakingMetrics())
+    matchmaker.open_lobbies = [(42, 3)]
+
+    assert await matchmaker.match_all() == 3
+    assert matchmaker.stats.lobbies_filled == 1
+    assert await queue.get_status(3) == (None, None, 42)
+
+
+@pytest.mark.asyncio
+async def test_matchmaker_keeps_matched_players_out_of_queue_when_announce_fails(redis_async: FakeAsyncRedis):
+    queue = MatchmakingQueue(redis_async, "test")
+    await queue.enqueue_many(1, [(user_id, float(user_id)) for user_id in range(1, 11)])
+
+    matchmaker = FailingAnnounceMatchmaker(queue, FakeSession, team_size=5, stats=MatchmakingMetrics())
+
+    assert await matchmaker.match_all() == 10
+    assert await queue.get_status(1) == (None, None, 100), "Matched player was requeued after the commit"
+    assert matchmaker.stats.requeued == 0
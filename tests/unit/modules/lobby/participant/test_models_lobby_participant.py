@@ -2,7 +2,7 @@ import pytest
 
 from pydantic import ValidationError
 
-from app.modules.lobby.lobby.schemas import LobbyParticipantCreate, LobbyParticipantUpdate
+from app.modules.lobby.lobby.schemas import LobbyParticipantBulkUpdate, LobbyParticipantCreate, LobbyParticipantUpdate
 from app.modules.lobby.lobby.enums import LobbyParticipantRole
 
 from tests.test_config.utils.types import InputData
@@ -58,3 +58,28 @@ def test_lobby_participant_update_schema(
             LobbyParticipantUpdate(**update_data)
 
         assert error_info in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "participants, is_valid, error_info",
+    [
+        ([{"participant_id": 1, "team_id": 2}, {"participant_id": 2, "is_active": False}],  True,   None),
+        ([],                                                                                False,  "participants"),
+        ([{"participant_id": 1, "team_id": 2}, {"participant_id": 1, "team_id": None}],     False,  "only once"),
+        ([{"team_id": 2}],                                                                  False,  "participant_id"),
+    ],
+)
+def test_lobby_participant_bulk_update_schema(
+        participants: list[InputData],
+        is_valid: bool,
+        error_info: str
+):
+
+    if is_valid:
+        bulk_update = LobbyParticipantBulkUpdate(participants=participants)
+        assert [change.participant_id for change in bulk_update.participants] == [1, 2]
+    else:
+        with pytest.raises(ValidationError) as exc_info:
+            LobbyParticipantBulkUpdate(participants=participants)
+
+        assert error_info in str(exc_info.value)
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from app.modules.lobby.team.balancer import TeamBalancer
+from app.modules.lobby.team.enums import TeamBalanceStrategy
+
+
+PLAYERS = [(1, 1500.0), (2, 1200.0), (3, 1800.0), (4, 1000.0), (5, 1400.0), (6, 1600.0), (7, 900.0)]
+
+
+def test_round_robin_deals_players_in_id_order():
+    assert TeamBalancer.split(TeamBalanceStrategy.ROUND_ROBIN, PLAYERS, 3) == [[1, 4, 7], [2, 5], [3, 6]]
+
+
+def test_random_split_is_reproducible_with_seed():
+    first = TeamBalancer.split(TeamBalanceStrategy.RANDOM, PLAYERS, 2, seed=42)
+
+    assert first == TeamBalancer.split(TeamBalanceStrategy.RANDOM, PLAYERS, 2, seed=42)
+    assert sorted(player_id for team in first for player_id in team) == [1, 2, 3, 4, 5, 6, 7]
+    assert sorted(len(team) for team in first) == [3, 4]
+
+
+@pytest.mark.parametrize("teams_count", [2, 3, 4])
+def test_balanced_split_keeps_sizes_and_ratings_close(teams_count):
+    ratings = dict(PLAYERS)
+    teams = TeamBalancer.split(TeamBalanceStrategy.BALANCED, PLAYERS, teams_count)
+    sizes = [len(team) for team in teams]
+    totals = [sum(ratings[player_id] for player_id in team) for team in teams]
+
+    assert max(sizes) - min(sizes) <= 1
+    assert sorted(player_id for team in teams for player_id in team) == [1, 2, 3, 4, 5, 6, 7]
+    assert max(totals) - min(totals) <= max(ratings.values())
+
+
+def test_balanced_split_handles_large_lobbies():
+    players = [(player_id, float(player_id * 7919 % 3000)) for player_id in range(1, 100_001)]
+
+    start = time.perf_counter()
+    teams = TeamBalancer.split(TeamBalanceStrategy.BALANCED, players, 16)
+    elapsed = time.perf_counter() - start
+
+    assert sum(len(team) for team in teams) == len(players)
+    assert elapsed < 2, f"Balancing 100k players took {elapsed:.2f}s"
@@ -0,0 +1,40 @@
+import pytest
+
+from app.shared.components.etag import ETag
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None,                      set()),
+        ("",                        set()),
+        ('"abc"',                   {'"abc"'}),
+        ('"abc", "def"',            {'"abc"', '"def"'}),
+        ('W/"abc"',                 {'"abc"'}),
+        ("*",                       {"*"}),
+    ],
+)
+def test_etag_parse(header: str, expected: set[str]):
+    assert ETag.parse(header) == expected
+
+
+@pytest.mark.parametrize(
+    "rows_first, rows_second, is_equal",
+    [
+        ([(1, 1)],              [(1, 1)],               True),
+        ([(1, 1)],              [(1, 2)],               False),
+        ([(1, 1, 2, 1)],        [(1, 1, 2, 2)],         False),
+        ([(1, 1), (2, 1)],      [(2, 1), (1, 1)],       False),
+        ([],                    [],                     True),
+    ],
+)
+def test_etag_build(rows_first: list[tuple], rows_second: list[tuple], is_equal: bool):
+    first = ETag.build("lobby", rows_first)
+    second = ETag.build("lobby", rows_second)
+
+    assert first.startswith('"') and first.endswith('"'), "ETag must be a quoted string"
+    assert (first == second) == is_equal
+
+
+def test_etag_namespace():
+    assert ETag.build("lobby", [(1, 1)]) != ETag.build("team", [(1, 1)])
@@ -0,0 +1,60 @@
+import pytest
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.shared.components.exceptions import HTTPInvalidFields
+from app.shared.components.fields import FieldSet
+from app.shared.db.base import Lobby
+from app.modules.auth.user.enums import UserRole
+from app.modules.lobby.lobby.schemas import LobbyRead
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ("id,name",                 "id,name"),
+        (" id , name ,",            "id,name"),
+        ("id,host.username",        "id,host(username)"),
+        ("host.id,host.username",   "host(id,username)"),
+    ],
+)
+def test_fieldset_parse(fields: str, expected: str):
+    assert str(FieldSet.parse(LobbyRead, fields)) == expected
+
+
+@pytest.mark.parametrize("fields", ["", "unknown", "id.name", "host.unknown"])
+def test_fieldset_parse_invalid(fields: str):
+    with pytest.raises(ValueError):
+        FieldSet.parse(LobbyRead, fields)
+
+
+def test_fieldset_query_invalid():
+    with pytest.raises(HTTPInvalidFields):
+        FieldSet.query(LobbyRead)("id,unknown")
+
+    assert FieldSet.query(LobbyRead)(None) is None
+
+
+def test_fieldset_nested_defaults_to_all_fields():
+    fieldset = FieldSet.parse(LobbyRead, "host")
+    assert set(fieldset.fields["host"].fields) == {"id", "username", "role", "data"}
+
+
+def test_fieldset_load_options_selects_requested_columns():
+    fieldset = FieldSet.parse(LobbyRead, "name,host.username")
+    query = select(Lobby).options(*fieldset.load_options(Lobby))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "lobby.name" in sql
+    assert "lobby.host_id" in sql, "Foreign key for requested relation is not loaded"
+    assert "lobby.description" not in sql
+    assert "lobby.status" not in sql
+
+
+def test_fieldset_dump(fieldset_lobby: Lobby):
+    assert FieldSet.parse(LobbyRead, "id,name").dump(fieldset_lobby) == {"id": 3, "name": "Lobby"}
+    assert FieldSet.parse(LobbyRead, "status,host.username").dump([fieldset_lobby]) == [
+        {"status": "active", "host": {"username": "host"}}
+    ]
+    assert FieldSet.parse(LobbyRead, "host.role").dump(fieldset_lobby) == {"host": {"role": str(UserRole.USER)}}
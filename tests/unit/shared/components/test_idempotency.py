@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from httpx import AsyncClient
+
+from tests.test_config.utils.types import HeadersFactory
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_stored_response(
+        idempotency_client: AsyncClient,
+        idempotency_headers: HeadersFactory,
+        idempotency_created: list[str]
+):
+    headers = idempotency_headers(1)
+
+    first = await idempotency_client.post("/items", json={"name": "lobby"}, headers=headers)
+    second = await idempotency_client.post("/items", json={"name": "lobby"}, headers=headers)
+    other_user = await idempotency_client.post("/items", json={"name": "lobby"}, headers=idempotency_headers(2))
+    without_key = await idempotency_client.post("/items", json={"name": "lobby"}, headers={"Authorization": headers["Authorization"]})
+
+    assert first.status_code == second.status_code == 201
+    assert second.content == first.content == b'{"name":"lobby-1"}'
+    assert second.headers["content-type"] == first.headers["content-type"]
+    assert second.headers["idempotent-replayed"] == "true"
+    assert other_user.json() == {"name": "lobby-2"}
+    assert without_key.json() == {"name": "lobby-3"}
+    assert idempotency_created == ["lobby", "lobby", "lobby"]
+
+
+@pytest.mark.asyncio
+async def test_retry_with_new_token_for_same_user_replays(
+        idempotency_client: AsyncClient,
+        idempotency_headers: HeadersFactory,
+        idempotency_created: list[str]
+):
+    first_headers, second_headers = idempotency_headers(1), idempotency_headers(1)
+    assert first_headers["Authorization"] != second_headers["Authorization"]
+
+    first = await idempotency_client.post("/items", json={"name": "lobby"}, headers=first_headers)
+    retry = await idempotency_client.post("/items", json={"name": "lobby"}, headers=second_headers)
+
+    assert retry.content == first.content == b'{"name":"lobby-1"}'
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert idempotency_created == ["lobby"]
+
+
+@pytest.mark.asyncio
+async def test_request_without_valid_token_is_not_stored(
+        redis_bytes_async: FakeAsyncRedis,
+        idempotency_client: AsyncClient,
+        idempotency_created: list[str]
+):
+    await idempotency_client.post("/items", json={"name": "lobby"}, headers={"Idempotency-Key": "abc"})
+    await idempotency_client.post("/items", json={"name": "lobby"}, headers={"Idempotency-Key": "abc", "Authorization": "Bearer token"})
+
+    assert idempotency_created == ["lobby", "lobby"]
+    assert await redis_bytes_async.keys() == [], "Anonymous response was stored"
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_other_request_is_rejected(
+        idempotency_client: AsyncClient,
+        idempotency_headers: HeadersFactory,
+        idempotency_created: list[str]
+):
+    await idempotency_client.post("/items", json={"name": "first"}, headers=idempotency_headers(1))
+    reused = await idempotency_client.post("/items", json={"name": "second"}, headers=idempotency_headers(1))
+    invalid = await idempotency_client.post("/items", json={"name": "second"}, headers=idempotency_headers(1, "x" * 256))
+
+    assert reused.status_code == 422
+    assert invalid.status_code == 400
+    assert idempotency_created == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_is_blocked_while_first_runs(
+        redis_bytes_async: FakeAsyncRedis,
+        idempotency_client: AsyncClient,
+        idempotency_headers: HeadersFactory,
+        idempotency_created: list[str],
+        idempotency_gate: asyncio.Event
+):
+    idempotency_gate.clear()
+    headers = idempotency_headers(1)
+
+    first = asyncio.create_task(idempotency_client.post("/items", json={"name": "team"}, headers=headers))
+    while not await redis_bytes_async.keys("*:lock"):
+        await asyncio.sleep(0)
+
+    duplicate = await idempotency_client.post("/items", json={"name": "team"}, headers=headers)
+    idempotency_gate.set()
+    response = await first
+    retry = await idempotency_client.post("/items", json={"name": "team"}, headers=headers)
+
+    assert duplicate.status_code == 409
+    assert response.status_code == 201
+    assert retry.content == response.content
+    assert idempotency_created == ["team"]
+    assert await redis_bytes_async.keys("*:lock") == [], "Lock was not released"
@@ -0,0 +1,58 @@
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.base.crud import BaseCRUD
+from app.shared.components.filters import FilterField
+from app.shared.db.base import Lobby
+from app.shared.db.indexes import find_unindexed_columns
+
+
+metadata = MetaData()
+
+parent = Table("parent", metadata, Column("id", Integer, primary_key=True))
+child = Table(
+    "child",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("parent_id", Integer, ForeignKey("parent.id")),
+    Column("indexed_parent_id", Integer, ForeignKey("parent.id"), index=True),
+    Column("code", Integer),
+    Column("name", String),
+    Column("flag", Boolean),
+)
+
+
+class ChildModel:
+    __table__ = child
+
+
+class ChildCRUD(BaseCRUD):
+
+    default_filters = {
+        "id": FilterField(int),
+        "code": FilterField(int),
+        "name": FilterField(str),
+        "flag": FilterField(bool),
+        "computed": FilterField(bool, ignore=True),
+    }
+
+
+    def __init__(self, db):
+        super().__init__(db, ChildModel)
+
+
+def test_models_have_no_unindexed_columns():
+    unindexed = find_unindexed_columns()
+    assert not unindexed, f"Unindexed filter or foreign key columns: {', '.join(map(str, unindexed))}"
+
+
+def test_find_unindexed_columns_reports_foreign_keys_and_exact_filters():
+    unindexed = find_unindexed_columns(metadata, [ChildCRUD])
+    assert [(item.table, item.column) for item in unindexed] == [("child", "code"), ("child", "parent_id")]
+
+
+def test_lobby_active_status_index_is_partial():
+    index = next(index for index in Lobby.__table__.indexes if index.name == "ix_lobby_status_active")
+    sql = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "WHERE status = 'ACTIVE'" in sql